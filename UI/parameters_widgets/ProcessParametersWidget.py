@@ -48,13 +48,14 @@ class ProcessParamsWidget(QWidget):
             pass
 
     def refresh(self):
-        procs = getattr(self.os_model, "proc_table", {})
+        # снимок таблицы: модель может добавлять и удалять процессы во время обновления
+        procs = list(getattr(self.os_model, "proc_table", {}).items())
         current = {}
 
         if not procs:
             current["Процессы"] = "Нет активных процессов"
         else:
-            for pid, proc in procs.items():
+            for pid, proc in procs:
                 p = f"PID {pid}"
                 current[f"{p} | Состояние"] = proc.current_state.name
                 for k, v in asdict(proc.process_memory_config).items():
@@ -63,7 +64,8 @@ class ProcessParamsWidget(QWidget):
                     current[f"{p} | Статистика команд | {k}"] = v
                 for k, v in asdict(proc.process_commands_config).items():
                     current[f"{p} | Команды | {k}"] = v
-                for k, v in asdict(proc.stats).items():
+                # время читается без начисления: изменять статистику может только поток модели
+                for k, v in asdict(self.os_model.stats.settled_process_stats(proc)).items():
                     current[f"{p} | Статистика времени | {k}"] = f"{v:.3f}".rstrip("0").rstrip(".")
                 current[f"{p} | Текущая команда"] = (
                     proc.current_command.__class__.__name__ if proc.current_command else "-"
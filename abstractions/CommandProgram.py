@@ -0,0 +1,71 @@
+import random
+from array import array
+from typing import Optional
+
+from abstractions.Command import ALUCommand, ExitCommand, OpType
+
+
+# вид команды в программе
+KIND_ALU = 0
+KIND_IO = 1
+
+OP_TYPES = tuple(OpType)  # тип операции по номеру (OpType(i) без поиска по перечислению)
+
+
+class CommandProgram:
+    """
+    Заранее сгенерированная программа процесса: параллельные массивы вида команды, типа операции,
+    операндов и длительностей ввода-вывода (i-й элемент - i-я команда). После последней команды
+    выполняется команда завершения.
+    """
+    def __init__(self, kinds: array, op_types: array, operands_1: array, operands_2: array,
+                 io_durations: array, operands_address: int = -1) -> None:
+        """
+        :param kinds: виды команд (KIND_ALU, KIND_IO)
+        :param op_types: номера типов арифметических операций (OpType)
+        :param operands_1: первые операнды
+        :param operands_2: вторые операнды
+        :param io_durations: длительности команд ввода-вывода
+        :param operands_address: адрес операндов в памяти процесса (для отображения команды)
+        """
+        self.kinds = kinds
+        self.op_types = op_types
+        self.operands_1 = operands_1
+        self.operands_2 = operands_2
+        self.io_durations = io_durations
+        # объекты команд переиспользуются, чтобы не создавать их на каждом такте
+        self.alu_command: Optional[ALUCommand] = None
+        self.exit_command = ExitCommand()
+        self.bind(operands_address)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def bind(self, operands_address: int) -> None:
+        """
+        Привязать программу к адресу операндов процесса (после выделения памяти)
+        :param operands_address: адрес операндов в памяти процесса
+        """
+        self.alu_command = ALUCommand(operands_address, operands_address + 1, OpType.ADD)
+
+    @staticmethod
+    def generate(commands_config, seed: int, operands_address: int = -1) -> "CommandProgram":
+        """
+        Сгенерировать программу процесса одним пакетом собственным генератором random.Random:
+        программа однозначно определяется зерном и параметрами команд
+        :param commands_config: параметры команд процесса (abstractions.Process.ProcessCommandsConfig)
+        :param seed: зерно генератора программы
+        :param operands_address: адрес операндов в памяти процесса
+        """
+        n = commands_config.total_commands_cnt
+        min_operand, max_operand = commands_config.min_operand, commands_config.max_operand
+        min_duration, max_duration = commands_config.io_command_duration_min, commands_config.io_command_duration_max
+
+        rng = random.Random(seed)
+        io_ratio = commands_config.io_command_ratio
+        kinds = array("b", [KIND_IO if rng.random() < io_ratio else KIND_ALU for _ in range(n)])
+        op_types = array("b", [rng.randrange(len(OP_TYPES)) for _ in range(n)])
+        operands_1 = array("q", [rng.randint(min_operand, max_operand) for _ in range(n)])
+        operands_2 = array("q", [rng.randint(min_operand, max_operand) for _ in range(n)])
+        io_durations = array("q", [rng.randint(min_duration, max_duration) for _ in range(n)])
+        return CommandProgram(kinds, op_types, operands_1, operands_2, io_durations, operands_address)
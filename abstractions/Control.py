@@ -84,6 +84,11 @@ class InstructionExecutor:
         if cmd == "finish":
             return FinishKill()
 
+        if cmd == "profile":
+            if len(parts) < 2 or parts[1].lower() not in ("on", "off", "show", "reset"):
+                raise ValueError(err_message)
+            return Profile(parts[1].lower())
+
         if cmd == "seed":
             if len(parts) < 2:
                 raise ValueError(err_message)
@@ -195,19 +200,19 @@ class StopTask(Instruction):
     def execute(self, os_model:OSModel, osui) -> str:
         from abstractions.Process import Process, ProcessState
         from abstractions.Interrupt import InterruptType, Interrupt
+        from managers.Dispatcher import DeviceKind
         if self.pid not in os_model.proc_table:
             return f"Процесса с PID {self.pid} не существует"
+        location = os_model.dispatcher.find_process_device(self.pid)
         if os_model.proc_table[self.pid].current_state == ProcessState.RUNNING:  # процесс выполняется на ЦПр
-            for cpu in os_model.cpus:
-                if cpu.current_process and cpu.current_process.pid == self.pid:
-                    interrupt = Interrupt(InterruptType.PROCESS_STOPPED_CPU, self.pid, cpu.device_id)
-                    os_model.interrupt_handler.raise_interrupt(interrupt)
+            if location is not None and location[0] == DeviceKind.CPU:
+                interrupt = Interrupt(InterruptType.PROCESS_STOPPED_CPU, self.pid, location[1])
+                os_model.interrupt_handler.raise_interrupt(interrupt)
             return f"Процесс с PID {self.pid} остановлен"
         if os_model.proc_table[self.pid].current_state == ProcessState.IO_RUNNING:  # процесс выполняет команду ввода-вывода
-            for io in os_model.io_controllers:
-                if io.current_process and io.current_process.pid == self.pid:
-                    interrupt = Interrupt(InterruptType.PROCESS_STOPPED_IO, self.pid, io.device_id)
-                    os_model.interrupt_handler.raise_interrupt(interrupt)
+            if location is not None and location[0] == DeviceKind.IO:
+                interrupt = Interrupt(InterruptType.PROCESS_STOPPED_IO, self.pid, location[1])
+                os_model.interrupt_handler.raise_interrupt(interrupt)
             return f"Процесс с PID {self.pid} остановлен"
         return f"Процесс с PID {self.pid} не выполняется"
 
@@ -243,12 +248,31 @@ class SetRandomSeed(Instruction):
         self.seed = seed
 
     def execute(self, os_model: OSModel, osui) -> str:
-        import random
-        random.seed(self.seed)
+        os_model.random_factory.seed(self.seed)
         os_model.config.random.random_seed = self.seed
         return f"Генератор случайных чисел инициализирован значением {self.seed}"
 
 
+class Profile(Instruction):
+    """
+    Управляет профилированием фаз такта моделирования
+    """
+    def __init__(self, action: str):
+        self.action = action  # on, off, show, reset
+
+    def execute(self, os_model: OSModel, osui) -> str:
+        if self.action == "on":
+            os_model.profiler.enabled = True
+            return "Профилирование фаз такта включено"
+        if self.action == "off":
+            os_model.profiler.enabled = False
+            return "Профилирование фаз такта выключено"
+        if self.action == "reset":
+            os_model.profiler.reset()
+            return "Замеры профилирования сброшены"
+        return os_model.profiler.format_report()
+
+
 class Help(Instruction):
     """
     Показывает справку
@@ -282,6 +306,12 @@ class Help(Instruction):
             "seed <value>\n"
             "    Инициализировать генератор случайных чисел указанным значением (int).\n"
             "    Влияет только на будущие задания.\n\n"
+            "profile on|off\n"
+            "    Включить/выключить замер времени фаз такта моделирования.\n\n"
+            "profile show\n"
+            "    Показать время фаз такта (вызовы, суммарное и среднее время, доля).\n\n"
+            "profile reset\n"
+            "    Сбросить накопленные замеры.\n\n"
             "help\n"
             "    Показать эту справку."
         )
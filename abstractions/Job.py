@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from abstractions.CommandProgram import CommandProgram
+from abstractions.Process import ProcessCommandsConfig
+
+
+@dataclass
+class Job:
+    """
+    Задание внешнего источника: параметры процесса, который будет создан при допуске
+    """
+    arrival_tick: int  # такт поступления (раньше него задание не допускается)
+    memory_size: int  # размер памяти процесса
+    priority: int = 0  # приоритет процесса
+    program: Optional[CommandProgram] = None  # программа команд процесса
+    commands_config: Optional[ProcessCommandsConfig] = None  # параметры команд (если программа не задана,
+    # команды генерируются моделью по этим параметрам)
@@ -51,24 +51,46 @@ class ProcessCommandsConfig:
     max_operand: int = 10  # максимальное количество операнда для команд ALU
 
 
-class Process:
-    free_pid = 0
+class PidAllocator:
+    """
+    Выдача PID новым процессам (у каждой модели свой счётчик)
+    """
+    def __init__(self, free_pid: int = 0) -> None:
+        """
+        :param free_pid: первый свободный PID
+        """
+        self.free_pid = free_pid
 
-    def __init__(self, ph_memory_ptr: Memory, process_memory_info: ProcessMemoryConfig = None,
+    def allocate(self) -> int:
+        """
+        Выдать свободный PID
+        """
+        pid = self.free_pid
+        self.free_pid += 1
+        return pid
+
+
+class Process:
+    def __init__(self, ph_memory_ptr: Memory, pid_allocator: PidAllocator, random_factory: RandomFactory,
+                 process_memory_info: ProcessMemoryConfig = None,
                  process_statistics: ProcessStatistics = None,
                  process_commands_config: ProcessCommandsConfig = None
                  ) -> None:
         """
         Инициализация процесса
         :param ph_memory_ptr: указатель на физическую память ОС
+        :param pid_allocator: счётчик PID модели
+        :param random_factory: генератор случайных значений модели (для генерации команд)
         :param process_memory_info: класс-хранилище информации о процессе, связанной с его расположением в памяти
         :param process_statistics: класс-хранилище статистик процесса
         :param process_commands_config: класс-хранилище информации о процессе, связанной с количеством и параметрами команд
         """
         self.memory_ptr = ph_memory_ptr
-        self.pid = Process.free_pid  # свободное значение PID Для новых процессов
-        Process.free_pid += 1
+        self.random_factory = random_factory
+        self.pid = pid_allocator.allocate()  # свободное значение PID Для новых процессов
         self.current_state = ProcessState.NEW # изначальное состояние процесса
+        self.state_changed_tick = 0  # такт, по который включительно процессу начислено время текущего состояния
+        self.priority = 0  # приоритет процесса (меньше значение - выше приоритет)
 
         self.process_memory_config = (
             process_memory_info if process_memory_info is not None else ProcessMemoryConfig()
@@ -82,6 +104,8 @@ class Process:
 
         self.stats = ProcessTimeStats()  # статистика
         self.current_command = None  # текущая команда процесса
+        self.program = None  # заранее сгенерированная программа (abstractions.CommandProgram; None - команды
+        # генерируются по одной)
         return
 
     def generate_command(self) -> Command:
@@ -102,22 +126,23 @@ class Process:
             return self.current_command
 
         # с заданной вероятностью генерируем IO-команду, иначе - арифметическую
-        percent = RandomFactory.generate_random_float_value(0.0, 1.0)
+        percent = self.random_factory.generate_random_float_value(0.0, 1.0)
         if percent < io_commands_percentage:
-            io_command_length = RandomFactory.generate_random_int_value(self.process_commands_config.io_command_duration_min,
-                                                                        self.process_commands_config.io_command_duration_max)
+            io_command_length = self.random_factory.generate_random_int_value(
+                self.process_commands_config.io_command_duration_min,
+                self.process_commands_config.io_command_duration_max)
             self.current_command = IOCommand(io_command_length)
         else:
             min_operand, max_operand = self.process_commands_config.min_operand, self.process_commands_config.max_operand
             op_1_address = operands_address
             op_2_address = operands_address + 1
 
-            op_1 = RandomFactory.generate_random_int_value(min_operand, max_operand)
-            op_2 = RandomFactory.generate_random_int_value(min_operand, max_operand)
+            op_1 = self.random_factory.generate_random_int_value(min_operand, max_operand)
+            op_2 = self.random_factory.generate_random_int_value(min_operand, max_operand)
             self.memory_ptr.write(op_1, op_1_address)
             self.memory_ptr.write(op_2, op_2_address)
 
-            op_type = RandomFactory.generate_random_int_value(0, len(OpType) - 1)
+            op_type = self.random_factory.generate_random_int_value(0, len(OpType) - 1)
 
             self.current_command = ALUCommand(op_1_address, op_2_address, OpType(op_type))
         return self.current_command
@@ -1,7 +1,10 @@
-from dataclasses import dataclass, field
-from typing import Dict
+import math
+from dataclasses import dataclass, field, replace
+from collections import deque
+from typing import Deque, Dict, Iterator, Optional, Tuple
 from enum import Enum
-from model.Config import TimeCosts
+from model.Config import TimeCosts, StatisticsConfig
+from utils.Histogram import Histogram
 
 # сбор статистики для отображения и вычислений
 @dataclass
@@ -46,6 +49,44 @@ class ProcessTimeStats:
     d_exe: float = 0  # процент увеличения времени выполнения по сравнению с однопрограммной системой
     d_ready: float = 0  # процент простоя (нахождения в очереди) по сравнению с общим временем выполнения
 
+    def add_time(self, add_to: "ProcessTimeRecordType", value: float) -> None:
+        """
+        Увеличить время процесса заданной категории
+        :param add_to: категория временной затраты
+        :param value: значение (в тактах)
+        """
+        match add_to:
+            case ProcessTimeRecordType.T_ACTIVE:
+                self.t_active += value
+            case ProcessTimeRecordType.T_PASSIVE:
+                self.t_passive += value
+            case ProcessTimeRecordType.T_SYS_MONO:
+                self.t_sys_mono += value
+            case ProcessTimeRecordType.T_SYS_MULTI:
+                self.t_sys_multi += value
+
+
+# накопленные суммы по завершённым процессам (для пересчёта средних за O(1))
+@dataclass
+class FinishedProcessesTotals:
+    count: int = 0  # число завершённых процессов
+    t_multi: float = 0  # сумма t_multi завершённых процессов
+    t_mono: float = 0  # сумма t_mono завершённых процессов
+    d_exe: float = 0  # сумма d_exe завершённых процессов
+    d_ready: float = 0  # сумма d_ready завершённых процессов
+
+    def add(self, process: ProcessTimeStats, sign: int = 1) -> None:
+        """
+        Учесть (sign = 1) или исключить (sign = -1) статистику завершённого процесса
+        :param process: статистика процесса
+        :param sign: знак изменения
+        """
+        self.count += sign
+        self.t_multi += sign * process.t_multi
+        self.t_mono += sign * process.t_mono
+        self.d_exe += sign * process.d_exe
+        self.d_ready += sign * process.d_ready
+
 
 class ProcessTimeRecordType(Enum):
     T_ACTIVE = 0
@@ -56,14 +97,26 @@ class ProcessTimeRecordType(Enum):
 
 # класс для подсчёта времени исполнения процессов в одно- и мультипрограммной системе и формирования статистик
 class Statistics:
-    def __init__(self, config_ptr: TimeCosts, proc_table_ptr):
+    def __init__(self, config_ptr: TimeCosts, proc_table_ptr, stats_config: Optional[StatisticsConfig] = None):
+        from utils.StatsArchive import StatsArchive
+
         self.time_costs = config_ptr
         self.proc_table = proc_table_ptr
+        self.stats_config = stats_config if stats_config is not None else StatisticsConfig()
 
         self.process_stats: Dict[int, ProcessTimeStats] = {}  # контейнер для хранения времени исполнения
         # процессов (доступ по PID)
         self.os_stats = OSStats()  # контейнер для выходной статистики системы
         self.avg_process_stats = AvgProcessTimeStats()  # класс для хранения средних параметров процессов
+        self.current_tick = 0  # число выполненных тактов моделирования
+        self.finished_totals = FinishedProcessesTotals()  # суммы по завершённым процессам
+        self.queueing_delays = Histogram()  # время ожидания заданий в пуле до допуска (в тактах)
+
+        self.finished_pids: Deque[int] = deque()  # PID завершённых процессов в порядке завершения
+        # архив статистики вытесненных из памяти процессов
+        self.archive: Optional[StatsArchive] = (
+            StatsArchive(self.stats_config.archive_path) if self.stats_config.archive_path else None
+        )
 
     def add_time_process(self, pid: int, add_to: ProcessTimeRecordType, value: float) -> None:
         """
@@ -76,15 +129,7 @@ class Statistics:
             self.process_stats[pid] = ProcessTimeStats()
             self.proc_table[pid].stats = self.process_stats[pid]
         else:
-            match add_to:
-                case ProcessTimeRecordType.T_ACTIVE:
-                    self.process_stats[pid].t_active += value
-                case ProcessTimeRecordType.T_PASSIVE:
-                    self.process_stats[pid].t_passive += value
-                case ProcessTimeRecordType.T_SYS_MONO:
-                    self.process_stats[pid].t_sys_mono += value
-                case ProcessTimeRecordType.T_SYS_MULTI:
-                    self.process_stats[pid].t_sys_multi += value
+            self.process_stats[pid].add_time(add_to, value)
 
     def add_time_os_multi(self, value: float) -> None:
         """
@@ -93,6 +138,37 @@ class Statistics:
         """
         self.os_stats.t_multi += value
 
+    def add_idle_ticks_os_multi(self, ticks: int) -> None:
+        """
+        Увеличить время выполнения системы на ticks тактов так, как если бы к нему ticks раз прибавили 1
+        (результат совпадает с потактовым сложением вплоть до округления)
+        :param ticks: число тактов
+        """
+        t_multi = self.os_stats.t_multi
+        while ticks > 0:
+            _, exponent = math.frexp(t_multi)
+            if t_multi < 1 or exponent > 53:
+                t_multi += 1
+                ticks -= 1
+                continue
+            # внутри одного двоичного порядка прибавление целого точно, округление возможно
+            # только при переходе через степень двойки
+            steps = min(ticks, int(math.ceil(math.ldexp(1.0, exponent) - t_multi)) - 1)
+            if steps > 0:
+                t_multi += steps
+                ticks -= steps
+            if ticks > 0:
+                t_multi += 1
+                ticks -= 1
+        self.os_stats.t_multi = t_multi
+
+    def add_tick(self) -> None:
+        """
+        Отметить выполнение очередного такта моделирования.
+        Активное/пассивное время процессов за такт начисляется лениво (см. settle_process_time)
+        """
+        self.current_tick += 1
+
     def add_sys_time_os_multi(self, value: float) -> None:
         """
         Увеличить системные затраты в мультпрограммном режиме на value
@@ -100,6 +176,13 @@ class Statistics:
         """
         self.os_stats.t_sys_multi += value
 
+    def add_queueing_delay(self, ticks: int) -> None:
+        """
+        Учесть время ожидания задания в пуле до допуска в систему
+        :param ticks: время ожидания в тактах моделирования
+        """
+        self.queueing_delays.add(ticks)
+
     def add_time_os_mono(self, value: float) -> None:
         """
         Увеличить время выполнения системы в однопрограммном режиме на value
@@ -107,18 +190,55 @@ class Statistics:
         """
         self.os_stats.t_mono += value
 
-    def add_runtime_to_processes(self, proc_table_ptr) -> None:
+    @staticmethod
+    def accrued_time_record(process) -> Optional[ProcessTimeRecordType]:
         """
-        Добавить активное/пассивное время выполнения ко всем процессам системы на каждом такте
-        :param proc_table_ptr: указатель на таблицу процессов
+        Категория времени, которое процесс накапливает в текущем состоянии
+        :param process: процесс
+        :return: T_ACTIVE (выполнение команд или ввода-вывода), T_PASSIVE (нахождение в очередях)
+        или None (время не начисляется)
         """
         from abstractions.Process import ProcessState
 
-        for pid, process in proc_table_ptr.items():
-            if process.current_state == ProcessState.RUNNING or process.current_state == ProcessState.IO_RUNNING:
-                self.add_time_process(pid, ProcessTimeRecordType.T_ACTIVE, 1)
-            elif process.current_state in [ProcessState.READY, ProcessState.IO_BLOCKED]:
-                self.add_time_process(pid, ProcessTimeRecordType.T_PASSIVE, 1)
+        if process.current_state == ProcessState.RUNNING or process.current_state == ProcessState.IO_RUNNING:
+            return ProcessTimeRecordType.T_ACTIVE
+        if process.current_state == ProcessState.READY or process.current_state == ProcessState.IO_BLOCKED:
+            return ProcessTimeRecordType.T_PASSIVE
+        return None
+
+    def settle_process_time(self, process) -> None:
+        """
+        Начислить процессу активное/пассивное время за такты, прошедшие с последней смены его состояния.
+        Вызывается при смене состояния процесса и перед чтением его статистики
+        :param process: процесс
+        """
+        elapsed = self.current_tick - process.state_changed_tick
+        record = self.accrued_time_record(process)
+        if elapsed > 0 and record is not None:
+            self.add_time_process(process.pid, record, elapsed)
+        process.state_changed_tick = self.current_tick
+
+    def settled_process_stats(self, process) -> ProcessTimeStats:
+        """
+        Статистика процесса с учётом ещё не начисленного времени текущего состояния. Только чтение:
+        состояние процесса и статистика не изменяются, поэтому метод можно вызывать из потока интерфейса
+        во время выполнения такта
+        :param process: процесс
+        :return: копия статистики процесса
+        """
+        stats = replace(process.stats)
+        elapsed = self.current_tick - process.state_changed_tick
+        record = self.accrued_time_record(process)
+        if elapsed > 0 and record is not None:
+            stats.add_time(record, elapsed)
+        return stats
+
+    def settle_all_processes(self) -> None:
+        """
+        Начислить накопленное время всем процессам таблицы (перед чтением их статистики)
+        """
+        for process in self.proc_table.values():
+            self.settle_process_time(process)
 
     def add_process_start_time(self, pid: int):
         """
@@ -128,15 +248,24 @@ class Statistics:
         if pid not in self.process_stats:
             self.process_stats[pid] = self.proc_table[pid].stats
         self.process_stats[pid].t_start = self.os_stats.t_multi
+        # время в первом состоянии начисляется начиная со следующего такта
+        self.proc_table[pid].state_changed_tick = self.current_tick
 
     def add_process_end_time(self, pid: int):
         """
         Зафиксировать время время окончания жизни процесса и рассчитать его параметры
         :param pid: PID процесса
         """
+        if pid in self.proc_table:
+            self.settle_process_time(self.proc_table[pid])
         if pid not in self.process_stats:
             self.process_stats[pid] = ProcessTimeStats()
         process = self.process_stats[pid]
+        if process.t_end != 0:
+            # процесс уже был завершён (например, уничтожен в том же такте) - пересчитываем его вклад
+            self.finished_totals.add(process, -1)
+        else:
+            self.finished_pids.append(pid)
         process.t_end = self.os_stats.t_multi
         process.t_multi = process.t_end - process.t_start
         process.t_sys_multi = process.t_multi - process.t_active - process.t_passive
@@ -145,28 +274,59 @@ class Statistics:
             process.d_exe = process.t_multi / process.t_mono * 100
         if process.t_multi:
             process.d_ready = process.t_passive / process.t_multi * 100
+        if process.t_end != 0:
+            self.finished_totals.add(process)
+
+    def trim_finished_processes(self) -> None:
+        """
+        Вытеснить из памяти статистику самых старых завершённых процессов сверх лимита хранения
+        (вытесненные записи выгружаются в архив, если он задан)
+        """
+        limit = self.stats_config.retention_limit
+        if limit < 0:
+            return
+        while len(self.finished_pids) > limit:
+            pid = self.finished_pids[0]
+            if pid in self.proc_table:
+                break  # ресурсы процесса ещё не освобождены
+            self.finished_pids.popleft()
+            record = self.process_stats.pop(pid, None)
+            if record is not None and self.archive is not None:
+                self.archive.append(pid, record)
+
+    def close_archive(self) -> None:
+        """
+        Сбросить архив статистики на диск и закрыть его
+        """
+        if self.archive is not None:
+            self.archive.close()
+
+    def iter_process_stats(self) -> Iterator[Tuple[int, ProcessTimeStats]]:
+        """
+        Перебрать статистику всех процессов: сначала вытесненную в архив, затем хранящуюся в памяти
+        :return: итератор пар (PID, статистика процесса)
+        """
+        from utils.StatsArchive import StatsArchive
+
+        if self.archive is not None:
+            self.archive.flush()
+            for path, end in self.archive.segments():
+                yield from StatsArchive.iter_records(path, end)
+        yield from self.process_stats.items()
 
     def recalc_system_params(self):
         """
         Пересчитать параметры системы на основе времени процессов
         """
-        summa, cnt = 0, 0
-        for pid, stats in self.process_stats.items():
-            if stats.t_end != 0:
-                summa += stats.t_multi
-                cnt += 1
-        if cnt:
-            self.os_stats.t_proc_avg_multi = summa / cnt  # среднее время выполнения задания в мультипрограммной системе
-
-        self.os_stats.t_mono = 0
-        summa, cnt = 0, 0
-        for pid, stats in self.process_stats.items():
-            if stats.t_end != 0:
-                summa += stats.t_mono
-                self.os_stats.t_mono += stats.t_mono  # время выполнения m_multi заданий в однопрограммной системе
-                cnt += 1
-        if cnt:
-            self.os_stats.t_proc_avg_mono = summa / cnt  # среднее время выполнения задания в однопрограммной системе
+        totals = self.finished_totals
+        if totals.count:
+            # среднее время выполнения задания в мультипрограммной системе
+            self.os_stats.t_proc_avg_multi = totals.t_multi / totals.count
+
+        self.os_stats.t_mono = totals.t_mono  # время выполнения m_multi заданий в однопрограммной системе
+        if totals.count:
+            # среднее время выполнения задания в однопрограммной системе
+            self.os_stats.t_proc_avg_mono = totals.t_mono / totals.count
 
         # число заданий, которые могли бы выполниться в однопрограммной системе за t_multi
         if self.os_stats.t_proc_avg_mono:
@@ -184,25 +344,9 @@ class Statistics:
         """
         Пересчитать средние параметры процессов
         """
-        t_mono = [s.t_mono for s in self.process_stats.values() if s.t_end != 0]
-        if t_mono:
-            self.avg_process_stats.t_mono_avg = sum(t_mono) / len(t_mono)
-
-        t_multi = [s.t_multi for s in self.process_stats.values() if s.t_end != 0]
-        if t_multi:
-            self.avg_process_stats.t_multi_avg = sum(t_multi) / len(t_multi)
-
-        d_exe = [s.d_exe for s in self.process_stats.values() if s.t_end != 0]
-        if d_exe:
-            self.avg_process_stats.d_exe_avg = sum(d_exe) / len(d_exe)
-
-        d_ready = [s.d_ready for s in self.process_stats.values() if s.t_end != 0]
-        if d_ready:
-            self.avg_process_stats.d_ready_avg = sum(d_ready) / len(d_ready)
-
-
-
-
-
-
-
+        totals = self.finished_totals
+        if totals.count:
+            self.avg_process_stats.t_mono_avg = totals.t_mono / totals.count
+            self.avg_process_stats.t_multi_avg = totals.t_multi / totals.count
+            self.avg_process_stats.d_exe_avg = totals.d_exe / totals.count
+            self.avg_process_stats.d_ready_avg = totals.d_ready / totals.count
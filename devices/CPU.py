@@ -1,5 +1,6 @@
 from abstractions.Process import Process, ProcessState
 from abstractions.Command import *
+from abstractions.CommandProgram import CommandProgram, KIND_IO, OP_TYPES
 from devices.Memory import *
 from devices.ALU import ALU
 from managers.InterruptHandler import Interrupt, InterruptHandler, InterruptType
@@ -23,6 +24,7 @@ class CPU:
         self.memory_ptr = memory_ptr  # указатель на память
 
         self.interrupt_handler: Optional[InterruptHandler] = None  # указатель на обработчик прерываний
+        self.dispatcher = None  # указатель на регулировщика (ведёт учёт простаивающих устройств)
         self.quantum_size = quantum_size  # размер кванта времени в тактах моделирования
 
         return
@@ -47,6 +49,8 @@ class CPU:
 
         else:
             self.current_state = CPUState.RUNNING
+        if self.dispatcher is not None:
+            self.dispatcher.set_cpu_idle(self.device_id, proc is None)
 
     def read_operand(self, addr: int) -> int:
         """
@@ -72,29 +76,64 @@ class CPU:
                 or self.current_process.current_state == ProcessState.STOPPED_CPU:
             return
         self.total_commands_executed += 1
-        command = self.current_process.generate_command()
-        match command:
-            case ALUCommand(addr1=addr1, addr2=addr2, opType=opType):
-                op_1 = self.read_operand(addr1)
-                op_2 = self.read_operand(addr2)
-                result = ALU.execute_operation(operation_type=opType, operand_1=op_1, operand_2=op_2)
-                self.write_result(result, self.current_process.process_memory_config.result_block_address)
-                self.current_process.process_statistics.total_commands_counter += 1
-            case ExitCommand():
-                interrupt = Interrupt(InterruptType.PROCESS_TERMINATED,
-                                      self.current_process.pid, self.device_id)
-                self.interrupt_handler.raise_interrupt(interrupt)
+        if self.current_process.program is not None:
+            if not self.execute_program_command(self.current_process.program):
                 return
-            case IOCommand():
-                self.current_process.process_statistics.io_commands_counter += 1
-                self.current_process.process_statistics.total_commands_counter += 1
-                interrupt = Interrupt(InterruptType.PROCESS_IO_INIT,
-                                      self.current_process.pid, self.device_id)
-                self.interrupt_handler.raise_interrupt(interrupt)
-                return
-            case _:
-                raise RuntimeError("Неизвестный тип команды")
+        else:
+            command = self.current_process.generate_command()
+            match command:
+                case ALUCommand(addr1=addr1, addr2=addr2, opType=opType):
+                    op_1 = self.read_operand(addr1)
+                    op_2 = self.read_operand(addr2)
+                    result = ALU.execute_operation(operation_type=opType, operand_1=op_1, operand_2=op_2)
+                    self.write_result(result, self.current_process.process_memory_config.result_block_address)
+                    self.current_process.process_statistics.total_commands_counter += 1
+                case ExitCommand():
+                    interrupt = Interrupt(InterruptType.PROCESS_TERMINATED,
+                                          self.current_process.pid, self.device_id)
+                    self.interrupt_handler.raise_interrupt(interrupt)
+                    return
+                case IOCommand():
+                    self.current_process.process_statistics.io_commands_counter += 1
+                    self.current_process.process_statistics.total_commands_counter += 1
+                    interrupt = Interrupt(InterruptType.PROCESS_IO_INIT,
+                                          self.current_process.pid, self.device_id)
+                    self.interrupt_handler.raise_interrupt(interrupt)
+                    return
+                case _:
+                    raise RuntimeError("Неизвестный тип команды")
         self.ticks_executed += 1
         if self.ticks_executed == self.quantum_size:
             interrupt = Interrupt(InterruptType.QUANTUM_ENDED, self.current_process.pid, self.device_id)
-            self.interrupt_handler.raise_interrupt(interrupt)
\ No newline at end of file
+            self.interrupt_handler.raise_interrupt(interrupt)
+
+    def execute_program_command(self, program: CommandProgram) -> bool:
+        """
+        Выполняет очередную команду заранее сгенерированной программы текущего процесса
+        (номер команды - счётчик выполненных команд). Арифметическая команда вычисляется по операндам из программы,
+        в память записывается только результат
+        :param program: программа процесса
+        :return: True, если процесс остаётся на ЦП (выполнена арифметическая команда)
+        """
+        process = self.current_process
+        index = process.process_statistics.total_commands_counter
+        if index >= len(program):
+            process.current_command = program.exit_command
+            self.interrupt_handler.raise_interrupt(Interrupt(InterruptType.PROCESS_TERMINATED,
+                                                             process.pid, self.device_id))
+            return False
+        if program.kinds[index] == KIND_IO:
+            process.current_command = IOCommand(program.io_durations[index])
+            process.process_statistics.io_commands_counter += 1
+            process.process_statistics.total_commands_counter += 1
+            self.interrupt_handler.raise_interrupt(Interrupt(InterruptType.PROCESS_IO_INIT,
+                                                             process.pid, self.device_id))
+            return False
+        command = program.alu_command
+        command.opType = OP_TYPES[program.op_types[index]]
+        process.current_command = command
+        result = ALU.execute_operation(operation_type=command.opType, operand_1=program.operands_1[index],
+                                       operand_2=program.operands_2[index])
+        self.write_result(result, process.process_memory_config.result_block_address)
+        process.process_statistics.total_commands_counter += 1
+        return True
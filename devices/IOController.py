@@ -1,6 +1,7 @@
 from typing import *
 from abstractions.Process import *
 from managers.InterruptHandler import Interrupt, InterruptType, InterruptHandler
+from utils.TimerWheel import Timer, TimerWheel
 
 
 # класс-перечисление состояний процессора
@@ -10,17 +11,22 @@ class IOControllerState(Enum):
 
 
 class IOController:
-    def __init__(self, device_id: int):
+    def __init__(self, device_id: int, timers: TimerWheel):
         """
         Инициализация IO контроллера
+        :param device_id: ID контроллера
+        :param timers: колесо таймеров завершения операций ввода-вывода (общее для контроллеров)
         """
         self.device_id = device_id
         self.current_state = IOControllerState.IDLE  # состояние контроллера
         self._current_process:Optional[Process] = None  # текущий исполняемый процесс
-        self.current_ticks_executed: int = 0  # количество тактов команды ввода-вывода, которое уже выполнено
-        self.total_ticks_executed = 0  # общее количество выполенных тактов контроллером (для статистики)
+        self.timers = timers
+        self.timer: Optional[Timer] = None  # таймер завершения текущей операции
+        self.started_tick = 0  # такт, на котором началась текущая операция
+        self.finished_ticks_executed = 0  # количество тактов завершённых (и прерванных) операций
 
         self.interrupt_handler: Optional[InterruptHandler] = None  # указатель на обработчик прерываний
+        self.dispatcher = None  # указатель на регулировщика (ведёт учёт простаивающих устройств)
 
     @property
     def current_process(self) -> Optional[Process]:
@@ -33,27 +39,47 @@ class IOController:
     def current_process(self, proc: Optional[Process]) -> None:
         """
         Сеттер для процесса. Выставляет соответствующее состояние для контроллера
+        и регистрирует таймер завершения операции ввода-вывода
         :param proc: процесс для выставления на контроллер
         """
+        if self._current_process is not None:
+            # операция завершена или прервана
+            self.finished_ticks_executed += self.current_ticks_executed
+            self.timers.cancel(self.timer)
+            self.timer = None
         self._current_process = proc
         if proc is None:
             self.current_state = IOControllerState.IDLE
-            self.current_ticks_executed = 0
 
         else:
             self.current_state = IOControllerState.RUNNING
+            assert isinstance(proc.current_command, IOCommand)  # для контроля,
+            # что работаем над командой ввода-вывода
+            # операция выполняется duration тактов после текущего, прерывание - на следующем такте
+            self.started_tick = self.timers.now
+            self.timer = self.timers.schedule(self.started_tick + proc.current_command.duration + 1, self)
+        if self.dispatcher is not None:
+            self.dispatcher.set_io_idle(self.device_id, proc is None)
 
-    def execute_tick(self) -> None:
+    @property
+    def current_ticks_executed(self) -> int:
         """
-        Выполнение одного такта IO процесса
+        Количество тактов команды ввода-вывода, которое уже выполнено
         """
-        if self.current_process is None:
-            return
-        assert isinstance(self.current_process.current_command, IOCommand)  # для контроля,
-        # что работаем над командой ввода-вывода
-        if self.current_process.current_command.duration == self.current_ticks_executed:
-            interrupt = Interrupt(InterruptType.PROCESS_IO_END, self.current_process.pid, self.device_id)
-            self.interrupt_handler.raise_interrupt(interrupt)
-        else:
-            self.current_ticks_executed += 1
-            self.total_ticks_executed += 1
+        if self._current_process is None:
+            return 0
+        return min(self.timers.now - self.started_tick, self._current_process.current_command.duration)
+
+    @property
+    def total_ticks_executed(self) -> int:
+        """
+        Общее количество выполненных тактов контроллером (для статистики)
+        """
+        return self.finished_ticks_executed + self.current_ticks_executed
+
+    def complete_io(self) -> None:
+        """
+        Завершение операции ввода-вывода (вызывается при срабатывании таймера)
+        """
+        interrupt = Interrupt(InterruptType.PROCESS_IO_END, self.current_process.pid, self.device_id)
+        self.interrupt_handler.raise_interrupt(interrupt)
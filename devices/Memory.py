@@ -1,18 +1,65 @@
 from typing import *
+from devices.MemoryStorage import CompactStorage, MappedStorage, PagedStorage, BACKEND_LIST, BACKEND_COMPACT, \
+    BACKEND_MMAP
 
 
 class Memory:
-    def __init__(self, memory_size: int, stats) -> None:
+    def __init__(self, memory_size: int, stats, backend: str = BACKEND_LIST, memory_file: str = "") -> None:
         """
         Инициализация физической памяти
         Память моделируется как список элементов
         типа int (машинное слово/операнд в вычислениях) / None, если память не инициализирована (мусор)
         :param memory_size: размер памяти (в машинных словах)
+        :param backend: способ хранения: list - список Python, compact - массив int64 с битовой картой,
+        mmap - массив int64 с битовой картой в отображённом в память файле
+        :param memory_file: файл образа памяти для mmap ("" - временный файл)
         """
         self.physical_memory_size: int = memory_size
-        self.physical_memory: List[Optional[int]] = [None] * memory_size
+        self.backend = backend
+        self.memory_file = memory_file
+        self.physical_memory: Union[List[Optional[int]], CompactStorage, PagedStorage] = self.create_storage()
         self.stats = stats
 
+    def create_storage(self) -> Union[List[Optional[int]], CompactStorage]:
+        """
+        Создать пустое хранилище слов выбранного типа
+        """
+        if self.backend == BACKEND_LIST:
+            return [None] * self.physical_memory_size
+        if self.backend == BACKEND_COMPACT:
+            return CompactStorage(self.physical_memory_size)
+        if self.backend == BACKEND_MMAP:
+            return MappedStorage(self.physical_memory_size, self.memory_file)
+        raise RuntimeError(f"Неизвестный способ хранения памяти {self.backend}")
+
+    def reset(self) -> None:
+        """
+        Сделать всю память неинициализированной
+        """
+        if isinstance(self.physical_memory, list):
+            self.physical_memory = [None] * self.physical_memory_size
+        else:
+            self.physical_memory.reset()
+
+    def share(self) -> PagedStorage:
+        """
+        Подготовить память к ветвлению модели: хранилище заменяется страничным с копированием при записи,
+        текущее содержимое становится его неизменяемой основой. Для mmap файл образа больше не обновляется,
+        и подключение к нему (MappedStorage.attach) не показывает дальнейших изменений памяти
+        :return: страничное хранилище памяти
+        """
+        if not isinstance(self.physical_memory, PagedStorage):
+            self.physical_memory = PagedStorage(self.physical_memory_size, self.physical_memory)
+        return self.physical_memory
+
+    def close(self) -> None:
+        """
+        Освободить внешние ресурсы хранилища (отображённый файл; общая с другими ветвями модели основа
+        страничного хранилища закрывается последней ветвью)
+        """
+        if isinstance(self.physical_memory, (MappedStorage, PagedStorage)):
+            self.physical_memory.close()
+
     def read(self, address:int) -> Optional[int]:
         """
         Прочитать слово по адресу address
@@ -33,4 +80,33 @@ class Memory:
             raise RuntimeError("Попытка записи в память за допустимыми пределами.")
         self.physical_memory[address] = value
 
+    def clear(self, address: int, size: int) -> None:
+        """
+        Очистить (сделать неинициализированными) size слов начиная с адреса address
+        :param address: адрес начала области
+        :param size: размер области
+        """
+        if address < 0 or size < 0 or address + size > self.physical_memory_size:
+            raise RuntimeError("Попытка записи в память за допустимыми пределами.")
+        if isinstance(self.physical_memory, list):
+            self.physical_memory[address:address + size] = [None] * size
+        else:
+            self.physical_memory.clear(address, size)
 
+    def view(self, address: int = 0, size: Optional[int] = None) -> Union[memoryview, List[Optional[int]]]:
+        """
+        Получить срез памяти для массового чтения (например, для просмотра памяти или снимков состояния)
+        Для компактного хранилища - memoryview значений без копирования (признаки инициализации -
+        в битовой карте physical_memory.bitmap_view()), для списка и страничного хранилища - копия среза
+        :param address: адрес начала среза
+        :param size: размер среза (None - до конца памяти)
+        """
+        if size is None:
+            size = self.physical_memory_size - address
+        if address < 0 or size < 0 or address + size > self.physical_memory_size:
+            raise RuntimeError("Попытка чтения памяти за допустимыми пределами.")
+        if isinstance(self.physical_memory, list):
+            return self.physical_memory[address:address + size]
+        if isinstance(self.physical_memory, PagedStorage):
+            return self.physical_memory.slice(address, size)
+        return self.physical_memory.values_view(address, size)
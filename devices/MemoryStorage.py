@@ -0,0 +1,304 @@
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from typing import List, Optional
+
+
+# варианты хранения физической памяти
+BACKEND_LIST = "list"  # список Python (слово - int или None)
+BACKEND_COMPACT = "compact"  # массив int64 + битовая карта инициализированных слов
+BACKEND_MMAP = "mmap"  # то же, что compact, но в отображённом в память файле
+
+MAPPED_MAGIC = b"OSMMEM01"
+MAPPED_HEADER = struct.Struct("=8sQ")  # сигнатура, размер памяти в словах
+
+
+class CompactStorage:
+    """
+    Компактное хранилище машинных слов: значения лежат в массиве int64 (8 байт на слово),
+    признак инициализации слова (вместо None) - в отдельной битовой карте.
+    Поддерживает тот же доступ по индексу, что и список Optional[int]
+    """
+    def __init__(self, size: int) -> None:
+        """
+        :param size: размер памяти (в машинных словах)
+        """
+        self.size = size
+        self.values = array("q", [0]) * size  # значения слов
+        self.valid = bytearray((size + 7) >> 3)  # битовая карта: 1 - слово инициализировано
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, address: int) -> Optional[int]:
+        if self.valid[address >> 3] & (1 << (address & 7)):
+            return self.values[address]
+        return None
+
+    def __setitem__(self, address: int, value: Optional[int]) -> None:
+        if value is None:
+            self.valid[address >> 3] &= ~(1 << (address & 7)) & 0xFF
+        else:
+            self.values[address] = value
+            self.valid[address >> 3] |= 1 << (address & 7)
+
+    def clear(self, address: int, size: int) -> None:
+        """
+        Сбросить признак инициализации у size слов начиная с address
+        (значения не обнуляются - они недоступны, пока слово не будет записано заново)
+        """
+        end = address + size
+        while address < end and address & 7:
+            self.valid[address >> 3] &= ~(1 << (address & 7)) & 0xFF
+            address += 1
+        aligned_end = end & ~7
+        if address < aligned_end:
+            self.valid[address >> 3:aligned_end >> 3] = bytes((aligned_end - address) >> 3)
+            address = aligned_end
+        while address < end:
+            self.valid[address >> 3] &= ~(1 << (address & 7)) & 0xFF
+            address += 1
+
+    def reset(self) -> None:
+        """
+        Сделать всю память неинициализированной
+        """
+        self.valid[:] = bytes(len(self.valid))
+
+    def values_view(self, address: int, size: int) -> memoryview:
+        """
+        Срез значений без копирования (неинициализированные слова содержат произвольные значения)
+        """
+        return memoryview(self.values)[address:address + size]
+
+    def bitmap_view(self) -> memoryview:
+        """
+        Битовая карта инициализированных слов без копирования (бит address & 7 байта address >> 3)
+        """
+        return memoryview(self.valid)
+
+
+class MappedStorage(CompactStorage):
+    """
+    Компактное хранилище в отображённом в память файле.
+    Страницы файла подгружаются ядром по мере обращения, поэтому размер моделируемой памяти
+    не ограничен объёмом оперативной памяти. Другой процесс может подключиться к тому же файлу
+    (MappedStorage.attach) и читать содержимое памяти во время моделирования. После ветвления модели
+    файл становится неизменяемой основой страничного хранилища (PagedStorage) и перестаёт обновляться:
+    подключаться к нему для наблюдения за моделированием бессмысленно.
+    Формат файла: заголовок (сигнатура, размер), значения int64 в порядке байт машины, битовая карта
+    """
+    def __init__(self, size: int, path: str = "", readonly: bool = False, create: bool = True) -> None:
+        """
+        :param size: размер памяти (в машинных словах)
+        :param path: путь к файлу ("" - временный файл, удаляется при закрытии)
+        :param readonly: открыть только для чтения
+        :param create: создать файл заново (иначе подключиться к существующему)
+        """
+        self.size = size
+        self.users = 1  # число владельцев отображения (модель и ветви, для которых оно - основа памяти)
+        self.temporary = not path
+        if self.temporary:
+            fd, path = tempfile.mkstemp(prefix="os-model-memory-", suffix=".bin")
+            os.close(fd)
+        self.path = path
+        values_end = MAPPED_HEADER.size + 8 * size
+        length = values_end + ((size + 7) >> 3)
+
+        mode = "w+b" if create else ("rb" if readonly else "r+b")
+        with open(path, mode) as f:
+            if create:
+                f.write(MAPPED_HEADER.pack(MAPPED_MAGIC, size))
+                f.truncate(length)  # разреженный файл: страницы выделяются при первой записи
+            self.mapping = mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+
+        magic, stored_size = MAPPED_HEADER.unpack_from(self.mapping, 0)
+        if magic != MAPPED_MAGIC or stored_size != size:
+            self.mapping.close()
+            raise RuntimeError(f"Файл {path} не является образом памяти размера {size}")
+        self.view = memoryview(self.mapping)
+        self.values = self.view[MAPPED_HEADER.size:values_end].cast("q")
+        self.valid = self.view[values_end:length]
+
+    @staticmethod
+    def attach(path: str, readonly: bool = True) -> "MappedStorage":
+        """
+        Подключиться к образу памяти, созданному другой моделью
+        :param path: путь к файлу образа
+        :param readonly: открыть только для чтения
+        """
+        with open(path, "rb") as f:
+            magic, size = MAPPED_HEADER.unpack(f.read(MAPPED_HEADER.size))
+        if magic != MAPPED_MAGIC:
+            raise RuntimeError(f"Файл {path} не является образом памяти")
+        return MappedStorage(size, path, readonly=readonly, create=False)
+
+    def flush(self) -> None:
+        """
+        Сбросить изменённые страницы на диск
+        """
+        self.mapping.flush()
+
+    def reset(self) -> None:
+        if self.mapping.closed:
+            return  # отображение уже закрыто (модель завершается)
+        super().reset()
+
+    def __getstate__(self) -> dict:
+        # в снимок состояния попадает содержимое памяти, а не отображение
+        return {"size": self.size, "values": self.values.tobytes(), "valid": bytes(self.valid)}
+
+    def __setstate__(self, state: dict) -> None:
+        # содержимое восстанавливается во временный файл: файл образа, к которому могут быть подключены
+        # другая модель или наблюдатель (attach), не пересоздаётся и не изменяется
+        self.__init__(state["size"])
+        self.values[:] = memoryview(state["values"]).cast("q")
+        self.valid[:] = state["valid"]
+
+    def acquire(self) -> None:
+        """
+        Учесть ещё одного владельца отображения (ветвь модели)
+        """
+        self.users += 1
+
+    def close(self) -> None:
+        """
+        Освободить отображение. Отображение закрывается (временный файл удаляется) последним владельцем
+        """
+        if self.mapping.closed:
+            return
+        self.users -= 1
+        if self.users > 0:
+            return
+        self.values.release()
+        self.valid.release()
+        self.view.release()
+        self.mapping.close()
+        if self.temporary:
+            os.remove(self.path)
+
+
+PAGE_SHIFT = 10
+PAGE_SIZE = 1 << PAGE_SHIFT  # размер страницы (в машинных словах)
+PAGE_MASK = PAGE_SIZE - 1
+
+
+class PagedStorage:
+    """
+    Страничное хранилище с копированием при записи для ветвления модели (OSModel.fork).
+    Память делится на страницы (списки Optional[int]); страницы разделяются между ветвями, и ветвь
+    копирует страницу только при первой записи в неё. Страница, которой ещё нет (None), читается
+    из базового хранилища - замороженного содержимого памяти на момент первого ветвления
+    (None - память не инициализирована). Базовое хранилище больше не изменяется; отображённое
+    в файл базовое хранилище разделяется ветвями и закрывается последней из них (close)
+    """
+    def __init__(self, size: int, base=None) -> None:
+        """
+        :param size: размер памяти (в машинных словах)
+        :param base: базовое хранилище (список, CompactStorage или MappedStorage) или None;
+        владение MappedStorage передаётся страничному хранилищу
+        """
+        self.size = size
+        self.base = base
+        pages_cnt = (size + PAGE_MASK) >> PAGE_SHIFT
+        self.pages: list = [None] * pages_cnt  # страницы (None - страница читается из базового хранилища)
+        self.owned = bytearray(pages_cnt)  # 1 - страница принадлежит только этой ветви и изменяется на месте
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, address: int) -> Optional[int]:
+        page = self.pages[address >> PAGE_SHIFT]
+        if page is None:
+            return None if self.base is None else self.base[address]
+        return page[address & PAGE_MASK]
+
+    def __setitem__(self, address: int, value: Optional[int]) -> None:
+        index = address >> PAGE_SHIFT
+        page = self.pages[index] if self.owned[index] else self.own_page(index)
+        page[address & PAGE_MASK] = value
+
+    def own_page(self, index: int) -> list:
+        """
+        Получить собственную копию страницы для записи
+        :param index: номер страницы
+        """
+        page = self.pages[index]
+        if page is not None:
+            page = page[:]
+        else:
+            start = index << PAGE_SHIFT
+            end = min(start + PAGE_SIZE, self.size)
+            if self.base is None:
+                page = [None] * (end - start)
+            elif isinstance(self.base, list):
+                page = self.base[start:end]
+            else:
+                page = [self.base[address] for address in range(start, end)]
+        self.pages[index] = page
+        self.owned[index] = 1
+        return page
+
+    def clear(self, address: int, size: int) -> None:
+        """
+        Сделать неинициализированными size слов начиная с address
+        (страница, очищаемая целиком, заменяется новой без копирования)
+        """
+        end = address + size
+        while address < end:
+            index = address >> PAGE_SHIFT
+            page_start = index << PAGE_SHIFT
+            page_end = min(page_start + PAGE_SIZE, self.size)
+            chunk_end = min(end, page_end)
+            if address == page_start and chunk_end == page_end:
+                self.pages[index] = [None] * (page_end - page_start)
+                self.owned[index] = 1
+            else:
+                page = self.pages[index] if self.owned[index] else self.own_page(index)
+                page[address - page_start:chunk_end - page_start] = [None] * (chunk_end - address)
+            address = chunk_end
+
+    def reset(self) -> None:
+        """
+        Сделать всю память неинициализированной
+        """
+        self.release_base()
+        self.pages = [None] * len(self.pages)
+        self.owned = bytearray(len(self.owned))
+
+    def release_base(self) -> None:
+        """
+        Отказаться от базового хранилища (отображение закрывается, если ветвь была последним владельцем)
+        """
+        if isinstance(self.base, MappedStorage):
+            self.base.close()
+        self.base = None
+
+    def close(self) -> None:
+        """
+        Освободить внешние ресурсы хранилища
+        """
+        self.release_base()
+
+    def slice(self, address: int, size: int) -> List[Optional[int]]:
+        """
+        Копия среза памяти
+        """
+        return [self[i] for i in range(address, address + size)]
+
+    def fork(self) -> "PagedStorage":
+        """
+        Создать ветвь хранилища: все страницы становятся общими для обеих ветвей
+        и копируются той ветвью, которая первой в них запишет
+        """
+        self.owned = bytearray(len(self.owned))
+        child = PagedStorage.__new__(PagedStorage)
+        child.size = self.size
+        child.base = self.base
+        if isinstance(self.base, MappedStorage):
+            self.base.acquire()
+        child.pages = self.pages[:]
+        child.owned = bytearray(len(self.owned))
+        return child
@@ -0,0 +1,65 @@
+import argparse
+import sys
+
+from model.OSModel import OSModel
+from model.HeadlessRunner import HeadlessRunner, RunLimits, ENGINE_TICK, ENGINE_EVENT
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Прогон модели ОС без графического интерфейса")
+    parser.add_argument("--config", default="model/config.json", help="путь к JSON-файлу с параметрами модели")
+    parser.add_argument("--ticks", type=int, default=None, help="максимальное число тактов моделирования")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="бюджет реального времени прогона в секундах")
+    parser.add_argument("--finish-after", type=int, default=None,
+                        help="после указанного такта прекратить загрузку и дождаться завершения процессов")
+    parser.add_argument("--engine", choices=[ENGINE_TICK, ENGINE_EVENT], default=ENGINE_TICK,
+                        help="движок моделирования: потактовый или событийный (пропуск тактов без событий)")
+    parser.add_argument("--profile", action="store_true",
+                        help="замерять время фаз такта моделирования (результат - в поле profile)")
+    parser.add_argument("--checkpoint", default=None, help="файл для периодического сохранения снимка состояния модели")
+    parser.add_argument("--checkpoint-every", type=int, default=None,
+                        help="число тактов между сохранениями снимка (вместе с --checkpoint)")
+    parser.add_argument("--resume", default=None,
+                        help="продолжить моделирование из снимка состояния (--config не используется)")
+    parser.add_argument("--output", default=None, help="файл для записи результатов (по умолчанию - stdout)")
+    args = parser.parse_args(argv)
+    if args.ticks is None and args.time_budget is None and args.finish_after is None:
+        parser.error("необходимо задать хотя бы одно ограничение: --ticks, --time-budget или --finish-after")
+    if (args.checkpoint is None) != (args.checkpoint_every is None):
+        parser.error("--checkpoint и --checkpoint-every задаются вместе")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.resume:
+        os_model = OSModel.load_checkpoint(args.resume)
+    else:
+        os_model = OSModel(config_path=args.config)
+    if not os_model.running:
+        print(f"Ошибка при запуске моделирования. Проверьте наличие конфигурационного файла {args.config}.",
+              file=sys.stderr)
+        return 1
+
+    limits = RunLimits(max_ticks=args.ticks, time_budget=args.time_budget, finish_after=args.finish_after,
+                       engine=args.engine, profile=args.profile, checkpoint_path=args.checkpoint,
+                       checkpoint_interval=args.checkpoint_every)
+    result = HeadlessRunner(os_model, limits).run()
+    os_model.terminate()
+    os_model.physical_memory.close()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result.to_json())
+    else:
+        print(result.to_json())
+
+    if result.error is not None:
+        print(f"Ошибка при выполнении активного процесса: {result.error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
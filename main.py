@@ -27,10 +27,14 @@ def main():
     model_thread = threading.Thread(target=model_thread_fn, args=(os_model,), daemon=True)
     model_thread.start()
 
-    run_ui(os_model, interval_ms=10)
-
-    os_model.terminate()
-    model_thread.join(timeout=2)
+    try:
+        run_ui(os_model, interval_ms=10)
+    finally:
+        os_model.terminate()
+        model_thread.join(timeout=2)
+        # хранилище памяти закрывается после остановки потока модели: поток мог ещё обращаться к памяти
+        if not model_thread.is_alive():
+            os_model.physical_memory.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_right, insort
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from abstractions.Job import Job
+
+
+class AdmissionPolicy(ABC):
+    """
+    Стратегия выбора задания из пула для допуска в систему.
+    Задание допускается, только если помещается в наибольший свободный блок памяти
+    """
+    @abstractmethod
+    def push(self, job: Job) -> None:
+        """
+        Поместить задание в пул
+        :param job: задание
+        """
+        pass
+
+    @abstractmethod
+    def select(self, largest_free_block: int) -> Optional[Job]:
+        """
+        Задание, которое будет допущено следующим (без извлечения)
+        :param largest_free_block: размер наибольшего свободного блока памяти
+        :return: задание или None, если ни одно задание сейчас не может быть допущено
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, job: Job) -> None:
+        """
+        Извлечь задание, выбранное select
+        :param job: задание
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class FifoAdmission(AdmissionPolicy):
+    """
+    Допуск в порядке поступления: пока первое задание не помещается, следующие ждут
+    """
+    def __init__(self) -> None:
+        self.queue: Deque[Job] = deque()
+
+    def push(self, job: Job) -> None:
+        self.queue.append(job)
+
+    def select(self, largest_free_block: int) -> Optional[Job]:
+        if self.queue and self.queue[0].memory_size <= largest_free_block:
+            return self.queue[0]
+        return None
+
+    def remove(self, job: Job) -> None:
+        self.queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def clear(self) -> None:
+        self.queue.clear()
+
+
+class SizeIndexedAdmission(AdmissionPolicy):
+    """
+    Пул, проиндексированный по размеру памяти: очереди заданий одного размера (в порядке поступления)
+    и упорядоченный список различных размеров. Выбор размера - двоичный поиск
+    """
+    def __init__(self) -> None:
+        self.buckets: Dict[int, Deque[Job]] = {}  # очереди заданий по размерам памяти
+        self.sizes: List[int] = []  # отсортированные размеры непустых очередей
+        self.count = 0  # число заданий в пуле
+
+    @abstractmethod
+    def select_size(self, largest_free_block: int) -> Optional[int]:
+        """
+        Размер памяти задания, которое будет допущено следующим (None - ни одно не помещается)
+        """
+        pass
+
+    def push(self, job: Job) -> None:
+        bucket = self.buckets.get(job.memory_size)
+        if bucket is None:
+            bucket = self.buckets[job.memory_size] = deque()
+            insort(self.sizes, job.memory_size)
+        bucket.append(job)
+        self.count += 1
+
+    def select(self, largest_free_block: int) -> Optional[Job]:
+        size = self.select_size(largest_free_block) if self.sizes else None
+        return self.buckets[size][0] if size is not None else None
+
+    def remove(self, job: Job) -> None:
+        bucket = self.buckets[job.memory_size]
+        bucket.popleft()
+        if not bucket:
+            del self.buckets[job.memory_size]
+            del self.sizes[bisect_right(self.sizes, job.memory_size) - 1]
+        self.count -= 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.sizes.clear()
+        self.count = 0
+
+
+class SmallestFitAdmission(SizeIndexedAdmission):
+    """
+    Первым допускается задание с наименьшим размером памяти
+    """
+    def select_size(self, largest_free_block: int) -> Optional[int]:
+        return self.sizes[0] if self.sizes[0] <= largest_free_block else None
+
+
+class PackingAdmission(SizeIndexedAdmission):
+    """
+    Упаковка памяти: первым допускается наибольшее задание, помещающееся в наибольший свободный блок
+    """
+    def select_size(self, largest_free_block: int) -> Optional[int]:
+        index = bisect_right(self.sizes, largest_free_block)
+        return self.sizes[index - 1] if index else None
+
+
+def create_admission_policy(name: str) -> AdmissionPolicy:
+    """
+    Создать стратегию допуска заданий по имени из конфигурации
+    :param name: fifo, smallest, packing
+    """
+    match name:
+        case "fifo":
+            return FifoAdmission()
+        case "smallest":
+            return SmallestFitAdmission()
+        case "packing":
+            return PackingAdmission()
+        case _:
+            raise RuntimeError(f"Неизвестная стратегия допуска заданий {name}")
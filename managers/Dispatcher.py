@@ -1,7 +1,16 @@
+from enum import Enum
+from typing import Dict, Optional, Set, Tuple
+
 from abstractions.Process import Process, ProcessState
 from abstractions.Statistics import Statistics, ProcessTimeRecordType
 
 
+# вид устройства, на котором выполняется процесс
+class DeviceKind(Enum):
+    CPU = 0  # центральный процессор
+    IO = 1  # контроллер ввода-вывода
+
+
 # класс, моделирующий работу регулировщика
 class Dispatcher:
     def __init__(self, memory_manager, cpus, ios, scheduler, stats: Statistics):
@@ -11,6 +20,40 @@ class Dispatcher:
         self.scheduler = scheduler  # указатель на планировщика
         self.stats = stats
 
+        # ID простаивающих устройств (поддерживаются сеттерами current_process устройств)
+        self.idle_cpus: Set[int] = set()
+        self.idle_ios: Set[int] = set()
+        # устройства, на которых выполняются процессы: PID -> (вид устройства, ID устройства)
+        self.process_devices: Dict[int, Tuple[DeviceKind, int]] = {}
+        for cpu in self.cpus_ptr:
+            cpu.dispatcher = self  # выставляем на каждый ЦП указатель на себя
+            self.set_cpu_idle(cpu.device_id, cpu.current_process is None)
+        for io in self.ios_ptr:
+            io.dispatcher = self  # выставляем на каждый IO указатель на себя
+            self.set_io_idle(io.device_id, io.current_process is None)
+
+    def set_cpu_idle(self, cpu_id: int, idle: bool) -> None:
+        """
+        Отметить ЦП как простаивающий или занятый
+        :param cpu_id: ID ЦП
+        :param idle: True - ЦП простаивает
+        """
+        if idle:
+            self.idle_cpus.add(cpu_id)
+        else:
+            self.idle_cpus.discard(cpu_id)
+
+    def set_io_idle(self, io_id: int, idle: bool) -> None:
+        """
+        Отметить контроллер ввода-вывода как простаивающий или занятый
+        :param io_id: ID контроллера
+        :param idle: True - контроллер простаивает
+        """
+        if idle:
+            self.idle_ios.add(io_id)
+        else:
+            self.idle_ios.discard(io_id)
+
     def change_process_state(self, process_pid:int, new_state:ProcessState) -> None:
         """
         Изменение состояния процесса
@@ -23,7 +66,11 @@ class Dispatcher:
                 self.stats.add_time_os_multi(self.stats.time_costs.t_state)
                 self.stats.add_sys_time_os_multi(self.stats.time_costs.t_state)
 
+            # начисляем время, проведённое в прежнем состоянии
+            self.stats.settle_process_time(process)
             process.current_state = new_state
+            if new_state == ProcessState.TERMINATED:
+                self.scheduler.process_finished(process_pid)
 
     def save_process_state_word(self, process_state_word: Process) -> None:
         """
@@ -48,6 +95,7 @@ class Dispatcher:
         """
         process = self.restore_process_state_word(process_pid)
         cpu.current_process = process
+        self.process_devices[process_pid] = (DeviceKind.CPU, cpu.device_id)
         self.change_process_state(process_pid, ProcessState.RUNNING)
         self.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO, self.stats.time_costs.t_load)
         self.stats.add_time_os_multi(self.stats.time_costs.t_load)
@@ -61,6 +109,7 @@ class Dispatcher:
         """
         process = self.restore_process_state_word(process_pid)
         io.current_process = process
+        self.process_devices[process_pid] = (DeviceKind.IO, io.device_id)
         self.change_process_state(process_pid, ProcessState.IO_RUNNING)
 
     def unload_task(self, device) -> int:
@@ -72,8 +121,17 @@ class Dispatcher:
         process = device.current_process
         self.save_process_state_word(process)
         device.current_process = None
+        self.process_devices.pop(process.pid, None)
         return process.pid
 
+    def find_process_device(self, process_pid: int) -> Optional[Tuple[DeviceKind, int]]:
+        """
+        Найти устройство, на котором выполняется процесс
+        :param process_pid: PID процесса
+        :return: (вид устройства, ID устройства) или None, если процесс не загружен ни на одно устройство
+        """
+        return self.process_devices.get(process_pid)
+
     def dispatch_io(self, io_controller) -> None:
         """
         Проверить состояние контроллера IO, распределить процессы при необходимости
@@ -93,6 +151,29 @@ class Dispatcher:
         from devices.CPU import CPUState
         if cpu.current_state is CPUState.IDLE:
             # если ЦП простаивает - загружаем процесс
-            if self.scheduler.cpu_queue:
-                self.load_task_to_CPU(cpu, self.scheduler.get_process_from_cpu_queue())
+            if self.scheduler.has_cpu_work(cpu.device_id):
+                self.load_task_to_CPU(cpu, self.scheduler.get_process_from_cpu_queue(cpu.device_id))
+
 
+    def dispatch_idle_cpus(self) -> None:
+        """
+        Распределить процессы из очередей по простаивающим ЦП (в порядке ID).
+        Занятые ЦП не проверяются
+        """
+        if not self.idle_cpus or not self.scheduler.has_queued_processes():
+            return
+        for cpu_id in sorted(self.idle_cpus):
+            if self.scheduler.has_cpu_work(cpu_id):
+                self.load_task_to_CPU(self.cpus_ptr[cpu_id], self.scheduler.get_process_from_cpu_queue(cpu_id))
+
+    def dispatch_idle_ios(self) -> None:
+        """
+        Распределить процессы из очереди ввода-вывода по простаивающим контроллерам (в порядке ID).
+        Занятые контроллеры не проверяются
+        """
+        if not self.idle_ios or not self.scheduler.io_queue:
+            return
+        for io_id in sorted(self.idle_ios):
+            if not self.scheduler.io_queue:
+                return
+            self.load_task_to_IO(self.ios_ptr[io_id], self.scheduler.get_process_from_io_queue())
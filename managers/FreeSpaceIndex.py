@@ -0,0 +1,262 @@
+import random
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Optional, Tuple
+
+
+# стратегия выбора свободного блока
+class FitPolicy(Enum):
+    FIRST_FIT = "first_fit"  # первый подходящий блок от начала памяти
+    NEXT_FIT = "next_fit"  # первый подходящий блок начиная с места последнего выделения
+    BEST_FIT = "best_fit"  # наименьший подходящий блок
+    WORST_FIT = "worst_fit"  # наибольший блок
+
+
+class FreeSpaceIndex(ABC):
+    """
+    Индекс свободных блоков памяти
+    """
+    @abstractmethod
+    def add(self, address: int, size: int) -> None:
+        """
+        Добавить свободный блок
+        :param address: адрес начала блока
+        :param size: размер блока
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, address: int, size: int) -> None:
+        """
+        Удалить свободный блок (при выделении или слиянии)
+        :param address: адрес начала блока
+        :param size: размер блока
+        """
+        pass
+
+    @abstractmethod
+    def find(self, req_size: int) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Найти свободный блок размером >= req_size согласно стратегии
+        :param req_size: требуемый размер
+        :return: (адрес_начала_блока, размер_блока) или (None, None)
+        """
+        pass
+
+    @abstractmethod
+    def largest(self) -> int:
+        """
+        Размер наибольшего свободного блока (0, если свободных блоков нет)
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Удалить все блоки из индекса
+        """
+        pass
+
+
+class _TreapNode:
+    __slots__ = ("key", "address", "size", "priority", "max_size", "left", "right")
+
+    def __init__(self, key, address: int, size: int, priority: float) -> None:
+        self.key = key  # ключ упорядочивания (адрес или (размер, адрес))
+        self.address = address
+        self.size = size
+        self.priority = priority
+        self.max_size = size  # наибольший размер блока в поддереве
+        self.left: Optional["_TreapNode"] = None
+        self.right: Optional["_TreapNode"] = None
+
+
+def _update(node: _TreapNode) -> None:
+    max_size = node.size
+    if node.left is not None and node.left.max_size > max_size:
+        max_size = node.left.max_size
+    if node.right is not None and node.right.max_size > max_size:
+        max_size = node.right.max_size
+    node.max_size = max_size
+
+
+def _split(node: Optional[_TreapNode], key) -> Tuple[Optional[_TreapNode], Optional[_TreapNode]]:
+    """
+    Разделить дерево на блоки с ключами < key и >= key
+    """
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left: Optional[_TreapNode], right: Optional[_TreapNode]) -> Optional[_TreapNode]:
+    """
+    Объединить два дерева (все ключи left меньше ключей right)
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _erase(node: Optional[_TreapNode], key) -> Optional[_TreapNode]:
+    """
+    Удалить из дерева блок с ключом key (если он есть)
+    """
+    if node is None:
+        return None
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _erase(node.left, key)
+    else:
+        node.right = _erase(node.right, key)
+    _update(node)
+    return node
+
+
+def _lower_bound(node: Optional[_TreapNode], key) -> Optional[_TreapNode]:
+    """
+    Найти блок с наименьшим ключом >= key
+    """
+    found = None
+    while node is not None:
+        if node.key < key:
+            node = node.right
+        else:
+            found = node
+            node = node.left
+    return found
+
+
+def _first_fit(node: Optional[_TreapNode], req_size: int, min_address: int) -> Optional[_TreapNode]:
+    """
+    Найти блок с наименьшим адресом >= min_address и размером >= req_size
+    """
+    while node is not None and node.max_size >= req_size:
+        if node.address < min_address:
+            node = node.right
+            continue
+        found = _first_fit(node.left, req_size, min_address)
+        if found is not None:
+            return found
+        if node.size >= req_size:
+            return node
+        node = node.right
+    return None
+
+
+class AddressOrderedIndex(FreeSpaceIndex):
+    """
+    Свободные блоки, упорядоченные по адресу (декартово дерево с максимумом размера в поддереве).
+    Поиск первого подходящего блока и вставка/удаление - O(log n) в среднем
+    """
+    def __init__(self, next_fit: bool = False) -> None:
+        """
+        :param next_fit: продолжать поиск с места последнего выделения
+        """
+        self.root: Optional[_TreapNode] = None
+        self.next_fit = next_fit
+        self.rover = 0  # адрес, с которого начинается поиск в режиме next-fit
+        # отдельный генератор, чтобы не влиять на случайные величины модели
+        self.priorities = random.Random(0)
+
+    def add(self, address: int, size: int) -> None:
+        left, right = _split(self.root, address)
+        node = _TreapNode(address, address, size, self.priorities.random())
+        self.root = _merge(_merge(left, node), right)
+
+    def remove(self, address: int, size: int) -> None:
+        self.root = _erase(self.root, address)
+
+    def find(self, req_size: int) -> Tuple[Optional[int], Optional[int]]:
+        node = None
+        if self.next_fit:
+            node = _first_fit(self.root, req_size, self.rover)
+        if node is None:
+            node = _first_fit(self.root, req_size, 0)
+        if node is None:
+            return None, None
+        if self.next_fit:
+            self.rover = node.address
+        return node.address, node.size
+
+    def largest(self) -> int:
+        return self.root.max_size if self.root is not None else 0
+
+    def clear(self) -> None:
+        self.root = None
+        self.rover = 0
+
+
+class SizeOrderedIndex(FreeSpaceIndex):
+    """
+    Свободные блоки, упорядоченные по (размеру, адресу) (декартово дерево, как в AddressOrderedIndex).
+    Поиск и вставка/удаление - O(log n) в среднем
+    """
+    def __init__(self, best_fit: bool = True) -> None:
+        """
+        :param best_fit: True - наименьший подходящий блок, False - наибольший блок
+        """
+        self.root: Optional[_TreapNode] = None
+        self.best_fit = best_fit
+        # отдельный генератор, чтобы не влиять на случайные величины модели
+        self.priorities = random.Random(0)
+
+    def add(self, address: int, size: int) -> None:
+        key = (size, address)
+        left, right = _split(self.root, key)
+        node = _TreapNode(key, address, size, self.priorities.random())
+        self.root = _merge(_merge(left, node), right)
+
+    def remove(self, address: int, size: int) -> None:
+        node = _lower_bound(self.root, (size, address))
+        if node is None or node.key != (size, address):
+            raise RuntimeError("Индекс свободных блоков повреждён")
+        self.root = _erase(self.root, (size, address))
+
+    def find(self, req_size: int) -> Tuple[Optional[int], Optional[int]]:
+        if self.largest() < req_size:
+            return None, None
+        if self.best_fit:
+            node = _lower_bound(self.root, (req_size, -1))
+        else:
+            # среди наибольших блоков выбираем блок с наименьшим адресом
+            node = _lower_bound(self.root, (self.root.max_size, -1))
+        return node.address, node.size
+
+    def largest(self) -> int:
+        return self.root.max_size if self.root is not None else 0
+
+    def clear(self) -> None:
+        self.root = None
+
+
+def create_free_space_index(policy: FitPolicy) -> FreeSpaceIndex:
+    """
+    Создать индекс свободных блоков для стратегии policy
+    """
+    match policy:
+        case FitPolicy.FIRST_FIT:
+            return AddressOrderedIndex(next_fit=False)
+        case FitPolicy.NEXT_FIT:
+            return AddressOrderedIndex(next_fit=True)
+        case FitPolicy.BEST_FIT:
+            return SizeOrderedIndex(best_fit=True)
+        case FitPolicy.WORST_FIT:
+            return SizeOrderedIndex(best_fit=False)
+        case _:
+            raise RuntimeError(f"Неизвестная стратегия выделения памяти {policy}")
@@ -1,9 +1,11 @@
+import time
 from abstractions.Interrupt import InterruptType, Interrupt
-from typing import List
+from typing import Dict, List
 from managers.MemoryManager import MemoryManager
 from managers.Dispatcher import Dispatcher
-from abstractions.Process import ProcessState
+from managers.InterruptTypeHandlers import InterruptTypeHandler, default_handlers
 from abstractions.Statistics import Statistics, ProcessTimeRecordType
+from utils.Histogram import Histogram
 
 
 # класс, моделирующий работу обработчика прерываний
@@ -19,6 +21,13 @@ class InterruptHandler:
         self.memory_manager = memory_manager  # указатель на менеджера памяти
         self.stats = stats
 
+        # обработчики прерываний по типам, число обработанных прерываний и время обработки
+        self.handlers: Dict[InterruptType, InterruptTypeHandler] = {}
+        self.handled_counts: Dict[InterruptType, int] = {}
+        self.handling_times: Dict[InterruptType, Histogram] = {}
+        for handler in default_handlers():
+            self.register_handler(handler)
+
         for cpu in self.cpus:
             cpu.interrupt_handler = self  # выставляем на каждый ЦП указатель на себя
         for io in self.ios:
@@ -31,125 +40,92 @@ class InterruptHandler:
         """
         self.interrupts_raised.append(interrupt)
 
-    def handle_interrupts(self):
+    def register_handler(self, handler: InterruptTypeHandler) -> None:
+        """
+        Зарегистрировать обработчик прерываний (заменяет обработчик того же типа)
+        :param handler: обработчик прерываний одного типа
         """
-        Обработать все накопленные прерывания
-        """
-        for interrupt in self.interrupts_raised:
-            process_pid = interrupt.pid_process
-            device_id = interrupt.device_called_id
-            match interrupt.type:
-                case InterruptType.QUANTUM_ENDED:
-                    self.dispatcher.change_process_state(process_pid, ProcessState.READY)
-                    self.dispatcher.unload_task(self.cpus[device_id])
-                    self.scheduler.add_process_to_cpu_queue(process_pid)
-                    if self.scheduler.cpu_queue:
-                        self.dispatcher.load_task_to_CPU(self.cpus[device_id],
-                                                         self.scheduler.get_process_from_cpu_queue())
-                case InterruptType.PROCESS_TERMINATED:
-                    self.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
-                    self.dispatcher.unload_task(self.cpus[device_id])
-                    self.memory_manager.schedule_process_to_be_removed(process_pid)
-                    self.stats.os_stats.m_multi += 1
-                    self.stats.add_process_end_time(process_pid)
+        self.handlers[handler.interrupt_type] = handler
+        self.handled_counts.setdefault(handler.interrupt_type, 0)
+        self.handling_times.setdefault(handler.interrupt_type, Histogram())
 
-                    if self.scheduler.cpu_queue:
-                        self.dispatcher.load_task_to_CPU(self.cpus[device_id],
-                                                         self.scheduler.get_process_from_cpu_queue())
-                case InterruptType.PROCESS_IO_INIT:
-                    self.dispatcher.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO,
-                                                           self.dispatcher.stats.time_costs.t_init_io)
-                    self.stats.add_time_os_multi(self.dispatcher.stats.time_costs.t_init_io)
-                    self.stats.add_sys_time_os_multi(self.stats.time_costs.t_init_io)
+    def charge_service_time(self, process_pid: int, cost: float) -> None:
+        """
+        Начислить процессу и системе затраты на обслуживание прерывания
+        :param process_pid: PID процесса
+        :param cost: затраты
+        """
+        self.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO, cost)
+        self.stats.add_time_os_multi(cost)
+        self.stats.add_sys_time_os_multi(cost)
 
-                    self.dispatcher.change_process_state(process_pid, ProcessState.IO_BLOCKED)
-                    self.dispatcher.unload_task(self.cpus[device_id])
-                    self.scheduler.add_process_to_io_queue(process_pid)
-                    if self.scheduler.cpu_queue:
-                        self.dispatcher.load_task_to_CPU(self.cpus[device_id],
-                                                         self.scheduler.get_process_from_cpu_queue())
-                case InterruptType.PROCESS_IO_END:
-                    self.dispatcher.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO,
-                                                           self.dispatcher.stats.time_costs.t_end_io)
-                    self.stats.add_time_os_multi(self.dispatcher.stats.time_costs.t_end_io)
-                    self.stats.add_sys_time_os_multi(self.stats.time_costs.t_end_io)
+    def reload_cpu(self, cpu) -> None:
+        """
+        Загрузить на освободившийся ЦП следующий процесс из очереди (если есть)
+        """
+        if self.scheduler.has_cpu_work(cpu.device_id):
+            self.dispatcher.load_task_to_CPU(cpu, self.scheduler.get_process_from_cpu_queue(cpu.device_id))
 
-                    self.dispatcher.change_process_state(process_pid, ProcessState.READY)
-                    self.dispatcher.unload_task(self.ios[device_id])
-                    self.scheduler.add_process_to_cpu_queue(process_pid)
-                    if self.scheduler.io_queue:
-                        self.dispatcher.load_task_to_IO(self.ios[device_id],
-                                                        self.scheduler.get_process_from_io_queue())
-                case InterruptType.PROCESS_STOPPED_CPU:
-                    self.dispatcher.change_process_state(process_pid, ProcessState.STOPPED_CPU)
-                    self.dispatcher.unload_task(self.cpus[device_id])
-                    if self.scheduler.cpu_queue:
-                        self.dispatcher.load_task_to_CPU(self.cpus[device_id],
-                                                         self.scheduler.get_process_from_cpu_queue())
-                case InterruptType.PROCESS_STOPPED_IO:
-                    self.dispatcher.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO,
-                                                           self.dispatcher.stats.time_costs.t_end_io)
-                    self.stats.add_time_os_multi(self.dispatcher.stats.time_costs.t_end_io)
-                    self.stats.add_sys_time_os_multi(self.stats.time_costs.t_end_io)
+    def reload_io(self, io) -> None:
+        """
+        Загрузить на освободившийся контроллер следующий процесс из очереди ввода-вывода (если есть)
+        """
+        if self.scheduler.io_queue:
+            self.dispatcher.load_task_to_IO(io, self.scheduler.get_process_from_io_queue())
 
-                    self.dispatcher.change_process_state(process_pid, ProcessState.STOPPED_IO)
-                    self.dispatcher.unload_task(self.ios[device_id])
-                    if self.scheduler.io_queue:
-                        self.dispatcher.load_task_to_IO(self.ios[device_id],
-                                                        self.scheduler.get_process_from_io_queue())
-                case InterruptType.PROCESS_RESUMED_IO:
-                    self.dispatcher.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO,
-                                                           self.dispatcher.stats.time_costs.t_init_io)
-                    self.stats.add_time_os_multi(self.dispatcher.stats.time_costs.t_init_io)
-                    self.stats.add_sys_time_os_multi(self.stats.time_costs.t_init_io)
+    def finish_process(self, process_pid: int) -> None:
+        """
+        Учесть завершение процесса и запланировать освобождение его ресурсов
+        :param process_pid: PID процесса
+        """
+        self.memory_manager.schedule_process_to_be_removed(process_pid)
+        self.stats.os_stats.m_multi += 1
+        self.stats.add_process_end_time(process_pid)
 
-                    self.dispatcher.change_process_state(process_pid, ProcessState.IO_BLOCKED)
-                    self.scheduler.add_process_to_io_queue(process_pid)
-                case InterruptType.PROCESS_RESUMED_CPU:
-                    self.dispatcher.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO,
-                                                           self.dispatcher.stats.time_costs.t_end_io)
-                    self.stats.add_time_os_multi(self.dispatcher.stats.time_costs.t_end_io)
-                    self.stats.add_sys_time_os_multi(self.stats.time_costs.t_end_io)
+    def handle_interrupts(self):
+        """
+        Обработать все накопленные прерывания в порядке приоритетов (при равном приоритете - в порядке поступления).
+        Подряд идущие прерывания типа с пакетной обработкой обрабатываются одним вызовом
+        """
+        # прерывания, вызванные во время обработки, будут обработаны на следующем такте
+        pending, self.interrupts_raised = self.interrupts_raised, []
+        pending.sort(key=lambda interrupt: self.get_handler(interrupt.type).priority)
 
-                    self.dispatcher.change_process_state(process_pid, ProcessState.READY)
-                    self.scheduler.add_process_to_cpu_queue(process_pid)
-                case InterruptType.PROCESS_KILLED:
-                    found = 0
-                    for cpu in self.cpus:
-                        if cpu.current_process and cpu.current_process.pid == process_pid:
-                            found = 1
-                            self.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
-                            self.dispatcher.unload_task(self.cpus[cpu.device_id])
-                            self.memory_manager.schedule_process_to_be_removed(process_pid)
-                            self.stats.os_stats.m_multi += 1
-                            self.stats.add_process_end_time(process_pid)
+        i = 0
+        while i < len(pending):
+            handler = self.get_handler(pending[i].type)
+            j = i + 1
+            if handler.batched:
+                while j < len(pending) and pending[j].type == handler.interrupt_type:
+                    j += 1
+            actual = [interrupt for interrupt in pending[i:j]
+                      if handler.is_actual(self, interrupt, self.memory_manager.get_process(interrupt.pid_process))]
+            i = j
+            if not actual:
+                continue
 
-                            if self.scheduler.cpu_queue:
-                                self.dispatcher.load_task_to_CPU(cpu,
-                                                                 self.scheduler.get_process_from_cpu_queue())
-                    if not found:
-                        for io in self.ios:
-                            if io.current_process and io.current_process.pid == process_pid:
-                                found = 1
-                                self.dispatcher.stats.add_time_process(process_pid, ProcessTimeRecordType.T_SYS_MONO,
-                                                                       self.dispatcher.stats.time_costs.t_end_io)
-                                self.stats.add_time_os_multi(self.dispatcher.stats.time_costs.t_end_io)
-                                self.stats.add_sys_time_os_multi(self.stats.time_costs.t_end_io)
+            started = time.perf_counter_ns()
+            if handler.batched:
+                handler.handle_batch(self, actual)
+            else:
+                handler.handle(self, actual[0])
+            self.handling_times[handler.interrupt_type].add(time.perf_counter_ns() - started)
+            self.handled_counts[handler.interrupt_type] += len(actual)
 
-                                self.dispatcher.unload_task(self.ios[io.device_id])
-                                self.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
-                                self.memory_manager.schedule_process_to_be_removed(process_pid)
-                                self.stats.os_stats.m_multi += 1
-                                self.stats.add_process_end_time(process_pid)
-                                if self.scheduler.io_queue:
-                                    self.dispatcher.load_task_to_IO(io,
-                                                                    self.scheduler.get_process_from_io_queue())
-                    if not found:
-                        self.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
-                        self.memory_manager.schedule_process_to_be_removed(process_pid)
-                        self.stats.os_stats.m_multi += 1
-                        self.stats.add_process_end_time(process_pid)
+    def get_handler(self, interrupt_type: InterruptType) -> InterruptTypeHandler:
+        """
+        Обработчик прерываний типа interrupt_type
+        """
+        handler = self.handlers.get(interrupt_type)
+        if handler is None:
+            raise RuntimeError("Неизвестный тип прерывания.")
+        return handler
 
-                case _:
-                    raise RuntimeError("Неизвестный тип прерывания.")
-        self.interrupts_raised.clear()
+    def get_interrupt_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Статистика обработки прерываний по типам: число обработанных прерываний
+        и время обработки (в наносекундах; для пакетной обработки - время на пакет)
+        """
+        return {interrupt_type.name: {"handled": self.handled_counts[interrupt_type],
+                                      "time_ns": self.handling_times[interrupt_type].to_dict()}
+                for interrupt_type in self.handlers}
@@ -0,0 +1,211 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from abstractions.Interrupt import InterruptType, Interrupt
+from abstractions.Process import Process, ProcessState
+from managers.Dispatcher import DeviceKind
+
+
+# приоритеты прерываний (меньше значение - раньше обрабатывается).
+# За такт прерывания поступают именно в таком порядке: команды пользователя (между тактами),
+# затем прерывания ЦП и контроллеров ввода-вывода, поэтому порядок обработки совпадает с порядком поступления
+PRIORITY_USER = 0  # команды пользователя
+PRIORITY_CPU = 1  # прерывания центральных процессоров
+PRIORITY_IO = 2  # прерывания контроллеров ввода-вывода
+
+
+class InterruptTypeHandler(ABC):
+    """
+    Обработчик прерываний одного типа
+    """
+    interrupt_type: InterruptType  # тип обрабатываемых прерываний
+    priority: int = PRIORITY_USER  # приоритет обработки
+    device_kind: Optional[DeviceKind] = None  # вид устройства, вызывающего прерывание (None - прерывание
+    # не привязано к устройству)
+    batched: bool = False  # прерывания типа, поступившие за такт, обрабатываются одним вызовом handle_batch
+
+    def is_actual(self, owner, interrupt: Interrupt, process: Optional[Process]) -> bool:
+        """
+        Проверить, что прерывание ещё имеет смысл (процесс не завершён и не снят с устройства
+        другим прерыванием этого же такта)
+        :param owner: обработчик прерываний (managers.InterruptHandler)
+        :param interrupt: прерывание
+        :param process: процесс, к которому относится прерывание
+        """
+        if process is None or process.current_state == ProcessState.TERMINATED:
+            return False
+        if self.device_kind is not None and interrupt.device_called_id != -1:
+            return owner.dispatcher.find_process_device(interrupt.pid_process) == \
+                (self.device_kind, interrupt.device_called_id)
+        return True
+
+    @abstractmethod
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        """
+        Обработать прерывание
+        :param owner: обработчик прерываний (managers.InterruptHandler)
+        :param interrupt: прерывание
+        """
+        pass
+
+    def handle_batch(self, owner, interrupts: List[Interrupt]) -> None:
+        """
+        Обработать все прерывания типа, поступившие за такт (для batched-обработчиков)
+        :param owner: обработчик прерываний
+        :param interrupts: прерывания в порядке поступления
+        """
+        for interrupt in interrupts:
+            self.handle(owner, interrupt)
+
+
+class QuantumEndedHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.QUANTUM_ENDED
+    priority = PRIORITY_CPU
+    device_kind = DeviceKind.CPU
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid, cpu = interrupt.pid_process, owner.cpus[interrupt.device_called_id]
+        owner.dispatcher.change_process_state(process_pid, ProcessState.READY)
+        owner.dispatcher.unload_task(cpu)
+        owner.scheduler.quantum_expired(process_pid)
+        owner.scheduler.add_process_to_cpu_queue(process_pid)
+        owner.reload_cpu(cpu)
+
+
+class ProcessTerminatedHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.PROCESS_TERMINATED
+    priority = PRIORITY_CPU
+    device_kind = DeviceKind.CPU
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid, cpu = interrupt.pid_process, owner.cpus[interrupt.device_called_id]
+        owner.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
+        owner.dispatcher.unload_task(cpu)
+        owner.finish_process(process_pid)
+        owner.reload_cpu(cpu)
+
+
+class IOInitHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.PROCESS_IO_INIT
+    priority = PRIORITY_CPU
+    device_kind = DeviceKind.CPU
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid, cpu = interrupt.pid_process, owner.cpus[interrupt.device_called_id]
+        owner.charge_service_time(process_pid, owner.stats.time_costs.t_init_io)
+        owner.dispatcher.change_process_state(process_pid, ProcessState.IO_BLOCKED)
+        owner.dispatcher.unload_task(cpu)
+        owner.scheduler.add_process_to_io_queue(process_pid)
+        owner.reload_cpu(cpu)
+
+
+class IOEndHandler(InterruptTypeHandler):
+    """
+    Завершения ввода-вывода за такт обрабатываются вместе: сначала все процессы возвращаются в очередь к ЦП,
+    затем очередь ввода-вывода за один проход распределяется по освободившимся контроллерам
+    """
+    interrupt_type = InterruptType.PROCESS_IO_END
+    priority = PRIORITY_IO
+    device_kind = DeviceKind.IO
+    batched = True
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        self.handle_batch(owner, [interrupt])
+
+    def handle_batch(self, owner, interrupts: List[Interrupt]) -> None:
+        freed = []
+        for interrupt in interrupts:
+            process_pid, io = interrupt.pid_process, owner.ios[interrupt.device_called_id]
+            owner.charge_service_time(process_pid, owner.stats.time_costs.t_end_io)
+            owner.dispatcher.change_process_state(process_pid, ProcessState.READY)
+            owner.dispatcher.unload_task(io)
+            owner.scheduler.add_process_to_cpu_queue(process_pid)
+            freed.append(io)
+        for io in freed:
+            if not owner.scheduler.io_queue:
+                break
+            owner.dispatcher.load_task_to_IO(io, owner.scheduler.get_process_from_io_queue())
+
+
+class StoppedCPUHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.PROCESS_STOPPED_CPU
+    device_kind = DeviceKind.CPU
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid, cpu = interrupt.pid_process, owner.cpus[interrupt.device_called_id]
+        owner.dispatcher.change_process_state(process_pid, ProcessState.STOPPED_CPU)
+        owner.dispatcher.unload_task(cpu)
+        owner.reload_cpu(cpu)
+
+
+class StoppedIOHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.PROCESS_STOPPED_IO
+    device_kind = DeviceKind.IO
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid, io = interrupt.pid_process, owner.ios[interrupt.device_called_id]
+        owner.charge_service_time(process_pid, owner.stats.time_costs.t_end_io)
+        owner.dispatcher.change_process_state(process_pid, ProcessState.STOPPED_IO)
+        owner.dispatcher.unload_task(io)
+        owner.reload_io(io)
+
+
+class ResumedIOHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.PROCESS_RESUMED_IO
+
+    def is_actual(self, owner, interrupt: Interrupt, process: Optional[Process]) -> bool:
+        # повторное возобновление уже возобновлённого процесса игнорируется
+        return process is not None and process.current_state == ProcessState.STOPPED_IO
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid = interrupt.pid_process
+        owner.charge_service_time(process_pid, owner.stats.time_costs.t_init_io)
+        owner.dispatcher.change_process_state(process_pid, ProcessState.IO_BLOCKED)
+        owner.scheduler.add_process_to_io_queue(process_pid)
+
+
+class ResumedCPUHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.PROCESS_RESUMED_CPU
+
+    def is_actual(self, owner, interrupt: Interrupt, process: Optional[Process]) -> bool:
+        # повторное возобновление уже возобновлённого процесса игнорируется
+        return process is not None and process.current_state == ProcessState.STOPPED_CPU
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid = interrupt.pid_process
+        owner.charge_service_time(process_pid, owner.stats.time_costs.t_end_io)
+        owner.dispatcher.change_process_state(process_pid, ProcessState.READY)
+        owner.scheduler.add_process_to_cpu_queue(process_pid)
+
+
+class KilledHandler(InterruptTypeHandler):
+    interrupt_type = InterruptType.PROCESS_KILLED
+
+    def handle(self, owner, interrupt: Interrupt) -> None:
+        process_pid = interrupt.pid_process
+        location = owner.dispatcher.find_process_device(process_pid)
+        if location is not None and location[0] == DeviceKind.CPU:
+            cpu = owner.cpus[location[1]]
+            owner.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
+            owner.dispatcher.unload_task(cpu)
+            owner.finish_process(process_pid)
+            owner.reload_cpu(cpu)
+        elif location is not None and location[0] == DeviceKind.IO:
+            io = owner.ios[location[1]]
+            owner.charge_service_time(process_pid, owner.stats.time_costs.t_end_io)
+            owner.dispatcher.unload_task(io)
+            owner.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
+            owner.finish_process(process_pid)
+            owner.reload_io(io)
+        else:
+            owner.scheduler.remove_process(process_pid)  # процесс мог ожидать в очереди
+            owner.dispatcher.change_process_state(process_pid, ProcessState.TERMINATED)
+            owner.finish_process(process_pid)
+
+
+def default_handlers() -> List[InterruptTypeHandler]:
+    """
+    Обработчики всех встроенных типов прерываний
+    """
+    return [QuantumEndedHandler(), ProcessTerminatedHandler(), IOInitHandler(), IOEndHandler(),
+            StoppedCPUHandler(), StoppedIOHandler(), ResumedIOHandler(), ResumedCPUHandler(), KilledHandler()]
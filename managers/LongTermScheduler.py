@@ -0,0 +1,80 @@
+from typing import Dict, Optional
+
+from abstractions.Job import Job
+from abstractions.Statistics import Statistics
+from managers.AdmissionPolicies import AdmissionPolicy
+
+
+# класс, моделирующий работу долгосрочного планировщика (допуск заданий из пула в систему)
+class LongTermScheduler:
+    def __init__(self, stats: Statistics, policy: AdmissionPolicy, pool_capacity: int = 0) -> None:
+        """
+        :param stats: статистика (время ожидания допуска)
+        :param policy: стратегия выбора задания из пула
+        :param pool_capacity: наибольшее число заданий в пуле (0 - без ограничения)
+        """
+        self.stats = stats
+        self.pool = policy  # пул поступивших, но ещё не допущенных заданий
+        self.pool_capacity = pool_capacity
+        self.submitted = 0  # число поступивших в пул заданий
+        self.admitted = 0  # число допущенных заданий
+        self.rejected = 0  # число отвергнутых заданий (больше всей памяти модели, не могут быть допущены)
+
+    def __len__(self) -> int:
+        return len(self.pool)
+
+    def is_full(self) -> bool:
+        """
+        Пул заполнен (новые задания не принимаются)
+        """
+        return 0 < self.pool_capacity <= len(self.pool)
+
+    def submit(self, job: Job) -> None:
+        """
+        Поместить поступившее задание в пул
+        :param job: задание
+        """
+        self.pool.push(job)
+        self.submitted += 1
+
+    def reject(self, job: Job) -> None:
+        """
+        Отвергнуть поступившее задание, не помещая его в пул
+        :param job: задание
+        """
+        self.rejected += 1
+
+    def can_admit(self, largest_free_block: int) -> bool:
+        """
+        Есть ли в пуле задание, которое можно допустить
+        :param largest_free_block: размер наибольшего свободного блока памяти
+        """
+        return self.pool.select(largest_free_block) is not None
+
+    def admit(self, largest_free_block: int, current_tick: int) -> Optional[Job]:
+        """
+        Извлечь из пула задание для допуска и учесть время его ожидания
+        :param largest_free_block: размер наибольшего свободного блока памяти (задание гарантированно
+        в него помещается)
+        :param current_tick: текущий такт
+        :return: задание или None, если ни одно задание не может быть допущено
+        """
+        job = self.pool.select(largest_free_block)
+        if job is None:
+            return None
+        self.pool.remove(job)
+        self.admitted += 1
+        self.stats.add_queueing_delay(current_tick - job.arrival_tick)
+        return job
+
+    def clear(self) -> None:
+        self.pool.clear()
+
+    def get_admission_stats(self) -> Dict[str, object]:
+        """
+        Статистика допуска: число заданий в пуле, поступивших, допущенных и отвергнутых заданий,
+        время ожидания допуска (в тактах)
+        """
+        return {"pool_size": len(self.pool), "submitted": self.submitted, "admitted": self.admitted,
+                "rejected": self.rejected,
+                "queueing_delay": self.stats.queueing_delays.to_dict()}
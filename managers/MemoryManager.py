@@ -1,22 +1,42 @@
 from typing import *
 from devices.Memory import Memory
 from abstractions.Process import Process
+from managers.FreeSpaceIndex import FitPolicy, FreeSpaceIndex, create_free_space_index
 
 
 class MemoryManager:
-    def __init__(self, memory_ptr: Memory, proc_table_ptr: Dict[int, Process]):
+    def __init__(self, memory_ptr: Memory, proc_table_ptr: Dict[int, Process],
+                 fit_policy: FitPolicy = FitPolicy.FIRST_FIT):
         """
         Инициализация менеджера памяти
         :param memory_ptr: указатель на структуру физической памяти
+        :param fit_policy: стратегия выбора свободного блока
         """
         self.memory_ptr = memory_ptr
         self.proc_table_ptr = proc_table_ptr
+        self.fit_policy = fit_policy
         self.available_memory = self.memory_ptr.physical_memory_size
         # таблица сегментов - структура типа Dict[адрес_начала_блока, Tuple[Optional[PID_процесса], размер_блока]
         self.memory_map: Dict[int, Tuple[Optional[int], int]] = dict([(0, (None,self.available_memory))])
+        # граничные метки: адрес конца блока (не включительно) -> адрес начала блока, для поиска левого соседа
+        self.block_ends: Dict[int, int] = {self.available_memory: 0}
+        # индекс свободных блоков таблицы сегментов
+        self.free_index: FreeSpaceIndex = create_free_space_index(fit_policy)
+        self.free_index.add(0, self.available_memory)
 
         self.to_clean = [] # PID процессов на удаление
 
+    def reset(self) -> None:
+        """
+        Вернуть менеджер памяти в начальное состояние (вся память свободна)
+        """
+        self.available_memory = self.memory_ptr.physical_memory_size
+        self.memory_map = dict([(0, (None, self.available_memory))])
+        self.block_ends = {self.available_memory: 0}
+        self.free_index.clear()
+        self.free_index.add(0, self.available_memory)
+        self.to_clean = []
+
     def get_current_proc_table_size(self) -> int:
         """
         Вернуть текущее количество элементов в таблице процессов
@@ -51,22 +71,20 @@ class MemoryManager:
 
     def find_free_block(self, req_size: int) -> Tuple[Optional[int], Optional[int]]:
         """
-        Находит первый свободный блок размером >= req_size в таблице сегментов
+        Находит свободный блок размером >= req_size согласно стратегии выделения памяти
         :param req_size: требуемый размер
         :return: если сегментов подходящего размера нет - (None, None)
         иначе - (адрес_начала_блока, размер_блока)
         """
         if req_size < 0:
             raise RuntimeError(f"Неверный требуемый размер блока ({req_size})")
-        index = 0
-        while index < self.memory_ptr.physical_memory_size:
-            if index not in self.memory_map:
-                raise RuntimeError("Таблица сегментов повреждена")
-            if self.memory_map[index][0] is None:
-                if self.memory_map[index][1] >= req_size:
-                    return index, self.memory_map[index][1]
-            index += self.memory_map[index][1]
-        return None, None
+        return self.free_index.find(req_size)
+
+    def largest_free_block(self) -> int:
+        """
+        Размер наибольшего свободного блока
+        """
+        return self.free_index.largest()
 
     def allocate_memory_for_process(self, process_pid: int, req_size: int) -> int:
         """
@@ -78,9 +96,13 @@ class MemoryManager:
         if free_block == (None, None):
             return -1
         address, free_block_size = free_block
+        self.free_index.remove(address, free_block_size)
         self.memory_map[address] = (process_pid, req_size)
+        self.block_ends[address + req_size] = address
         if free_block_size > req_size:
             self.memory_map[address + req_size] = (None, free_block_size - req_size)
+            self.block_ends[address + free_block_size] = address + req_size
+            self.free_index.add(address + req_size, free_block_size - req_size)
 
         self.update_available_memory(0 - req_size)
         return address
@@ -102,28 +124,30 @@ class MemoryManager:
         new_size = process_size
 
         # очищаем память от арифметических значений
-        for i in range(process_size):
-            self.memory_ptr.write(None, start_address + i)
-
-        # проверяем левый соседний блок
-        left = start_address - 1
-        while left >= 0 and left not in self.memory_map:
-            left -= 1
-        if left >= 0 and self.memory_map[left][0] is None:
+        self.memory_ptr.clear(start_address, process_size)
+
+        # проверяем левый соседний блок (по граничной метке - блок, который заканчивается на нашем начале)
+        left = self.block_ends.get(start_address)
+        if left is not None and self.memory_map[left][0] is None:
             _, left_size = self.memory_map.pop(left)
+            self.free_index.remove(left, left_size)
+            del self.block_ends[start_address]
+            del self.memory_map[start_address]  # блок процесса поглощается левым соседом
             start_address = left
             new_size += left_size
 
-        # проверяем правый соседний блок
+        # проверяем правый соседний блок (начинается сразу за нашим концом)
         right = process_address + process_size
-        while right < self.memory_ptr.physical_memory_size and right not in self.memory_map:
-            right += 1
-        if right < self.memory_ptr.physical_memory_size and self.memory_map[right][0] is None:
+        if right in self.memory_map and self.memory_map[right][0] is None:
             _, right_size = self.memory_map.pop(right)
+            self.free_index.remove(right, right_size)
+            del self.block_ends[right]
             new_size += right_size
 
         # создаём новый объединённый свободный блок
         self.memory_map[start_address] = (None, new_size)
+        self.block_ends[start_address + new_size] = start_address
+        self.free_index.add(start_address, new_size)
         self.update_available_memory(process_size)
 
     def update_available_memory(self, value: int) -> None:
@@ -1,45 +1,143 @@
-from collections import deque
-from typing import Optional, Deque
+from typing import Dict, List, Optional
 from abstractions.Statistics import Statistics, ProcessTimeRecordType
+from managers.SchedulingPolicies import SchedulingPolicy, FifoPolicy
 
 
 class Scheduler:
-    def __init__(self, stats: Statistics) -> None:
+    def __init__(self, stats: Statistics, cpu_queues: Optional[List[SchedulingPolicy]] = None) -> None:
         """
         Инициализация планировщика
+        :param cpu_queues: очереди к ЦП. Одна очередь (по умолчанию - FIFO) - общая для всех ЦП,
+        несколько - у каждого ЦП своя очередь (i-я очередь принадлежит ЦП с ID i), простаивающий ЦП
+        забирает процессы из самой длинной чужой очереди
         """
         self.stats: Statistics = stats
-        self.cpu_queue: Deque[int] = deque()
-        self.io_queue: Deque[int] = deque()
+        self.cpu_queues: List[SchedulingPolicy] = cpu_queues if cpu_queues else [FifoPolicy(stats.proc_table)]
+        self.cpu_queue: SchedulingPolicy = self.cpu_queues[0]  # общая очередь (в режиме общей очереди)
+        self.per_cpu = len(self.cpu_queues) > 1  # режим очередей отдельных ЦП
+        self.io_queue: FifoPolicy = FifoPolicy(stats.proc_table)  # очередь к устройствам ввода-вывода
+
+        self.queued_cnt = 0  # общее число процессов в очередях к ЦП
+        self.home_cpus: Dict[int, int] = {}  # ЦП, на котором процесс выполнялся последним (PID -> ID ЦП)
+        self.steals: List[int] = [0] * len(self.cpu_queues)  # число процессов, забранных каждым ЦП из чужих очередей
         return
 
+    def home_queue_id(self, process_pid: int) -> int:
+        """
+        Номер очереди, в которую помещается процесс: очередь ЦП, на котором он выполнялся последним,
+        для нового процесса - самая короткая очередь
+        :param process_pid: PID процесса
+        """
+        if not self.per_cpu:
+            return 0
+        queue_id = self.home_cpus.get(process_pid)
+        if queue_id is None:
+            queue_id = min(range(len(self.cpu_queues)), key=lambda i: len(self.cpu_queues[i]))
+        return queue_id
+
     def add_process_to_cpu_queue(self, process_pid: int) -> None:
         """
-        Добавляет процесс в конец очереди.
+        Добавляет процесс в очередь к ЦП (место в очереди определяется стратегией планирования).
+        Обращение к очереди отдельного ЦП не требует затрат на общение с общими данными.
         """
-        self.stats.add_time_os_multi(self.stats.time_costs.t_global)
-        self.stats.add_sys_time_os_multi(self.stats.time_costs.t_global)
+        if not self.per_cpu:
+            self.stats.add_time_os_multi(self.stats.time_costs.t_global)
+            self.stats.add_sys_time_os_multi(self.stats.time_costs.t_global)
 
-        self.cpu_queue.append(process_pid)
+        self.cpu_queues[self.home_queue_id(process_pid)].push(process_pid)
+        self.queued_cnt += 1
 
-    def get_process_from_cpu_queue(self) -> Optional[int]:
+    def has_cpu_work(self, cpu_id: int = 0) -> bool:
         """
-        Извлекает процесс из головы очереди и возвращает PID или возвращает None, если пуста
+        Есть ли процесс, который ЦП может взять на выполнение (в своей очереди или, при простое, в чужой)
+        :param cpu_id: ID ЦП
+        """
+        return self.queued_cnt > 0  # простаивающий ЦП может забрать процесс из любой очереди
+
+    def has_queued_processes(self) -> bool:
+        """
+        Есть ли процессы в очередях к ЦП
+        """
+        return self.queued_cnt > 0
+
+    def get_process_from_cpu_queue(self, cpu_id: int = 0) -> Optional[int]:
+        """
+        Извлекает следующий по стратегии планирования процесс для ЦП и возвращает PID
+        или возвращает None, если очередь пуста.
+        Если собственная очередь ЦП пуста, процесс забирается из самой длинной чужой очереди
+        (с затратами на перенос процесса)
+        :param cpu_id: ID ЦП
         :return: int
         """
-        if not self.cpu_queue:
+        if not self.queued_cnt:
             return None
+        self.queued_cnt -= 1
+        if not self.per_cpu:
+            self.stats.add_time_os_multi(self.stats.time_costs.t_next)
+            self.stats.add_time_os_multi(self.stats.time_costs.t_global)
+            self.stats.add_sys_time_os_multi(self.stats.time_costs.t_global + self.stats.time_costs.t_next)
+            return self.cpu_queue.pop()
+
         self.stats.add_time_os_multi(self.stats.time_costs.t_next)
-        self.stats.add_time_os_multi(self.stats.time_costs.t_global)
-        self.stats.add_sys_time_os_multi(self.stats.time_costs.t_global + self.stats.time_costs.t_next)
+        self.stats.add_sys_time_os_multi(self.stats.time_costs.t_next)
+        queue = self.cpu_queues[cpu_id]
+        if not queue:
+            queue = max(self.cpu_queues, key=len)
+            self.steals[cpu_id] += 1
+            self.stats.add_time_os_multi(self.stats.time_costs.t_migrate)
+            self.stats.add_sys_time_os_multi(self.stats.time_costs.t_migrate)
+        process_pid = queue.pop()
+        self.home_cpus[process_pid] = cpu_id
+        return process_pid
+
+    def remove_process(self, process_pid: int) -> None:
+        """
+        Удалить процесс из очередей планировщика (при уничтожении ожидающего процесса)
+        :param process_pid: PID процесса
+        """
+        for queue in self.cpu_queues:
+            if queue.remove(process_pid):
+                self.queued_cnt -= 1
+                return
+        self.io_queue.remove(process_pid)
 
-        return self.cpu_queue.popleft()
+    def quantum_expired(self, process_pid: int) -> None:
+        """
+        Сообщить стратегии планирования, что процесс израсходовал квант (до возврата процесса в очередь)
+        :param process_pid: PID процесса
+        """
+        self.cpu_queues[self.home_queue_id(process_pid)].on_quantum_expired(process_pid)
+
+    def process_finished(self, process_pid: int) -> None:
+        """
+        Сообщить стратегии планирования о завершении процесса
+        :param process_pid: PID процесса
+        """
+        for queue in self.cpu_queues:
+            queue.on_process_finished(process_pid)
+        self.home_cpus.pop(process_pid, None)
+
+    def queue_lengths(self) -> List[int]:
+        """
+        Длины очередей к ЦП
+        """
+        return [len(queue) for queue in self.cpu_queues]
+
+    def clear(self) -> None:
+        """
+        Очистить все очереди планировщика
+        """
+        for queue in self.cpu_queues:
+            queue.clear()
+        self.io_queue.clear()
+        self.queued_cnt = 0
+        self.home_cpus.clear()
 
     def add_process_to_io_queue(self, process_pid: int) -> None:
         """
         Добавляет процесс в конец очереди.
         """
-        self.io_queue.append(process_pid)
+        self.io_queue.push(process_pid)
         self.stats.add_time_os_multi(self.stats.time_costs.t_global)
         self.stats.add_sys_time_os_multi(self.stats.time_costs.t_global)
 
@@ -53,5 +151,5 @@ class Scheduler:
         self.stats.add_time_os_multi(self.stats.time_costs.t_global)
         self.stats.add_sys_time_os_multi(self.stats.time_costs.t_global)
 
-        return self.io_queue.popleft()
+        return self.io_queue.pop()
 
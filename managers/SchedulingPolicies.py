@@ -0,0 +1,313 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+
+COMPACT_SLACK = 64  # допустимое число удалённых записей сверх числа процессов в очереди до её уплотнения
+
+
+class SchedulingPolicy(ABC):
+    """
+    Стратегия упорядочивания очереди готовых к выполнению процессов.
+    Ведёт себя как контейнер PID: проверка на пустоту, len, clear.
+    Удаление из очереди ленивое (O(1)): у каждого процесса в очереди есть номер его актуальной постановки,
+    удалённый процесс лишь забывает этот номер, а его запись пропускается при выборке
+    """
+    def __init__(self, proc_table_ptr: Dict) -> None:
+        """
+        :param proc_table_ptr: указатель на таблицу процессов (для получения параметров процессов)
+        """
+        self.proc_table = proc_table_ptr
+        self.entries: Dict[int, int] = {}  # PID процессов в очереди -> номер актуальной постановки
+        self.pushed = 0  # счетчик постановок в очередь
+
+    def new_entry(self, process_pid: int) -> int:
+        """
+        Зарегистрировать постановку процесса в очередь
+        :return: номер постановки
+        """
+        entry = self.pushed
+        self.entries[process_pid] = entry
+        self.pushed += 1
+        return entry
+
+    def take_entry(self, entry: int, process_pid: int) -> bool:
+        """
+        Проверить запись очереди при выборке: актуальная запись снимается с учёта
+        :return: True - запись актуальна, False - процесс был удалён из очереди (запись пропускается)
+        """
+        if self.entries.get(process_pid) != entry:
+            return False
+        del self.entries[process_pid]
+        return True
+
+    def remove(self, process_pid: int) -> bool:
+        """
+        Удалить процесс из очереди (например, при уничтожении ожидающего процесса)
+        :param process_pid: PID процесса
+        :return: True, если процесс был в очереди
+        """
+        if self.entries.pop(process_pid, None) is None:
+            return False
+        self.compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        Уплотнить очередь, если удалённых записей стало больше, чем актуальных
+        (амортизированно O(1) на удаление)
+        """
+        pass
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @abstractmethod
+    def push(self, process_pid: int) -> None:
+        """
+        Поместить процесс в очередь
+        :param process_pid: PID процесса
+        """
+        pass
+
+    @abstractmethod
+    def pop(self) -> int:
+        """
+        Извлечь следующий процесс для выполнения
+        :return: PID процесса
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def on_quantum_expired(self, process_pid: int) -> None:
+        """
+        Процесс израсходовал квант времени целиком (вызывается перед его возвратом в очередь)
+        :param process_pid: PID процесса
+        """
+        pass
+
+    def on_process_finished(self, process_pid: int) -> None:
+        """
+        Процесс завершён - можно забыть связанные с ним данные
+        :param process_pid: PID процесса
+        """
+        pass
+
+
+class FifoPolicy(SchedulingPolicy):
+    """
+    Очередь FIFO (вместе с квантованием - круговое планирование)
+    """
+    def __init__(self, proc_table_ptr: Dict) -> None:
+        super().__init__(proc_table_ptr)
+        self.queue: Deque[Tuple[int, int]] = deque()  # (номер постановки, PID)
+
+    def push(self, process_pid: int) -> None:
+        self.queue.append((self.new_entry(process_pid), process_pid))
+
+    def pop(self) -> int:
+        while True:
+            entry, process_pid = self.queue.popleft()
+            if self.take_entry(entry, process_pid):
+                return process_pid
+
+    def compact(self) -> None:
+        if len(self.queue) > 2 * len(self.entries) + COMPACT_SLACK:
+            self.queue = deque(item for item in self.queue if self.entries.get(item[1]) == item[0])
+
+    def clear(self) -> None:
+        self.queue.clear()
+        self.entries.clear()
+
+
+class HeapPolicy(SchedulingPolicy):
+    """
+    Очередь на двоичной куче: первым выбирается процесс с наименьшим ключом,
+    при равных ключах - поступивший раньше
+    """
+    def __init__(self, proc_table_ptr: Dict) -> None:
+        super().__init__(proc_table_ptr)
+        self.heap: List[Tuple[float, int, int]] = []  # (ключ, номер постановки, PID); номер постановки
+        # обеспечивает и устойчивость порядка
+
+    @abstractmethod
+    def key(self, process_pid: int) -> float:
+        """
+        Ключ упорядочивания процесса (вычисляется в момент постановки в очередь)
+        """
+        pass
+
+    def push(self, process_pid: int) -> None:
+        key = self.key(process_pid)
+        heapq.heappush(self.heap, (key, self.new_entry(process_pid), process_pid))
+
+    def pop_item(self) -> Tuple[float, int, int]:
+        """
+        Извлечь запись с наименьшим ключом, пропуская записи удалённых процессов
+        """
+        while True:
+            item = heapq.heappop(self.heap)
+            if self.take_entry(item[1], item[2]):
+                return item
+
+    def pop(self) -> int:
+        return self.pop_item()[2]
+
+    def compact(self) -> None:
+        if len(self.heap) > 2 * len(self.entries) + COMPACT_SLACK:
+            self.heap = [item for item in self.heap if self.entries.get(item[2]) == item[1]]
+            heapq.heapify(self.heap)
+
+    def clear(self) -> None:
+        self.heap.clear()
+        self.entries.clear()
+
+
+class PriorityPolicy(HeapPolicy):
+    """
+    Приоритетное планирование: меньшее значение Process.priority - более высокий приоритет
+    """
+    def key(self, process_pid: int) -> float:
+        process = self.proc_table.get(process_pid)
+        return process.priority if process is not None else 0
+
+
+class ShortestJobFirstPolicy(HeapPolicy):
+    """
+    Кратчайшее задание первым: ключ - общее число команд процесса
+    """
+    def key(self, process_pid: int) -> float:
+        process = self.proc_table.get(process_pid)
+        return process.process_commands_config.total_commands_cnt if process is not None else 0
+
+
+class ShortestRemainingTimePolicy(HeapPolicy):
+    """
+    Кратчайшее оставшееся время первым: ключ - число ещё не выполненных команд процесса.
+    Вытеснение выполняющегося процесса происходит по окончании кванта
+    """
+    def key(self, process_pid: int) -> float:
+        process = self.proc_table.get(process_pid)
+        if process is None:
+            return 0
+        return process.process_commands_config.total_commands_cnt - process.process_statistics.total_commands_counter
+
+
+class FairPolicy(HeapPolicy):
+    """
+    Справедливое планирование (в духе CFS): первым выбирается процесс с наименьшим виртуальным временем
+    выполнения. Виртуальное время - число выполненных команд плюс смещение, которое новый процесс
+    получает равным текущему минимальному виртуальному времени (чтобы не вытеснять всех остальных)
+    """
+    def __init__(self, proc_table_ptr: Dict) -> None:
+        super().__init__(proc_table_ptr)
+        self.min_vruntime = 0  # виртуальное время последнего выбранного процесса
+        self.offsets: Dict[int, int] = {}  # смещение виртуального времени процессов
+
+    def key(self, process_pid: int) -> float:
+        process = self.proc_table.get(process_pid)
+        if process is None:
+            return self.min_vruntime
+        if process_pid not in self.offsets:
+            self.offsets[process_pid] = self.min_vruntime - process.process_statistics.total_commands_counter
+        return self.offsets[process_pid] + process.process_statistics.total_commands_counter
+
+    def pop(self) -> int:
+        vruntime, _, process_pid = self.pop_item()
+        self.min_vruntime = max(self.min_vruntime, vruntime)
+        return process_pid
+
+    def on_process_finished(self, process_pid: int) -> None:
+        self.offsets.pop(process_pid, None)
+
+
+class MultiLevelFeedbackPolicy(SchedulingPolicy):
+    """
+    Многоуровневая очередь с обратной связью: новый процесс попадает на верхний уровень,
+    израсходовав квант целиком - опускается на уровень ниже. Выбирается процесс с самого верхнего
+    непустого уровня. Раз в boost_interval выборок все процессы поднимаются на верхний уровень
+    """
+    def __init__(self, proc_table_ptr: Dict, levels_cnt: int = 3, boost_interval: int = 0) -> None:
+        """
+        :param levels_cnt: число уровней
+        :param boost_interval: число выборок между подъёмами всех процессов наверх (0 - не поднимать)
+        """
+        super().__init__(proc_table_ptr)
+        if levels_cnt < 1:
+            raise RuntimeError(f"Неверное число уровней очереди ({levels_cnt})")
+        self.levels: List[Deque[Tuple[int, int]]] = [deque() for _ in range(levels_cnt)]  # (номер постановки, PID)
+        self.process_levels: Dict[int, int] = {}  # текущий уровень процессов
+        self.boost_interval = boost_interval
+        self.pops = 0  # число выборок с последнего подъёма
+
+    def push(self, process_pid: int) -> None:
+        self.levels[self.process_levels.get(process_pid, 0)].append((self.new_entry(process_pid), process_pid))
+
+    def pop(self) -> int:
+        self.pops += 1
+        if self.boost_interval and self.pops >= self.boost_interval:
+            self.boost()
+        for level in self.levels:
+            while level:
+                entry, process_pid = level.popleft()
+                if self.take_entry(entry, process_pid):
+                    return process_pid
+        raise IndexError("pop from an empty queue")
+
+    def compact(self) -> None:
+        if sum(len(level) for level in self.levels) > 2 * len(self.entries) + COMPACT_SLACK:
+            for i, level in enumerate(self.levels):
+                self.levels[i] = deque(item for item in level if self.entries.get(item[1]) == item[0])
+
+    def boost(self) -> None:
+        """
+        Поднять все процессы на верхний уровень
+        """
+        top = self.levels[0]
+        for level in self.levels[1:]:
+            top.extend(level)
+            level.clear()
+        self.process_levels.clear()
+        self.pops = 0
+
+    def clear(self) -> None:
+        for level in self.levels:
+            level.clear()
+        self.entries.clear()
+
+    def on_quantum_expired(self, process_pid: int) -> None:
+        level = self.process_levels.get(process_pid, 0)
+        self.process_levels[process_pid] = min(level + 1, len(self.levels) - 1)
+
+    def on_process_finished(self, process_pid: int) -> None:
+        self.process_levels.pop(process_pid, None)
+
+
+def create_scheduling_policy(name: str, proc_table_ptr: Dict, mlfq_levels: int = 3,
+                             mlfq_boost_interval: int = 0) -> SchedulingPolicy:
+    """
+    Создать стратегию планирования по имени из конфигурации
+    :param name: fifo, priority, sjf, srtf, mlfq, fair
+    :param proc_table_ptr: указатель на таблицу процессов
+    :param mlfq_levels: число уровней для mlfq
+    :param mlfq_boost_interval: период подъёма процессов для mlfq
+    """
+    match name:
+        case "fifo":
+            return FifoPolicy(proc_table_ptr)
+        case "priority":
+            return PriorityPolicy(proc_table_ptr)
+        case "sjf":
+            return ShortestJobFirstPolicy(proc_table_ptr)
+        case "srtf":
+            return ShortestRemainingTimePolicy(proc_table_ptr)
+        case "mlfq":
+            return MultiLevelFeedbackPolicy(proc_table_ptr, mlfq_levels, mlfq_boost_interval)
+        case "fair":
+            return FairPolicy(proc_table_ptr)
+        case _:
+            raise RuntimeError(f"Неизвестная стратегия планирования {name}")
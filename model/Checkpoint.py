@@ -0,0 +1,198 @@
+import dataclasses
+import dis
+import enum
+import functools
+import hashlib
+import importlib
+import io
+import os
+import pickle
+import pkgutil
+import struct
+import tempfile
+import types
+import zlib
+from typing import Iterator, Tuple
+
+
+MAGIC = b"OSMCHKPT"
+VERSION = 3
+# сигнатура, версия, отпечаток состава классов, размер сжатых данных, CRC32 сжатых данных
+HEADER = struct.Struct("<8sH8sQI")
+COMPRESSION_LEVEL = 1  # быстрое сжатие: снимки делаются часто
+LAYOUT_PACKAGES = ("abstractions", "devices", "managers", "model", "utils")  # пакеты классов модели
+
+
+def _stored_attributes(code: types.CodeType) -> Iterator[str]:
+    """
+    Имена атрибутов, которым присваиваются значения в коде функции (включая вложенные функции)
+    """
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == "STORE_ATTR":
+            yield instruction.argval
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _stored_attributes(const)
+
+
+def _class_layout(cls: type) -> Tuple[str, ...]:
+    """
+    Состав полей класса: поля dataclass, __slots__, атрибуты, присваиваемые в методах, и элементы перечисления
+    """
+    slots = getattr(cls, "__slots__", ())
+    names = {slots} if isinstance(slots, str) else set(slots)
+    if dataclasses.is_dataclass(cls):
+        names.update(f.name for f in dataclasses.fields(cls))
+    for member in vars(cls).values():
+        if isinstance(member, (staticmethod, classmethod)):
+            member = member.__func__
+        functions = (member.fget, member.fset) if isinstance(member, property) else (member,)
+        for function in functions:
+            code = getattr(function, "__code__", None)
+            if code is not None:
+                names.update(_stored_attributes(code))
+    if issubclass(cls, enum.Enum):
+        names.update(f"{item.name}={item.value!r}" for item in cls)
+    return tuple(sorted(names))
+
+
+@functools.lru_cache(maxsize=None)
+def layout_fingerprint() -> bytes:
+    """
+    Отпечаток состава полей всех классов модели (пакеты LAYOUT_PACKAGES). Меняется при добавлении,
+    удалении или переименовании полей и классов, поэтому снимок, сохранённый другой версией кода,
+    отвергается до распаковки, а не восстанавливается в несогласованном виде
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    layout = []
+    for package in LAYOUT_PACKAGES:
+        for module_info in pkgutil.iter_modules([os.path.join(root, package)]):
+            module = importlib.import_module(f"{package}.{module_info.name}")
+            for cls in vars(module).values():
+                if isinstance(cls, type) and cls.__module__ == module.__name__:
+                    bases = tuple(base.__qualname__ for base in cls.__bases__)
+                    layout.append((module.__name__, cls.__qualname__, bases, _class_layout(cls)))
+    return hashlib.sha256(repr(sorted(layout)).encode()).digest()[:8]
+
+
+def save_checkpoint(os_model, path: str) -> int:
+    """
+    Сохранить полное состояние модели в файл: модель целиком (таблица процессов, память, таблица сегментов,
+    очереди, устройства, статистика, счётчик PID и генератор случайных значений).
+    Данные сериализуются pickle и сжимаются zlib, в заголовок записывается отпечаток состава классов
+    (layout_fingerprint). Файл записывается во временный и затем подменяется, поэтому сбой во время сохранения
+    не портит предыдущий снимок
+    :param os_model: модель ОС
+    :param path: путь к файлу снимка
+    :return: размер файла снимка в байтах
+    """
+    payload = zlib.compress(pickle.dumps(os_model, protocol=pickle.HIGHEST_PROTOCOL), COMPRESSION_LEVEL)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, layout_fingerprint(), len(payload), zlib.crc32(payload)))
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return HEADER.size + len(payload)
+
+
+def load_checkpoint(path: str):
+    """
+    Восстановить модель из снимка. Счётчик PID и генератор случайных значений восстанавливаются вместе
+    с моделью, поэтому продолжение моделирования совпадает с исходным.
+    Снимок восстанавливается только тем же составом классов модели, которым он сохранён (layout_fingerprint).
+    Снимок распаковывается pickle, который при распаковке может выполнить произвольный код, поэтому
+    загружать можно только собственные снимки из доверенных источников
+    :param path: путь к файлу снимка
+    :return: модель ОС
+    """
+    with open(path, "rb") as f:
+        head = f.read(HEADER.size)
+        if len(head) < HEADER.size:
+            raise RuntimeError("Файл не является снимком состояния модели")
+        magic, version, layout, payload_size, crc = HEADER.unpack(head)
+        if magic != MAGIC:
+            raise RuntimeError("Файл не является снимком состояния модели")
+        if version != VERSION:
+            raise RuntimeError(f"Неподдерживаемая версия снимка состояния модели: {version}")
+        if layout != layout_fingerprint():
+            raise RuntimeError("Снимок состояния модели сохранён другой версией кода модели "
+                               "(состав полей классов не совпадает)")
+        payload = f.read(payload_size)
+    if len(payload) != payload_size or zlib.crc32(payload) != crc:
+        raise RuntimeError("Снимок состояния модели повреждён")
+
+    return pickle.loads(zlib.decompress(payload))
+
+
+class _ForkPickler(pickle.Pickler):
+    """
+    Сериализация модели для ветвления: объекты из shared не копируются - в копию модели
+    вместо них подставляются заранее подготовленные замены
+    """
+    def __init__(self, file, shared: dict) -> None:
+        """
+        :param file: буфер для сериализованных данных
+        :param shared: словарь {id объекта: (объект, замена в копии)}
+        """
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.shared = shared
+
+    def persistent_id(self, obj):
+        key = id(obj)
+        return key if key in self.shared else None
+
+
+class _ForkUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared: dict) -> None:
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, key):
+        return self.shared[key][1]
+
+
+def fork_archive_path(path: str) -> str:
+    """
+    Свободное имя файла архива статистики для ветви (рядом с архивом родителя)
+    :param path: путь к архиву родителя
+    """
+    fd, fork_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".fork-",
+                                     dir=os.path.dirname(path) or ".")
+    os.close(fd)
+    return fork_path
+
+
+def fork_model(os_model, archive_path: str = ""):
+    """
+    Создать независимую копию работающей модели (ветвь) в памяти, без записи на диск.
+    Физическая память не копируется: обе модели переходят на страничное хранилище с копированием
+    при записи (Memory.share). Для mmap файл образа памяти после ветвления перестаёт обновляться
+    (подключение к нему не показывает моделирование ни одной из ветвей); отображение закрывает последняя
+    из ветвей, закрывшая свою память (Memory.close). Архив статистики не копируется: записанное
+    до ветвления остаётся общим префиксом, новые записи ветвь пишет в свой файл (StatsArchive.fork).
+    Ветвь не записывает трассу нагрузки. Счётчик PID и генератор случайных значений копируются: без изменения параметров ветвь
+    повторяет моделирование родителя
+    :param os_model: модель ОС
+    :param archive_path: файл архива статистики ветви ("" - новый файл рядом с архивом родителя)
+    :return: модель ОС, продолжающая моделирование с текущего такта родителя
+    """
+    storage = os_model.physical_memory.share()
+    shared = {id(storage): (storage, storage.fork())}
+    archive = os_model.stats.archive
+    if archive is not None:
+        archive_path = archive_path or fork_archive_path(archive.path)
+        shared[id(archive)] = (archive, archive.fork(archive_path))
+    if os_model.trace_recorder is not None:
+        shared[id(os_model.trace_recorder)] = (os_model.trace_recorder, None)
+
+    buffer = io.BytesIO()
+    _ForkPickler(buffer, shared).dump(os_model)
+    buffer.seek(0)
+    child = _ForkUnpickler(buffer, shared).load()
+
+    if archive is not None:
+        child.config.statistics.archive_path = archive_path
+    child.config.workload.record_path = ""
+    return child
@@ -12,6 +12,11 @@ class RandomConfig:
 class MemoryConfig:
     total_memory: int = 1024
     proc_table_size: int = 64
+    fit_policy: str = "first_fit"  # стратегия выбора свободного блока: first_fit, next_fit, best_fit, worst_fit
+    memory_backend: str = "list"  # хранение физической памяти: list - список Python,
+    # compact - массив int64 с битовой картой инициализированных слов, mmap - то же в отображённом файле
+    memory_file: str = ""  # файл образа памяти для mmap ("" - временный файл); модель, восстановленная
+    # из снимка состояния, хранит память во временном файле и файл образа не изменяет
 
 
 # параметры ЦПр
@@ -47,6 +52,9 @@ class ProcessGenerationConfig:
     io_percentage_max: float = 0.5
     io_command_duration_min: int = 1
     io_command_duration_max: int = 5
+    priority_min: int = 0  # диапазон приоритетов процессов (меньше значение - выше приоритет)
+    priority_max: int = 0
+    pregenerate_commands: bool = False  # генерировать программу команд процесса целиком при допуске
 
 
 # генерация команд
@@ -68,6 +76,41 @@ class TimeCosts:
     # ввода-вывода
     t_load: float = 1  # затраты на загрузку нового задания
     t_global: float = 1  # затраты на общение с общими данными
+    t_migrate: float = 1  # затраты на перенос процесса из очереди другого ЦП
+
+
+# хранение статистики процессов
+@dataclass
+class StatisticsConfig:
+    retention_limit: int = -1  # число последних завершённых процессов, статистика которых хранится
+    # в памяти (-1 - хранить все)
+    archive_path: str = ""  # файл для выгрузки статистики вытесненных процессов ("" - не сохранять)
+
+
+# планирование процессов
+@dataclass
+class SchedulerConfig:
+    policy: str = "fifo"  # стратегия планирования: fifo, priority, sjf, srtf, mlfq, fair
+    mlfq_levels: int = 3  # число уровней для mlfq
+    mlfq_boost_interval: int = 0  # число выборок между подъёмами процессов наверх для mlfq (0 - не поднимать)
+    per_cpu_queues: bool = False  # своя очередь у каждого ЦП (с перехватом процессов простаивающими ЦП)
+    admission_policy: str = "fifo"  # стратегия допуска заданий из пула: fifo, smallest (наименьшее задание),
+    # packing (наибольшее задание, помещающееся в наибольший свободный блок)
+    job_pool_size: int = 0  # ёмкость пула заданий (0 - генерируемые процессы создаются сразу при допуске,
+    # пул заданий внешнего источника не ограничен)
+
+
+# источник нагрузки
+@dataclass
+class WorkloadConfig:
+    source: str = "synthetic"  # источник заданий: synthetic (генерация моделью), trace (воспроизведение трассы),
+    # swf (журнал заданий в формате SWF)
+    trace_path: str = ""  # файл трассы или журнала SWF для воспроизведения
+    record_path: str = ""  # файл для записи трассы допущенных процессов ("" - не записывать; при записи
+    # программы команд генерируются целиком при допуске)
+    swf_time_scale: float = 1.0  # число тактов в секунде журнала SWF
+    swf_commands_scale: float = 1.0  # число команд на секунду выполнения задания SWF
+    swf_memory_scale: float = 0.001  # число единиц памяти на КБ памяти задания SWF
 
 
 # основная структура-конфигурация
@@ -80,4 +123,7 @@ class OSConfig:
     process_generation: ProcessGenerationConfig = field(default_factory=ProcessGenerationConfig)
     command_generation: CommandGenerationConfig = field(default_factory=CommandGenerationConfig)
     random: RandomConfig = field(default_factory=RandomConfig)
-    time_costs: TimeCosts = field(default_factory=TimeCosts)
\ No newline at end of file
+    time_costs: TimeCosts = field(default_factory=TimeCosts)
+    statistics: StatisticsConfig = field(default_factory=StatisticsConfig)
+    scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
+    workload: WorkloadConfig = field(default_factory=WorkloadConfig)
\ No newline at end of file
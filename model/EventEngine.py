@@ -0,0 +1,145 @@
+import heapq
+from typing import List, Optional, Tuple
+
+from model.OSModel import OSModel
+
+
+class EventEngine:
+    """
+    Событийный движок моделирования.
+    Вместо того чтобы выполнять каждый такт, движок переводит часы модели сразу к ближайшему событию:
+    завершению ввода-вывода на контроллере, появлению места для нового процесса или пользовательской
+    инструкции. Такты, на которых хотя бы один ЦП выполняет команду, выполняются обычным perform_tick,
+    поэтому статистика полностью совпадает с потактовым движком.
+    """
+    def __init__(self, os_model: OSModel) -> None:
+        """
+        :param os_model: модель ОС
+        """
+        self.os_model = os_model
+        # очередь запланированных инструкций: куча (такт, порядковый номер, инструкция)
+        self.instructions: List[Tuple[int, int, object]] = []
+        self.instructions_scheduled = 0  # счетчик для сохранения порядка инструкций одного такта
+        self.ticks_skipped = 0  # число тактов, пропущенных без выполнения perform_tick
+
+    @property
+    def current_tick(self) -> int:
+        """Номер последнего выполненного такта"""
+        return self.os_model.stats.current_tick
+
+    def schedule_instruction(self, tick: int, instruction) -> None:
+        """
+        Запланировать выполнение инструкции пользователя (из abstractions.Control) после такта tick
+        :param tick: номер такта, после которого выполняется инструкция
+        :param instruction: инструкция с методом execute(os_model, osui)
+        """
+        heapq.heappush(self.instructions, (tick, self.instructions_scheduled, instruction))
+        self.instructions_scheduled += 1
+
+    def execute_due_instructions(self) -> None:
+        """
+        Выполнить все инструкции, срок которых наступил
+        """
+        while self.instructions and self.instructions[0][0] <= self.current_tick:
+            _, _, instruction = heapq.heappop(self.instructions)
+            instruction.execute(self.os_model, None)
+
+    def quiet_ticks(self) -> Optional[int]:
+        """
+        Вычислить, сколько ближайших тактов гарантированно не меняют состояние системы
+        (кроме счетчиков времени)
+        :return: число тактов (0 - следующий такт нужно выполнить обычным образом),
+        None - система простаивает без ограничения по времени
+        """
+        model = self.os_model
+        if model.kill_on_finishing and len(model.proc_table) == 0:
+            return 0
+        if model.interrupt_handler.interrupts_raised or model.memory_manager.to_clean:
+            return 0
+        if model.scheduler.has_queued_processes():
+            return 0
+        if len(model.dispatcher.idle_cpus) < len(model.cpus):
+            return 0  # хотя бы один ЦП выполняет процесс
+        arrival_wait = None  # число тактов до поступления очередного задания внешнего источника
+        table_full = model.memory_manager.get_current_proc_table_size() >= model.proc_table_size
+        if model.loading_processes_enabled and model.job_pool_enabled:
+            if not model.long_term_scheduler.is_full():
+                if model.job_source is None:
+                    return 0  # пул будет дополнен новыми заданиями
+                job = model.job_source.peek()
+                if job is not None:
+                    if job.arrival_tick <= self.current_tick:
+                        return 0  # на следующем такте задание поступит в пул
+                    arrival_wait = job.arrival_tick - self.current_tick
+            if not table_full and model.long_term_scheduler.can_admit(model.memory_manager.largest_free_block()):
+                return 0  # на следующем такте задание будет допущено
+        elif model.loading_processes_enabled and not table_full \
+                and model.calculate_available_memory() >= model.config.process_generation.min_memory:
+            return 0  # на следующем такте может быть загружен новый процесс
+
+        if model.scheduler.io_queue and model.dispatcher.idle_ios:
+            return 0
+
+        # контроллеры только ждут завершения операций, прерывание - на такте срабатывания таймера
+        nearest = model.io_timers.next_expiry()
+        io_wait = max(nearest - 1 - self.current_tick, 0) if nearest is not None else None
+        if io_wait is None or arrival_wait is None:
+            return io_wait if arrival_wait is None else arrival_wait
+        return min(io_wait, arrival_wait)
+
+    def skip_ticks(self, ticks: int) -> None:
+        """
+        Пропустить ticks тихих тактов, начислив всё, что начислил бы perform_tick
+        :param ticks: число тактов
+        """
+        model = self.os_model
+        started = model.profiler.start() if model.profiler.enabled else None
+        if model.loading_processes_enabled and not model.job_pool_enabled:
+            # на каждом такте попытка загрузки разыгрывает размер памяти нового процесса
+            for _ in range(ticks):
+                model.random_factory.generate_random_int_value(model.config.process_generation.min_memory,
+                                                               model.config.process_generation.max_memory)
+        model.stats.add_idle_ticks_os_multi(ticks)
+        model.stats.current_tick += ticks
+
+        model.io_timers.advance_to(model.stats.current_tick)  # таймеры на пропущенных тактах не срабатывают
+
+        model.stats.recalc_system_params()
+        model.stats.recalc_avg_process_params()
+        self.ticks_skipped += ticks
+        if started is not None:
+            model.profiler.mark("skip_ticks", started)
+
+    def advance(self, tick_limit: Optional[int] = None) -> int:
+        """
+        Продвинуть модель до следующего события (но не дальше такта tick_limit)
+        :param tick_limit: номер такта, дальше которого продвигаться нельзя (None - без ограничения)
+        :return: число тактов, на которое продвинулась модель
+        """
+        self.execute_due_instructions()
+        if not self.os_model.running:
+            return 0
+        if tick_limit is not None and self.current_tick >= tick_limit:
+            return 0
+
+        quiet = self.quiet_ticks()
+        bounds = [b for b in (quiet, tick_limit - self.current_tick if tick_limit is not None else None,
+                              self.instructions[0][0] - self.current_tick if self.instructions else None)
+                  if b is not None]
+        if quiet != 0 and not bounds:
+            raise RuntimeError("Система простаивает, а ограничение по тактам не задано.")
+        jump = min(bounds) if quiet != 0 else 0
+        if jump > 0:
+            self.skip_ticks(jump)
+            return jump
+        self.os_model.perform_tick()
+        return 1
+
+    def run(self, tick_limit: int) -> None:
+        """
+        Выполнять моделирование до такта tick_limit или до остановки модели
+        :param tick_limit: номер такта, до которого выполняется моделирование
+        """
+        while self.os_model.running and self.current_tick < tick_limit:
+            self.advance(tick_limit)
+        self.execute_due_instructions()
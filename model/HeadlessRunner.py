@@ -0,0 +1,148 @@
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from model.OSModel import OSModel
+from model.EventEngine import EventEngine
+
+
+# причины остановки прогона
+STOP_TICKS = "ticks"  # исчерпан бюджет тактов
+STOP_TIME = "time"  # исчерпан бюджет реального времени
+STOP_FINISHED = "finished"  # модель завершила работу сама (например, после finish)
+STOP_ERROR = "error"  # ошибка при выполнении такта
+
+# движки моделирования
+ENGINE_TICK = "tick"  # потактовый (OSModel.perform_tick на каждом такте)
+ENGINE_EVENT = "event"  # событийный (пропуск тактов без событий, model.EventEngine)
+
+
+@dataclass
+class RunLimits:
+    """
+    Класс-хранилище ограничений прогона без интерфейса
+    """
+    max_ticks: Optional[int] = None  # максимальное число тактов (None - без ограничения)
+    time_budget: Optional[float] = None  # бюджет реального времени в секундах (None - без ограничения)
+    finish_after: Optional[int] = None  # такт, после которого загрузка прекращается и модель
+    # дорабатывает текущие процессы (аналог команды finish)
+    engine: str = ENGINE_TICK  # движок моделирования
+    profile: bool = False  # замерять время фаз такта
+    checkpoint_path: Optional[str] = None  # файл снимка состояния модели (None - не сохранять)
+    checkpoint_interval: Optional[int] = None  # число тактов между сохранениями снимка
+
+
+@dataclass
+class RunResult:
+    """
+    Результат прогона модели без интерфейса
+    """
+    ticks: int = 0  # число выполненных тактов
+    wall_time: float = 0  # затраченное реальное время (в секундах)
+    stop_reason: str = STOP_TICKS  # причина остановки
+    error: Optional[str] = None  # текст ошибки (если прогон прерван ошибкой)
+    os_stats: dict = field(default_factory=dict)  # итоговые OSStats
+    avg_process_stats: dict = field(default_factory=dict)  # итоговые AvgProcessTimeStats
+    scheduler_stats: dict = field(default_factory=dict)  # длины очередей к ЦП и число перехватов процессов
+    interrupt_stats: dict = field(default_factory=dict)  # число обработанных прерываний и время обработки по типам
+    admission_stats: dict = field(default_factory=dict)  # пул заданий и время ожидания допуска
+    profile: dict = field(default_factory=dict)  # время фаз такта (если прогон профилировался)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, indent=2)
+
+
+class HeadlessRunner:
+    def __init__(self, os_model: OSModel, limits: RunLimits) -> None:
+        """
+        Прогон модели ОС без интерфейса и без программной задержки
+        :param os_model: модель ОС
+        :param limits: ограничения прогона
+        """
+        self.os_model = os_model
+        self.limits = limits
+        self.ticks = os_model.stats.current_tick  # число выполненных тактов (модель может быть восстановлена
+        # из снимка)
+        self.next_checkpoint = None  # такт, после которого сохраняется очередной снимок
+        if limits.checkpoint_path and limits.checkpoint_interval:
+            self.next_checkpoint = self.ticks + limits.checkpoint_interval
+        if limits.engine not in (ENGINE_TICK, ENGINE_EVENT):
+            raise ValueError(f"Неизвестный движок моделирования {limits.engine}")
+        self.event_engine = EventEngine(os_model) if limits.engine == ENGINE_EVENT else None
+        if limits.profile:
+            os_model.profiler.enabled = True
+
+    def budget_exhausted(self, started: float) -> Optional[str]:
+        """
+        Проверить, исчерпаны ли ограничения прогона
+        :param started: момент начала прогона (time.perf_counter)
+        :return: причина остановки или None, если прогон можно продолжать
+        """
+        if not self.os_model.running:
+            return STOP_FINISHED
+        if self.limits.max_ticks is not None and self.ticks >= self.limits.max_ticks:
+            return STOP_TICKS
+        if self.limits.time_budget is not None and time.perf_counter() - started >= self.limits.time_budget:
+            return STOP_TIME
+        return None
+
+    def start_finishing(self) -> None:
+        """
+        Перевести модель в режим завершения: новые процессы не загружаются,
+        после выполнения текущих модель заканчивает работу
+        """
+        self.os_model.loading_processes_enabled = False
+        self.os_model.kill_on_finishing = True
+
+    def advance(self) -> int:
+        """
+        Продвинуть модель выбранным движком
+        :return: число выполненных (или пропущенных) тактов
+        """
+        if self.event_engine is None:
+            self.os_model.perform_tick()
+            return 1
+        # событийный движок не должен перескакивать границы, на которых меняется режим прогона
+        boundaries = [b for b in (self.limits.max_ticks, self.limits.finish_after)
+                      if b is not None and b > self.ticks]
+        tick_limit = None
+        if boundaries:
+            tick_limit = self.event_engine.current_tick + min(boundaries) - self.ticks
+        return self.event_engine.advance(tick_limit)
+
+    def run(self) -> RunResult:
+        """
+        Выполнять такты моделирования до исчерпания одного из ограничений
+        :return: результат прогона
+        """
+        result = RunResult()
+        started = time.perf_counter()
+        while True:
+            reason = self.budget_exhausted(started)
+            if reason is not None:
+                result.stop_reason = reason
+                break
+            if self.limits.finish_after is not None and self.ticks == self.limits.finish_after:
+                self.start_finishing()
+            try:
+                self.ticks += self.advance()
+            except RuntimeError as e:
+                result.stop_reason = STOP_ERROR
+                result.error = str(e)
+                break
+            if self.next_checkpoint is not None and self.ticks >= self.next_checkpoint:
+                self.os_model.save_checkpoint(self.limits.checkpoint_path)
+                self.next_checkpoint = self.ticks + self.limits.checkpoint_interval
+
+        result.ticks = self.ticks
+        result.wall_time = time.perf_counter() - started
+        result.os_stats = asdict(self.os_model.stats.os_stats)
+        result.avg_process_stats = asdict(self.os_model.stats.avg_process_stats)
+        result.scheduler_stats = {"queue_lengths": self.os_model.scheduler.queue_lengths(),
+                                  "steals": list(self.os_model.scheduler.steals)}
+        result.interrupt_stats = self.os_model.interrupt_handler.get_interrupt_stats()
+        result.admission_stats = self.os_model.long_term_scheduler.get_admission_stats()
+        if self.os_model.profiler.enabled:
+            result.profile = self.os_model.profiler.report()
+        return result
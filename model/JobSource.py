@@ -0,0 +1,206 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from abstractions.Job import Job
+from abstractions.Process import ProcessCommandsConfig
+from model.Config import WorkloadConfig, ProcessGenerationConfig
+from utils.SwfTrace import SwfRecord, read_swf_record
+from utils.WorkloadTrace import read_header, read_job
+
+
+class JobSource(ABC):
+    """
+    Внешний источник заданий. Задания читаются по одному и выдаются по порядку; очередное задание
+    остаётся в голове источника, пока модель его не заберёт
+    """
+    def __init__(self) -> None:
+        self.head: Optional[Job] = None  # очередное задание, ещё не забранное моделью
+        self.jobs_read = 0  # число прочитанных заданий
+        self.exhausted = False  # задания закончились
+
+    @abstractmethod
+    def read_job(self) -> Optional[Job]:
+        """
+        Прочитать следующее задание (None - задания закончились)
+        """
+        pass
+
+    def peek(self) -> Optional[Job]:
+        """
+        Очередное задание (None - задания закончились)
+        """
+        if self.head is None and not self.exhausted:
+            self.head = self.read_job()
+            if self.head is None:
+                self.exhausted = True
+                self.close()
+            else:
+                self.jobs_read += 1
+        return self.head
+
+    def pop(self) -> Job:
+        """
+        Забрать очередное задание
+        """
+        job = self.peek()
+        if job is None:
+            raise RuntimeError("Задания источника закончились")
+        self.head = None
+        return job
+
+    def close(self) -> None:
+        """
+        Освободить ресурсы источника
+        """
+        pass
+
+
+class FileJobSource(JobSource):
+    """
+    Источник заданий, читающий файл. Открытый файл не сохраняется в снимке состояния:
+    при восстановлении он открывается заново с сохранённой позиции
+    """
+    def __init__(self, path: str) -> None:
+        """
+        :param path: путь к файлу
+        """
+        super().__init__()
+        self.path = path
+        self.file = self.open_file()
+
+    @abstractmethod
+    def open_file(self):
+        """
+        Открыть файл источника на чтение
+        """
+        pass
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        file = state.pop("file")
+        state["file_position"] = None if file.closed else file.tell()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        position = state.pop("file_position")
+        self.__dict__.update(state)
+        self.file = self.open_file()
+        if position is None:
+            self.file.close()
+        else:
+            self.file.seek(position)
+
+
+class TraceJobSource(FileJobSource):
+    """
+    Воспроизведение записанной трассы нагрузки (utils.WorkloadTrace). Файл читается потоково
+    """
+    def __init__(self, path: str) -> None:
+        """
+        :param path: путь к файлу трассы
+        """
+        super().__init__(path)
+        read_header(self.file)
+
+    def open_file(self):
+        return open(self.path, "rb")
+
+    def read_job(self) -> Optional[Job]:
+        return read_job(self.file)
+
+
+class SwfJobSource(FileJobSource):
+    """
+    Задания из журнала вычислительного кластера в формате SWF (utils.SwfTrace). Файл читается потоково.
+    Время поступления переводится в такты от первого задания, время выполнения - в число команд,
+    память - в единицы памяти модели (в пределах размеров процессов из конфигурации). Доля команд
+    ввода-вывода - доля времени выполнения, не занятая процессором. Задания без времени выполнения
+    (отменённые до запуска) пропускаются
+    """
+    def __init__(self, path: str, time_scale: float, commands_scale: float, memory_scale: float,
+                 memory_min: int, memory_max: int, io_ratio_default: float) -> None:
+        """
+        :param path: путь к файлу журнала
+        :param time_scale: число тактов в секунде журнала
+        :param commands_scale: число команд на секунду выполнения задания
+        :param memory_scale: число единиц памяти модели на КБ памяти задания
+        :param memory_min: минимальный размер памяти процесса
+        :param memory_max: максимальный размер памяти процесса
+        :param io_ratio_default: доля команд ввода-вывода, если процессорное время задания неизвестно
+        """
+        super().__init__(path)
+        self.time_scale = time_scale
+        self.commands_scale = commands_scale
+        self.memory_scale = memory_scale
+        self.memory_min = memory_min
+        self.memory_max = memory_max
+        self.io_ratio_default = io_ratio_default
+
+        self.first_submit_time: Optional[float] = None  # время поступления первого задания журнала
+        self.last_arrival_tick = 0  # такт поступления предыдущего задания (такты не убывают)
+        self.jobs_skipped = 0  # число пропущенных заданий
+
+    def open_file(self):
+        return open(self.path, "r", encoding="utf-8")
+
+    def read_job(self) -> Optional[Job]:
+        while True:
+            record = read_swf_record(self.file)
+            if record is None:
+                return None
+            job = self.make_job(record)
+            if job is not None:
+                return job
+            self.jobs_skipped += 1
+
+    def make_job(self, record: SwfRecord) -> Optional[Job]:
+        """
+        Перевести задание журнала в задание модели
+        :param record: задание журнала
+        :return: задание или None, если задание не выполнялось
+        """
+        if record.run_time <= 0 or record.submit_time < 0:
+            return None
+        if self.first_submit_time is None:
+            self.first_submit_time = record.submit_time
+        arrival_tick = max(round((record.submit_time - self.first_submit_time) * self.time_scale),
+                           self.last_arrival_tick)
+        self.last_arrival_tick = arrival_tick
+
+        commands_config = ProcessCommandsConfig()
+        commands_config.total_commands_cnt = max(round(record.run_time * self.commands_scale), 1)
+        if record.average_cpu_time >= 0:
+            commands_config.io_command_ratio = round(1 - min(record.average_cpu_time / record.run_time, 1), 2)
+        else:
+            commands_config.io_command_ratio = self.io_ratio_default
+
+        memory_size = self.memory_min
+        if record.memory_kb > 0:
+            memory_size = min(max(round(record.memory_kb * self.memory_scale), self.memory_min), self.memory_max)
+        return Job(arrival_tick, memory_size, commands_config=commands_config)
+
+
+def create_job_source(workload: WorkloadConfig, process_generation: ProcessGenerationConfig) -> Optional[JobSource]:
+    """
+    Создать источник заданий по конфигурации
+    :param workload: параметры источника нагрузки (workload.source: synthetic - задания генерируются моделью
+    и источник не нужен, trace, swf)
+    :param process_generation: параметры генерации процессов (диапазоны памяти и доли ввода-вывода)
+    """
+    match workload.source:
+        case "synthetic":
+            return None
+        case "trace":
+            return TraceJobSource(workload.trace_path)
+        case "swf":
+            return SwfJobSource(workload.trace_path, workload.swf_time_scale, workload.swf_commands_scale,
+                                workload.swf_memory_scale, process_generation.min_memory,
+                                process_generation.max_memory,
+                                round((process_generation.io_percentage_min +
+                                       process_generation.io_percentage_max) / 2, 2))
+        case _:
+            raise RuntimeError(f"Неизвестный источник заданий {workload.source}")
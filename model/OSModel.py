@@ -1,17 +1,27 @@
 import json
 import time
-import random
 from typing import Optional
 
 from model.Config import OSConfig, MemoryConfig, CPUConfig, IOConfig, SpeedConfig, \
-    ProcessGenerationConfig, CommandGenerationConfig, RandomConfig, TimeCosts
+    ProcessGenerationConfig, CommandGenerationConfig, RandomConfig, TimeCosts, StatisticsConfig, SchedulerConfig, \
+    WorkloadConfig
 from abstractions.Speed import Speed
 from managers.Scheduler import Scheduler
+from managers.SchedulingPolicies import create_scheduling_policy
+from managers.AdmissionPolicies import create_admission_policy
+from managers.LongTermScheduler import LongTermScheduler
 from devices.CPU import CPU, CPUState
 from devices.IOController import IOController, IOControllerState
 from managers.MemoryManager import MemoryManager
-from abstractions.Process import Process, ProcessCommandsConfig, ProcessMemoryConfig, ProcessState
+from managers.FreeSpaceIndex import FitPolicy
+from abstractions.CommandProgram import CommandProgram, KIND_IO
+from abstractions.Job import Job
+from abstractions.Process import Process, PidAllocator, ProcessCommandsConfig, ProcessMemoryConfig, ProcessState
 from utils.RandomFactory import RandomFactory
+from utils.TimerWheel import TimerWheel
+from utils.Profiler import Profiler, TICK_PHASE
+from utils.WorkloadTrace import TraceWriter
+from model.JobSource import JobSource, create_job_source
 from devices.Memory import Memory
 from managers.InterruptHandler import InterruptHandler
 from managers.Dispatcher import Dispatcher
@@ -19,36 +29,46 @@ from abstractions.Statistics import Statistics, ProcessTimeStats, ProcessTimeRec
 
 
 class OSModel:
-    def __init__(self, config_path: str) -> None:
+    def __init__(self, config_path: str = "", config: Optional[OSConfig] = None) -> None:
         """
-        Инициализация модели ОС из JSON-файла.
+        Инициализация модели ОС из JSON-файла или готовой конфигурации.
         :param config_path: путь к JSON-файлу с параметрами
+        :param config: параметры модели (если заданы, файл не читается)
         """
         self.running = False
 
         self.proc_table = dict()  # таблица процессов: dict [int, Process] (Доступ по PID)
 
-        self.config = self.load_config(config_path)
+        self.config = config if config is not None else self.load_config(config_path)
         # статистика
-        self.stats = Statistics(self.config.time_costs, self.proc_table)
+        self.stats = Statistics(self.config.time_costs, self.proc_table, self.config.statistics)
 
-        # устанавливаем сид для воспроизводимости значений
-        if self.config.random.random_seed != -1:
-            random.seed(self.config.random.random_seed)
+        # собственные генератор случайных значений (сид - для воспроизводимости значений) и счётчик PID модели
+        self.random_factory = RandomFactory(self.config.random.random_seed)
+        self.pid_allocator = PidAllocator()
 
-        self.physical_memory = Memory(self.config.memory.total_memory, self.stats)  # структура эмулирующая
-        # физическую память процессов
+        # структура эмулирующая физическую память процессов
+        self.physical_memory = Memory(self.config.memory.total_memory, self.stats,
+                                      self.config.memory.memory_backend, self.config.memory.memory_file)
         self.proc_table_size = self.config.memory.proc_table_size  # максимальное число процессов
-        self.memory_manager = MemoryManager(self.physical_memory, self.proc_table)  # класс для управления памятью
-        # процессов
+        # класс для управления памятью процессов
+        self.memory_manager = MemoryManager(self.physical_memory, self.proc_table,
+                                            FitPolicy(self.config.memory.fit_policy))
 
         # центральные процессоры
         self.cpus = [CPU(self.physical_memory, i, self.config.cpu.quantum_size) for i in range(self.config.cpu.cpus_num)]
         # контроллеры ввода-вывода
-        self.io_controllers = [IOController(i) for i in range(self.config.io.ios_num)]
+        # таймеры завершения операций ввода-вывода
+        self.io_timers = TimerWheel()
+        self.io_controllers = [IOController(i, self.io_timers) for i in range(self.config.io.ios_num)]
 
         self.speed_manager = Speed(self.config)  # инициализация параметров, связанных со скоростью
-        self.scheduler = Scheduler(self.stats)  # инициализация планировщика и его структур
+        # инициализация планировщика и его структур (общая очередь к ЦП или очередь у каждого ЦП)
+        cpu_queues_num = self.config.cpu.cpus_num if self.config.scheduler.per_cpu_queues else 1
+        self.scheduler = Scheduler(self.stats, [create_scheduling_policy(self.config.scheduler.policy, self.proc_table,
+                                                                         self.config.scheduler.mlfq_levels,
+                                                                         self.config.scheduler.mlfq_boost_interval)
+                                                for _ in range(cpu_queues_num)])
 
         # регулировщик
         self.dispatcher = Dispatcher(self.memory_manager, self.cpus, self.io_controllers, self.scheduler, self.stats)
@@ -56,11 +76,60 @@ class OSModel:
         self.interrupt_handler = InterruptHandler(self.cpus, self.io_controllers, self.scheduler,
                                                   self.dispatcher, self.memory_manager, self.stats)
 
+        # внешний источник заданий (None - процессы генерируются моделью) и запись трассы допущенных процессов
+        self.job_source: Optional[JobSource] = create_job_source(self.config.workload,
+                                                                 self.config.process_generation)
+        # долгосрочный планировщик: пул поступивших заданий, ожидающих допуска (задания внешнего источника
+        # всегда проходят через пул, генерируемые - при заданной ёмкости пула)
+        self.long_term_scheduler = LongTermScheduler(self.stats,
+                                                     create_admission_policy(self.config.scheduler.admission_policy),
+                                                     self.config.scheduler.job_pool_size)
+        self.job_pool_enabled = self.job_source is not None or self.config.scheduler.job_pool_size > 0
+        self.trace_recorder: Optional[TraceWriter] = (
+            TraceWriter(self.config.workload.record_path) if self.config.workload.record_path else None
+        )
+        # программы процессов генерируются целиком (для записи трассы нужна полная программа); режим задаётся
+        # один раз, поэтому ветвь модели, не записывающая трассу, генерирует команды так же, как родитель
+        self.pregenerate_programs = (self.config.process_generation.pregenerate_commands or
+                                     self.trace_recorder is not None)
+
+        self.profiler = Profiler()  # профилировщик фаз такта (включается во время работы)
+
         self.loading_processes_enabled = True
         self.running = True
         self.kill_on_finishing = False
         return
 
+    def save_checkpoint(self, path: str) -> int:
+        """
+        Сохранить полное состояние модели в файл снимка (model.Checkpoint)
+        :param path: путь к файлу снимка
+        :return: размер файла снимка в байтах
+        """
+        from model.Checkpoint import save_checkpoint
+        return save_checkpoint(self, path)
+
+    @staticmethod
+    def load_checkpoint(path: str) -> "OSModel":
+        """
+        Восстановить модель из файла снимка (model.Checkpoint)
+        :param path: путь к файлу снимка
+        :return: модель ОС, продолжающая моделирование с сохранённого такта
+        """
+        from model.Checkpoint import load_checkpoint
+        return load_checkpoint(path)
+
+    def fork(self, archive_path: str = "") -> "OSModel":
+        """
+        Создать независимую копию модели в текущем состоянии для моделирования вариантов
+        (model.Checkpoint.fork_model). Физическая память и архив статистики разделяются с копированием
+        при записи. Каждая из моделей по завершении закрывает свою память (physical_memory.close())
+        :param archive_path: файл архива статистики копии ("" - новый файл рядом с архивом модели)
+        :return: копия модели
+        """
+        from model.Checkpoint import fork_model
+        return fork_model(self, archive_path)
+
     def load_config(self, path: str) -> OSConfig:
         """
         Загружает конфиг модели ОС.
@@ -72,7 +141,14 @@ class OSModel:
         except (FileNotFoundError, json.JSONDecodeError):
             print("Конфиг не найден или поврежден. Будут загружены значения по умолчанию.")
             return OSConfig()
+        return OSModel.parse_config(data)
 
+    @staticmethod
+    def parse_config(data: dict) -> OSConfig:
+        """
+        Собрать конфиг модели ОС из словаря (содержимого JSON-файла).
+        Отсутствующие секции и параметры получают значения по умолчанию.
+        """
         def load_section(cls, section_name: str):
             section = data.get(section_name, {})
             if isinstance(section, dict):
@@ -88,7 +164,10 @@ class OSModel:
             process_generation=load_section(ProcessGenerationConfig, "process_generation"),
             command_generation=load_section(CommandGenerationConfig, "command_generation"),
             random=load_section(RandomConfig, "random"),
-            time_costs=load_section(TimeCosts, "time_costs")
+            time_costs=load_section(TimeCosts, "time_costs"),
+            statistics=load_section(StatisticsConfig, "statistics"),
+            scheduler=load_section(SchedulerConfig, "scheduler"),
+            workload=load_section(WorkloadConfig, "workload")
         )
 
     @property
@@ -130,14 +209,16 @@ class OSModel:
 
     def load_new_task(self, process: Process) -> int:
         """
-        Загрузка новой задачи, если есть место в таблице процессов и достаточно памяти
+        Загрузка новой задачи, если есть место в таблице процессов и процессу выделена память
+        (память выделяется при создании процесса, поэтому повторно свободная память не проверяется)
         :param process: задача (процесс) на загрузку
         :return: PID загруженного процесса
         """
         if self.memory_manager.get_current_proc_table_size() >= self.proc_table_size:
             raise RuntimeError("Достигнуто максимальное количество загруженных задач.")
 
-        if self.calculate_available_memory() < process.process_memory_config.block_size:
+        block_owner, _ = self.memory_manager.memory_map.get(process.process_memory_config.block_start, (None, 0))
+        if block_owner != process.pid:
             raise RuntimeError("Недостаточно памяти для загрузки нового процесса.")
 
         self.memory_manager.load_process(process.pid, process)
@@ -165,8 +246,7 @@ class OSModel:
         self.proc_table.clear()
 
         # очистка планировщика
-        self.scheduler.cpu_queue.clear()
-        self.scheduler.io_queue.clear()
+        self.scheduler.clear()
 
         # очистка CPU
         for cpu in self.cpus:
@@ -177,44 +257,169 @@ class OSModel:
 
         # очистка IO-контроллеров
         for io in self.io_controllers:
-            io.current_ticks_executed = 0
-            io.total_ticks_executed = 0
             io.current_process = None
             io.current_state = IOControllerState.IDLE
+            io.finished_ticks_executed = 0
+
+        # очистка индекса устройств, на которых выполняются процессы
+        self.dispatcher.process_devices.clear()
 
         # очистка памяти (логическая)
-        self.physical_memory.physical_memory = [None] * self.physical_memory.physical_memory_size
+        self.physical_memory.reset()
 
         # очистка менеджера памяти
-        self.memory_manager.memory_map.clear()
-        self.memory_manager.available_memory = self.physical_memory.physical_memory_size
+        self.memory_manager.reset()
+
+        # сброс на диск вытесненной статистики процессов
+        self.stats.close_archive()
+
+        # закрытие файлов трасс нагрузки
+        self.long_term_scheduler.clear()
+        self.close_workload()
         self.running = False
         return
 
+    def close_workload(self) -> None:
+        """
+        Закрыть источник заданий и записываемую трассу
+        """
+        if self.job_source is not None:
+            self.job_source.close()
+        if self.trace_recorder is not None:
+            self.trace_recorder.close()
+
     def generate_process(self) -> Optional[Process]:
+        """
+        Создать новый процесс (допустить задание из пула или сгенерировать) и выделить ему память
+        :return: процесс или None, если процесс не может быть создан на этом такте
+        """
+        if self.job_pool_enabled:
+            return self.admit_job()
+        new_process = self.generate_synthetic_process()
+        if new_process is not None:
+            self.record_job(self.stats.current_tick, new_process)
+        return new_process
+
+    def record_job(self, arrival_tick: int, process: Process) -> None:
+        """
+        Записать допущенный процесс в трассу нагрузки (если она записывается)
+        :param arrival_tick: такт поступления задания
+        :param process: процесс
+        """
+        if self.trace_recorder is not None:
+            self.trace_recorder.write(Job(arrival_tick, process.process_memory_config.block_size,
+                                          process.priority, process.program))
+
+    def submit_jobs(self) -> None:
+        """
+        Поместить в пул поступившие к текущему такту задания источника (для генерируемых заданий -
+        дополнить пул до заполнения)
+        """
+        if self.job_source is None:
+            # генерируется столько заданий, сколько мест в пуле, даже если часть из них будет отвергнута
+            for _ in range(self.long_term_scheduler.pool_capacity - len(self.long_term_scheduler)):
+                self.submit_job(self.generate_job())
+            return
+        while not self.long_term_scheduler.is_full():
+            job = self.job_source.peek()
+            if job is None or job.arrival_tick > self.stats.current_tick:
+                return
+            self.submit_job(self.job_source.pop())
+
+    def submit_job(self, job: Job) -> None:
+        """
+        Поместить задание в пул. Задание, которому нужно больше памяти, чем есть в модели, отвергается:
+        в пуле оно никогда не было бы допущено и задерживало бы задания за собой
+        :param job: поступившее задание
+        """
+        if job.memory_size > self.config.memory.total_memory:
+            self.long_term_scheduler.reject(job)
+        else:
+            self.long_term_scheduler.submit(job)
+
+    def admit_job(self) -> Optional[Process]:
+        """
+        Допустить задание из пула, выбранное долгосрочным планировщиком. Задание выбирается среди
+        помещающихся в наибольший свободный блок памяти, поэтому выделение памяти всегда успешно
+        :return: процесс или None, если сейчас ни одно задание не может быть допущено
+        """
+        self.submit_jobs()
+        if self.memory_manager.get_current_proc_table_size() >= self.proc_table_size:
+            return None
+        job = self.long_term_scheduler.admit(self.memory_manager.largest_free_block(), self.stats.current_tick)
+        if job is None:
+            return None
+
+        if job.program is not None:
+            commands_config = ProcessCommandsConfig()
+            commands_config.total_commands_cnt = len(job.program)
+            commands_config.io_command_ratio = \
+                round(job.program.kinds.count(KIND_IO) / len(job.program), 1) if len(job.program) else 0
+        else:
+            commands_config = job.commands_config
+        commands_config.min_operand = self.config.command_generation.operand_min
+        commands_config.max_operand = self.config.command_generation.operand_max
+        commands_config.io_command_duration_min = self.config.process_generation.io_command_duration_min
+        commands_config.io_command_duration_max = self.config.process_generation.io_command_duration_max
+
+        new_process = Process(ph_memory_ptr=self.physical_memory, pid_allocator=self.pid_allocator,
+                              random_factory=self.random_factory,
+                              process_commands_config=commands_config,
+                              process_memory_info=ProcessMemoryConfig(block_size=job.memory_size))
+        new_process.priority = job.priority
+
+        self.place_process(new_process,
+                           self.memory_manager.allocate_memory_for_process(new_process.pid, job.memory_size))
+        if job.program is not None:
+            job.program.bind(new_process.process_memory_config.operands_block_address)
+            new_process.program = job.program
+        else:
+            self.pregenerate_program(new_process)
+        self.record_job(job.arrival_tick, new_process)
+        return new_process
+
+    def pregenerate_program(self, process: Process) -> None:
+        """
+        Сгенерировать программу команд процесса целиком, если это требуется (pregenerate_programs; зерно -
+        одна величина из генератора модели)
+        :param process: процесс, которому выделена память
+        """
+        if self.pregenerate_programs:
+            process.program = CommandProgram.generate(
+                process.process_commands_config, self.random_factory.generate_random_int_value(0, 2 ** 32 - 1),
+                process.process_memory_config.operands_block_address)
+
+    def place_process(self, process: Process, block_start: int) -> None:
+        """
+        Выставить процессу адреса выделенного блока памяти
+        :param process: процесс
+        :param block_start: начало блока памяти процесса
+        """
+        process.process_memory_config.block_start = block_start
+        process.process_memory_config.result_block_address = \
+            block_start + self.config.command_generation.result_block_shift
+        process.process_memory_config.operands_block_address = \
+            block_start + self.config.command_generation.operands_block_shift
+
+    def generate_synthetic_process(self) -> Optional[Process]:
+        """
+        Сгенерировать новый процесс со случайными параметрами и выделить ему память
+        :return: процесс или None, если для него нет места
+        """
         new_process = None
-        new_process_memory = RandomFactory.generate_random_int_value(self.config.process_generation.min_memory,
-                                                                     self.config.process_generation.max_memory)
+        new_process_memory = self.random_factory.generate_random_int_value(
+            self.config.process_generation.min_memory, self.config.process_generation.max_memory)
         if self.calculate_available_memory() >= new_process_memory \
                 and self.memory_manager.get_current_proc_table_size() < self.proc_table_size:
             # генерация параметров
-            commands_config = ProcessCommandsConfig()
-            commands_config.total_commands_cnt = \
-                RandomFactory.generate_random_int_value(self.config.process_generation.total_commands_min,
-                                                        self.config.process_generation.total_commands_max)
-            commands_config.io_command_ratio = \
-                RandomFactory.generate_random_float_value(self.config.process_generation.io_percentage_min,
-                                                          self.config.process_generation.io_percentage_max, 1)
-            commands_config.min_operand = self.config.command_generation.operand_min
-            commands_config.max_operand = self.config.command_generation.operand_max
-            commands_config.io_command_duration_min = self.config.process_generation.io_command_duration_min
-            commands_config.io_command_duration_max = self.config.process_generation.io_command_duration_max
-
+            commands_config = self.generate_commands_config()
             memory_config = ProcessMemoryConfig(block_size=new_process_memory)
 
-            new_process = Process(ph_memory_ptr=self.physical_memory,
+            new_process = Process(ph_memory_ptr=self.physical_memory, pid_allocator=self.pid_allocator,
+                                  random_factory=self.random_factory,
                                   process_commands_config=commands_config,
                                   process_memory_info=memory_config)
+            new_process.priority = self.generate_priority()
 
             # выделение памяти под процесс
             block_start = self.memory_manager.allocate_memory_for_process(new_process.pid,
@@ -223,13 +428,49 @@ class OSModel:
             if block_start == -1:
                 return None
 
-            new_process.process_memory_config.block_start = block_start
+            self.place_process(new_process, block_start)
 
-            new_process.process_memory_config.result_block_address = block_start + self.config.command_generation.result_block_shift
-            new_process.process_memory_config.operands_block_address = block_start + self.config.command_generation.operands_block_shift
+            self.pregenerate_program(new_process)
 
         return new_process
 
+    def generate_commands_config(self) -> ProcessCommandsConfig:
+        """
+        Сгенерировать параметры команд нового процесса
+        """
+        commands_config = ProcessCommandsConfig()
+        commands_config.total_commands_cnt = \
+            self.random_factory.generate_random_int_value(self.config.process_generation.total_commands_min,
+                                                          self.config.process_generation.total_commands_max)
+        commands_config.io_command_ratio = \
+            self.random_factory.generate_random_float_value(self.config.process_generation.io_percentage_min,
+                                                            self.config.process_generation.io_percentage_max, 1)
+        commands_config.min_operand = self.config.command_generation.operand_min
+        commands_config.max_operand = self.config.command_generation.operand_max
+        commands_config.io_command_duration_min = self.config.process_generation.io_command_duration_min
+        commands_config.io_command_duration_max = self.config.process_generation.io_command_duration_max
+        return commands_config
+
+    def generate_priority(self) -> int:
+        """
+        Сгенерировать приоритет нового процесса. Приоритет разыгрывается только при заданном диапазоне;
+        при совпадающих границах все процессы получают priority_min (последовательность случайных величин
+        не меняется)
+        """
+        if self.config.process_generation.priority_max > self.config.process_generation.priority_min:
+            return self.random_factory.generate_random_int_value(self.config.process_generation.priority_min,
+                                                                 self.config.process_generation.priority_max)
+        return self.config.process_generation.priority_min
+
+    def generate_job(self) -> Job:
+        """
+        Сгенерировать задание со случайными параметрами (поступает в пул на текущем такте)
+        """
+        memory_size = self.random_factory.generate_random_int_value(self.config.process_generation.min_memory,
+                                                                    self.config.process_generation.max_memory)
+        commands_config = self.generate_commands_config()
+        return Job(self.stats.current_tick, memory_size, self.generate_priority(), commands_config=commands_config)
+
     def fill_processes_if_possible(self) -> None:
         """
         Заполняет память новыми процессами до достижения лимита.
@@ -255,35 +496,77 @@ class OSModel:
         Выполняет один такт моделирования. В его ходе:
         - если возможно, генерируются новые процессы в таблице процессов
         - каждый ЦП выполняет такт моделирования
-        - каждый IO выполняет такт моделирования
+        - контроллеры IO, операции которых завершились, вызывают прерывания
         - обработчик прерываний обрабатывает накопленные прерывания
-        - регулировщик проверяет состояния ЦП (на всякий случай)
-        - регулировщик проверяет состояния IO (на всякий случай)
+        - регулировщик загружает процессы на простаивающие ЦП (на всякий случай)
+        - регулировщик загружает процессы на простаивающие IO (на всякий случай)
         - менеджер памяти освобождает ресурсы завершенных в ходе такта процессов
         """
+        if self.profiler.enabled:
+            self.perform_tick_profiled()
+            return
         if self.kill_on_finishing and len(self.proc_table) == 0:
             self.terminate()
         self.fill_processes_if_possible()
-        self.stats.add_runtime_to_processes(self.proc_table)
         self.stats.add_time_os_multi(1)
+        self.stats.add_tick()
 
         for cpu in self.cpus:
             cpu.execute_tick()
 
-        for io in self.io_controllers:
-            io.execute_tick()
+        # контроллеры ввода-вывода, операции которых завершились на этом такте
+        for io in sorted(self.io_timers.advance_to(self.stats.current_tick), key=lambda io: io.device_id):
+            io.complete_io()
 
         self.interrupt_handler.handle_interrupts()
 
-        for cpu in self.cpus:
-            self.dispatcher.dispatch_cpu(cpu)
-
-        for io in self.io_controllers:
-            self.dispatcher.dispatch_io(io)
+        self.dispatcher.dispatch_idle_cpus()
+        self.dispatcher.dispatch_idle_ios()
 
         self.stats.recalc_system_params()
         self.stats.recalc_avg_process_params()
 
         self.memory_manager.free_resources()
+        self.stats.trim_finished_processes()
 
         return
+
+    def perform_tick_profiled(self) -> None:
+        """
+        Выполняет такт моделирования (те же фазы, что perform_tick) с замером времени каждой фазы
+        """
+        profiler = self.profiler
+        tick_started = started = profiler.start()
+        if self.kill_on_finishing and len(self.proc_table) == 0:
+            self.terminate()
+        self.fill_processes_if_possible()
+        started = profiler.mark("fill", started)
+        self.stats.add_time_os_multi(1)
+        self.stats.add_tick()
+        started = profiler.mark("accounting", started)
+
+        for cpu in self.cpus:
+            cpu.execute_tick()
+        started = profiler.mark("cpu", started)
+
+        for io in sorted(self.io_timers.advance_to(self.stats.current_tick), key=lambda io: io.device_id):
+            io.complete_io()
+        started = profiler.mark("io", started)
+
+        self.interrupt_handler.handle_interrupts()
+        started = profiler.mark("interrupts", started)
+
+        self.dispatcher.dispatch_idle_cpus()
+        self.dispatcher.dispatch_idle_ios()
+        started = profiler.mark("dispatch", started)
+
+        self.stats.recalc_system_params()
+        started = profiler.mark("recalc_system", started)
+        self.stats.recalc_avg_process_params()
+        started = profiler.mark("recalc_avg", started)
+
+        self.memory_manager.free_resources()
+        started = profiler.mark("free_resources", started)
+        self.stats.trim_finished_processes()
+        profiler.mark("trim_stats", started)
+        profiler.mark(TICK_PHASE, tick_started)
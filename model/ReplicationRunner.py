@@ -0,0 +1,186 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, fields
+from typing import Dict, List, Optional
+
+from abstractions.Statistics import OSStats, AvgProcessTimeStats
+from model.Config import OSConfig
+from model.HeadlessRunner import RunLimits, RunResult, STOP_ERROR
+from model.SweepRunner import apply_overrides, run_point, without_file_outputs
+from utils.ConfidenceInterval import CONFIDENCE, estimate
+
+
+OS_STATS_FIELDS = [f.name for f in fields(OSStats)]
+AVG_PROCESS_STATS_FIELDS = [f.name for f in fields(AvgProcessTimeStats)]
+
+
+@dataclass
+class PrecisionTarget:
+    """
+    Класс-хранилище требуемой точности оценки величины
+    """
+    name: str  # поле OSStats или AvgProcessTimeStats
+    half_width: float  # наибольшая допустимая полуширина доверительного интервала
+    relative: bool = False  # half_width задана долей от модуля среднего
+
+    def satisfied(self, mean: float, half_width: float) -> bool:
+        limit = self.half_width * abs(mean) if self.relative else self.half_width
+        return half_width <= limit
+
+
+def parse_target(spec: str) -> PrecisionTarget:
+    """
+    Разобрать требуемую точность
+    :param spec: "поле=полуширина" (d_multi=0.5) или "поле=процент%" - относительно среднего (d_multi=2%)
+    """
+    name, sep, value = spec.partition("=")
+    if not sep or name not in OS_STATS_FIELDS + AVG_PROCESS_STATS_FIELDS:
+        raise ValueError(f"Неверная требуемая точность {spec} (ожидается поле OSStats или "
+                         f"AvgProcessTimeStats=полуширина)")
+    relative = value.endswith("%")
+    try:
+        half_width = float(value[:-1]) / 100 if relative else float(value)
+    except ValueError:
+        raise ValueError(f"Неверная полуширина интервала в {spec}")
+    if half_width <= 0:
+        raise ValueError(f"Полуширина интервала в {spec} должна быть положительной")
+    return PrecisionTarget(name, half_width, relative)
+
+
+@dataclass
+class ReplicationResult:
+    """
+    Результат серии независимых повторений прогона
+    """
+    replications: int = 0  # число учтённых повторений
+    seeds: List[int] = field(default_factory=list)  # сиды учтённых повторений
+    stopped_early: bool = False  # серия остановлена по достижении требуемой точности
+    confidence: float = CONFIDENCE  # доверительная вероятность интервалов
+    wall_time: float = 0  # затраченное реальное время (в секундах)
+    os_stats: Dict[str, dict] = field(default_factory=dict)  # оценки полей OSStats
+    avg_process_stats: Dict[str, dict] = field(default_factory=dict)  # оценки полей AvgProcessTimeStats
+    failed: List[dict] = field(default_factory=list)  # прогоны, прерванные ошибкой (сид и текст ошибки)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, indent=2)
+
+
+class ReplicationRunner:
+    """
+    Серия независимых повторений прогона модели с разными сидами в пуле процессов. По итоговым OSStats
+    и AvgProcessTimeStats повторений строятся среднее, стандартное отклонение и 95% доверительный интервал.
+    Повторения учитываются строго в порядке сидов, поэтому результат не зависит от порядка завершения
+    прогонов; серия останавливается досрочно, как только интервалы всех заданных величин становятся
+    не шире требуемых
+    """
+    def __init__(self, base_config: OSConfig, limits: RunLimits, max_replications: int,
+                 min_replications: int = 3, targets: Optional[List[PrecisionTarget]] = None,
+                 first_seed: int = 0, workers: Optional[int] = None) -> None:
+        """
+        :param base_config: конфигурация модели (сид генератора заменяется сидом повторения)
+        :param limits: ограничения каждого прогона
+        :param max_replications: наибольшее число повторений
+        :param min_replications: наименьшее число повторений перед досрочной остановкой (не меньше 2)
+        :param targets: требуемая точность оценок (None - выполнить все повторения)
+        :param first_seed: сид первого повторения (сиды повторений идут подряд)
+        :param workers: число процессов пула (None - по числу ядер)
+        """
+        if min_replications < 2 or max_replications < min_replications:
+            raise ValueError("Число повторений должно быть не меньше наименьшего, а наименьшее - не меньше 2")
+        if first_seed < 0:
+            raise ValueError("Сид повторения должен быть неотрицательным")
+        self.base_config = without_file_outputs(base_config)
+        self.limits = limits
+        self.max_replications = max_replications
+        self.min_replications = min_replications
+        self.targets = targets or []
+        self.first_seed = first_seed
+        self.workers = workers or os.cpu_count() or 1
+
+        self.seeds: List[int] = []  # сиды учтённых повторений
+        self.samples: Dict[str, List[float]] = {name: [] for name in OS_STATS_FIELDS + AVG_PROCESS_STATS_FIELDS}
+        self.failed: List[dict] = []
+
+    def add(self, seed: int, result: RunResult) -> None:
+        """
+        Учесть результат повторения
+        :param seed: сид повторения
+        :param result: результат прогона
+        """
+        if result.stop_reason == STOP_ERROR:
+            self.failed.append({"seed": seed, "error": result.error})
+            return
+        self.seeds.append(seed)
+        for name in OS_STATS_FIELDS:
+            self.samples[name].append(result.os_stats[name])
+        for name in AVG_PROCESS_STATS_FIELDS:
+            self.samples[name].append(result.avg_process_stats[name])
+
+    def precise_enough(self) -> bool:
+        """
+        Достигнута ли требуемая точность всех заданных величин
+        """
+        if not self.targets or len(self.seeds) < self.min_replications:
+            return False
+        for target in self.targets:
+            value = estimate(self.samples[target.name])
+            if not target.satisfied(value.mean, value.half_width):
+                return False
+        return True
+
+    def submit(self, pool: ProcessPoolExecutor, seed: int) -> Future:
+        config = apply_overrides(self.base_config, {"random.random_seed": seed})
+        return pool.submit(run_point, config, self.limits)
+
+    def run(self) -> ReplicationResult:
+        """
+        Выполнить серию повторений
+        :return: оценки величин по учтённым повторениям
+        """
+        started = time.perf_counter()
+        stopped_early = False
+        last_seed = self.first_seed + self.max_replications
+        next_seed = self.first_seed  # сид следующего запускаемого повторения
+        commit_seed = self.first_seed  # сид следующего учитываемого повторения
+        finished: Dict[int, RunResult] = {}  # завершённые, но ещё не учтённые повторения
+
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        in_flight: Dict[Future, int] = {}
+        try:
+            while next_seed < last_seed and len(in_flight) < self.workers:
+                in_flight[self.submit(pool, next_seed)] = next_seed
+                next_seed += 1
+            while in_flight and not stopped_early:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    seed = in_flight.pop(future)
+                    try:
+                        finished[seed] = future.result()
+                    except Exception as e:  # ошибка повторения не останавливает серию
+                        finished[seed] = RunResult(stop_reason=STOP_ERROR, error=f"{type(e).__name__}: {e}")
+                    if next_seed < last_seed:
+                        in_flight[self.submit(pool, next_seed)] = next_seed
+                        next_seed += 1
+                while commit_seed in finished:
+                    self.add(commit_seed, finished.pop(commit_seed))
+                    print(f"[{commit_seed - self.first_seed + 1}/{self.max_replications}] сид {commit_seed}" +
+                          "".join(f", {t.name} ±{estimate(self.samples[t.name]).half_width:.4g}"
+                                  for t in self.targets), file=sys.stderr)
+                    commit_seed += 1
+                    if self.precise_enough():
+                        stopped_early = True
+                        break
+        finally:
+            # при досрочной остановке ещё не начатые повторения отменяются
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        result = ReplicationResult(replications=len(self.seeds), seeds=list(self.seeds),
+                                   stopped_early=stopped_early, failed=list(self.failed))
+        result.os_stats = {name: estimate(self.samples[name]).to_dict() for name in OS_STATS_FIELDS}
+        result.avg_process_stats = {name: estimate(self.samples[name]).to_dict()
+                                    for name in AVG_PROCESS_STATS_FIELDS}
+        result.wall_time = time.perf_counter() - started
+        return result
@@ -0,0 +1,210 @@
+import copy
+import csv
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from abstractions.Statistics import OSStats
+from model.Config import OSConfig
+from model.OSModel import OSModel
+from model.HeadlessRunner import HeadlessRunner, RunLimits, RunResult, STOP_ERROR
+
+
+RESULT_COLUMNS = ["run", "ticks", "wall_time", "stop_reason", "error"]  # служебные столбцы таблицы результатов
+STATS_COLUMNS = [f.name for f in fields(OSStats)]  # столбцы итоговой статистики OSStats
+
+
+@dataclass
+class SweepParameter:
+    """
+    Класс-хранилище варьируемого параметра
+    """
+    name: str  # имя параметра в виде "секция.параметр" (например, cpu.quantum_size)
+    values: List[object]  # значения параметра
+
+
+def parse_value(text: str) -> object:
+    """
+    Перевести значение параметра из текста (число, true/false, строка)
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def parse_parameter(spec: str) -> SweepParameter:
+    """
+    Разобрать описание варьируемого параметра
+    :param spec: "секция.параметр=значения": список через запятую (1,2,4) или диапазон
+    начало:конец[:шаг] с включённым концом (1:9:2 - 1, 3, 5, 7, 9)
+    """
+    name, sep, values = spec.partition("=")
+    if not sep or "." not in name or not values:
+        raise ValueError(f"Неверное описание параметра {spec} (ожидается секция.параметр=значения)")
+    if ":" in values:
+        bounds = [parse_value(v) for v in values.split(":")]
+        if len(bounds) not in (2, 3) or not all(isinstance(b, (int, float)) for b in bounds):
+            raise ValueError(f"Неверный диапазон значений параметра {spec}")
+        start, stop = bounds[0], bounds[1]
+        step = bounds[2] if len(bounds) == 3 else 1
+        if step <= 0:
+            raise ValueError(f"Шаг диапазона параметра {spec} должен быть положительным")
+        points = []
+        i = 0
+        while start + i * step <= stop + 1e-9 * abs(step):
+            value = start + i * step
+            points.append(round(value, 10) if isinstance(value, float) else value)
+            i += 1
+        return SweepParameter(name, points)
+    return SweepParameter(name, [parse_value(v) for v in values.split(",")])
+
+
+def apply_overrides(config: OSConfig, overrides: Dict[str, object]) -> OSConfig:
+    """
+    Получить копию конфигурации с заменёнными значениями параметров
+    :param config: исходная конфигурация
+    :param overrides: словарь {"секция.параметр": значение}
+    """
+    config = copy.deepcopy(config)
+    for name, value in overrides.items():
+        section_name, _, field_name = name.partition(".")
+        section = getattr(config, section_name, None)
+        if section is None or not hasattr(section, field_name):
+            raise ValueError(f"Неизвестный параметр конфигурации {name}")
+        setattr(section, field_name, value)
+    return config
+
+
+def without_file_outputs(config: OSConfig) -> OSConfig:
+    """
+    Получить копию конфигурации без файловых выходов модели (архив статистики, запись трассы, файл образа
+    памяти): параллельные прогоны записывали бы их в один файл
+    """
+    config = copy.deepcopy(config)
+    config.statistics.archive_path = ""
+    config.workload.record_path = ""
+    config.memory.memory_file = ""
+    return config
+
+
+def run_point(config: OSConfig, limits: RunLimits) -> RunResult:
+    """
+    Прогнать модель с заданной конфигурацией (выполняется в процессе пула)
+    :param config: конфигурация модели
+    :param limits: ограничения прогона
+    """
+    os_model = OSModel(config=config)
+    try:
+        return HeadlessRunner(os_model, limits).run()
+    finally:
+        os_model.terminate()
+        os_model.physical_memory.close()
+
+
+class SweepRunner:
+    """
+    Прогон модели на сетке значений параметров в пуле процессов. Итоговые OSStats каждого прогона
+    дописываются строкой в CSV-таблицу по мере завершения прогонов; при повторном запуске с той же таблицей
+    уже выполненные точки сетки пропускаются. Файловые выходы модели в прогонах отключаются
+    """
+    def __init__(self, base_config: OSConfig, parameters: List[SweepParameter], limits: RunLimits,
+                 output_path: str, workers: Optional[int] = None) -> None:
+        """
+        :param base_config: базовая конфигурация модели
+        :param parameters: варьируемые параметры (прогоняется их декартово произведение)
+        :param limits: ограничения каждого прогона
+        :param output_path: CSV-файл результатов
+        :param workers: число процессов пула (None - по числу ядер)
+        """
+        self.base_config = without_file_outputs(base_config)
+        self.parameters = parameters
+        self.limits = limits
+        self.output_path = output_path
+        self.workers = workers
+        self.columns = RESULT_COLUMNS + [p.name for p in parameters] + STATS_COLUMNS
+        apply_overrides(self.base_config, {p.name: p.values[0] for p in parameters})  # проверка имён параметров
+
+    def points(self) -> Iterator[Dict[str, object]]:
+        """
+        Точки сетки в фиксированном порядке: словари {"секция.параметр": значение}
+        """
+        names = [p.name for p in self.parameters]
+        for values in itertools.product(*(p.values for p in self.parameters)):
+            yield dict(zip(names, values))
+
+    @staticmethod
+    def point_key(point: Dict[str, object]) -> Tuple[str, ...]:
+        """
+        Ключ точки сетки для сопоставления со строками таблицы (значения в текстовом виде)
+        """
+        return tuple(str(value) for value in point.values())
+
+    def drop_partial_row(self) -> None:
+        """
+        Отбросить незавершённую последнюю строку таблицы (запись прервана вместе с прогоном)
+        """
+        with open(self.output_path, "r+b") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def completed_points(self) -> Set[Tuple[str, ...]]:
+        """
+        Ключи точек, уже записанных в таблицу результатов
+        """
+        if not os.path.exists(self.output_path):
+            return set()
+        self.drop_partial_row()
+        if os.path.getsize(self.output_path) == 0:
+            return set()
+        with open(self.output_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header != self.columns:
+                raise RuntimeError(f"Таблица {self.output_path} получена для другого набора параметров")
+            names = [p.name for p in self.parameters]
+            positions = [header.index(name) for name in names]
+            return {tuple(row[i] for i in positions) for row in reader}
+
+    def row(self, run: int, point: Dict[str, object], result: RunResult) -> List[object]:
+        """
+        Строка таблицы результатов для прогона
+        """
+        return ([run, result.ticks, result.wall_time, result.stop_reason, result.error or ""] +
+                list(point.values()) + [result.os_stats.get(name, "") for name in STATS_COLUMNS])
+
+    def run(self) -> int:
+        """
+        Выполнить невыполненные точки сетки
+        :return: число выполненных в этом запуске прогонов
+        """
+        done = self.completed_points()
+        pending = [(run, point) for run, point in enumerate(self.points()) if self.point_key(point) not in done]
+        total = len(pending)
+        if not total:
+            return 0
+
+        new_file = not os.path.exists(self.output_path) or os.path.getsize(self.output_path) == 0
+        with open(self.output_path, "a", encoding="utf-8", newline="") as f, \
+                ProcessPoolExecutor(max_workers=self.workers) as pool:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(self.columns)
+                f.flush()
+            futures = {pool.submit(run_point, apply_overrides(self.base_config, point), self.limits): (run, point)
+                       for run, point in pending}
+            for finished, future in enumerate(as_completed(futures), 1):
+                run, point = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:  # ошибка прогона не останавливает остальные точки сетки
+                    result = RunResult(stop_reason=STOP_ERROR, error=f"{type(e).__name__}: {e}")
+                writer.writerow(self.row(run, point, result))
+                f.flush()
+                print(f"[{finished}/{total}] прогон {run}: {result.stop_reason}", file=sys.stderr)
+        return total
@@ -0,0 +1,61 @@
+import argparse
+import json
+import sys
+
+from model.OSModel import OSModel
+from model.HeadlessRunner import RunLimits, ENGINE_TICK, ENGINE_EVENT
+from model.ReplicationRunner import ReplicationRunner, parse_target
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Серия независимых повторений прогона модели ОС "
+                                                 "с доверительными интервалами статистики")
+    parser.add_argument("--config", default="model/config.json", help="путь к JSON-файлу с параметрами модели")
+    parser.add_argument("--replications", type=int, required=True, help="наибольшее число повторений")
+    parser.add_argument("--min-replications", type=int, default=3,
+                        help="наименьшее число повторений перед досрочной остановкой (не меньше 2)")
+    parser.add_argument("--target", action="append", default=[], metavar="ПОЛЕ=ПОЛУШИРИНА",
+                        help="требуемая полуширина 95%% доверительного интервала поля OSStats или "
+                             "AvgProcessTimeStats: абсолютная (d_multi=0.5) или относительно среднего "
+                             "(d_multi=2%%); задаётся несколько раз, серия останавливается, когда достигнуты все")
+    parser.add_argument("--first-seed", type=int, default=0, help="сид первого повторения (сиды идут подряд)")
+    parser.add_argument("--ticks", type=int, default=None, help="максимальное число тактов каждого прогона")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="бюджет реального времени каждого прогона в секундах")
+    parser.add_argument("--finish-after", type=int, default=None,
+                        help="после указанного такта прекратить загрузку и дождаться завершения процессов")
+    parser.add_argument("--engine", choices=[ENGINE_TICK, ENGINE_EVENT], default=ENGINE_TICK,
+                        help="движок моделирования: потактовый или событийный (пропуск тактов без событий)")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов пула (по умолчанию - по числу ядер)")
+    parser.add_argument("--output", default=None, help="файл для записи результатов (по умолчанию - stdout)")
+    args = parser.parse_args(argv)
+    if args.ticks is None and args.time_budget is None and args.finish_after is None:
+        parser.error("необходимо задать хотя бы одно ограничение: --ticks, --time-budget или --finish-after")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        with open(args.config, "r", encoding="utf-8") as f:
+            base_config = OSModel.parse_config(json.load(f))
+        targets = [parse_target(spec) for spec in args.target]
+        limits = RunLimits(max_ticks=args.ticks, time_budget=args.time_budget, finish_after=args.finish_after,
+                           engine=args.engine)
+        runner = ReplicationRunner(base_config, limits, args.replications, args.min_replications, targets,
+                                   args.first_seed, args.workers)
+    except (OSError, json.JSONDecodeError, ValueError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+
+    result = runner.run()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result.to_json())
+    else:
+        print(result.to_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
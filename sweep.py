@@ -0,0 +1,57 @@
+import argparse
+import json
+import sys
+
+from model.OSModel import OSModel
+from model.HeadlessRunner import RunLimits, ENGINE_TICK, ENGINE_EVENT
+from model.SweepRunner import SweepRunner, parse_parameter
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Прогон модели ОС на сетке значений параметров в пуле процессов")
+    parser.add_argument("--config", default="model/config.json", help="базовый JSON-файл с параметрами модели")
+    parser.add_argument("--param", action="append", default=[], metavar="СЕКЦИЯ.ПАРАМЕТР=ЗНАЧЕНИЯ",
+                        help="варьируемый параметр: список через запятую (cpu.cpus_num=1,2,4) или диапазон "
+                             "начало:конец[:шаг] (cpu.quantum_size=1:9:2); задаётся несколько раз")
+    parser.add_argument("--ticks", type=int, default=None, help="максимальное число тактов каждого прогона")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="бюджет реального времени каждого прогона в секундах")
+    parser.add_argument("--finish-after", type=int, default=None,
+                        help="после указанного такта прекратить загрузку и дождаться завершения процессов")
+    parser.add_argument("--engine", choices=[ENGINE_TICK, ENGINE_EVENT], default=ENGINE_TICK,
+                        help="движок моделирования: потактовый или событийный (пропуск тактов без событий)")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов пула (по умолчанию - по числу ядер)")
+    parser.add_argument("--output", required=True,
+                        help="CSV-файл результатов (если файл существует, выполненные точки пропускаются)")
+    args = parser.parse_args(argv)
+    if not args.param:
+        parser.error("необходимо задать хотя бы один параметр --param")
+    if args.ticks is None and args.time_budget is None and args.finish_after is None:
+        parser.error("необходимо задать хотя бы одно ограничение: --ticks, --time-budget или --finish-after")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        with open(args.config, "r", encoding="utf-8") as f:
+            base_config = OSModel.parse_config(json.load(f))
+        parameters = [parse_parameter(spec) for spec in args.param]
+        limits = RunLimits(max_ticks=args.ticks, time_budget=args.time_budget, finish_after=args.finish_after,
+                           engine=args.engine)
+        runner = SweepRunner(base_config, parameters, limits, args.output, args.workers)
+    except (OSError, json.JSONDecodeError, ValueError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        runs = runner.run()
+    except RuntimeError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+    print(f"Выполнено прогонов: {runs}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+
+CONFIDENCE = 0.95  # доверительная вероятность интервалов
+# критические значения распределения Стьюдента t(0.975, df) для двустороннего 95% интервала
+T_975: Dict[int, float] = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+    40: 2.021, 50: 2.009, 60: 2.000, 80: 1.990, 100: 1.984, 120: 1.980,
+}
+T_975_LIMIT = 1.960  # предел при df -> бесконечность (нормальное распределение)
+_T_975_DFS = sorted(T_975)
+
+
+def t_critical(df: int) -> float:
+    """
+    Критическое значение t(0.975, df). Для df между значениями таблицы берётся ближайшее меньшее df
+    (интервал получается чуть шире точного)
+    :param df: число степеней свободы (не меньше 1)
+    """
+    if df < 1:
+        raise ValueError("Число степеней свободы должно быть не меньше 1")
+    if df > _T_975_DFS[-1]:
+        return T_975_LIMIT
+    return T_975[_T_975_DFS[bisect_right(_T_975_DFS, df) - 1]]
+
+
+@dataclass
+class Estimate:
+    """
+    Класс-хранилище оценки величины по независимым повторениям
+    """
+    count: int = 0  # число повторений
+    mean: float = 0  # выборочное среднее
+    std: float = 0  # выборочное стандартное отклонение (несмещённое)
+    half_width: float = math.inf  # полуширина 95% доверительного интервала (inf - меньше двух повторений)
+
+    @property
+    def ci_low(self) -> float:
+        return self.mean - self.half_width
+
+    @property
+    def ci_high(self) -> float:
+        return self.mean + self.half_width
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"count": self.count, "mean": self.mean, "std": self.std, "half_width": self.half_width,
+                "ci_low": self.ci_low, "ci_high": self.ci_high}
+
+
+def estimate(values: Sequence[float]) -> Estimate:
+    """
+    Среднее, стандартное отклонение и 95% доверительный интервал (по t-распределению) для значений
+    независимых повторений
+    :param values: значения величины
+    """
+    count = len(values)
+    if count == 0:
+        return Estimate()
+    mean = math.fsum(values) / count
+    if count == 1:
+        return Estimate(count, mean)
+    std = math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (count - 1))
+    return Estimate(count, mean, std, t_critical(count - 1) * std / math.sqrt(count))
@@ -0,0 +1,70 @@
+from typing import Dict, List, Optional
+
+
+class Histogram:
+    """
+    Гистограмма неотрицательных целых значений с логарифмическими корзинами:
+    в корзину k попадают значения из [2^(k-1), 2^k) (в корзину 0 - только 0).
+    Добавление - O(1), память не зависит от числа значений
+    """
+    BUCKETS_CNT = 64
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = [0] * Histogram.BUCKETS_CNT  # число значений в корзинах
+        self.count = 0  # число значений
+        self.total = 0  # сумма значений
+        self.min: Optional[int] = None  # наименьшее значение
+        self.max = 0  # наибольшее значение
+
+    def add(self, value: int) -> None:
+        """
+        Добавить значение
+        :param value: значение (неотрицательное целое)
+        """
+        self.buckets[min(value.bit_length(), Histogram.BUCKETS_CNT - 1)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        """
+        Среднее значение (0, если значений нет)
+        """
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, q: float) -> int:
+        """
+        Оценка сверху для q-го процентиля: верхняя граница корзины, в которую он попадает
+        :param q: процентиль (0-100)
+        """
+        if not self.count:
+            return 0
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket, cnt in enumerate(self.buckets):
+            seen += cnt
+            if cnt and seen >= rank:
+                return min((1 << bucket) - 1, self.max)
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Добавить значения другой гистограммы
+        """
+        for bucket, cnt in enumerate(other.buckets):
+            self.buckets[bucket] += cnt
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Сводка по гистограмме
+        """
+        return {"count": self.count, "mean": self.mean(), "min": self.min or 0, "max": self.max,
+                "p50": self.percentile(50), "p99": self.percentile(99)}
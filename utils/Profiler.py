@@ -0,0 +1,75 @@
+import time
+from typing import Dict
+
+from utils.Histogram import Histogram
+
+
+TICK_PHASE = "tick"  # такт целиком (включает остальные фазы)
+
+
+class Profiler:
+    """
+    Профилировщик фаз такта моделирования: время каждой фазы (в наносекундах) накапливается в гистограмме,
+    число вызовов фазы - число значений гистограммы. Пока профилирование выключено, такт выполняется
+    без замеров
+    """
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        :param enabled: включить профилирование
+        """
+        self.enabled = enabled
+        self.phases: Dict[str, Histogram] = {}  # гистограммы времени по фазам (в порядке первого замера)
+
+    def start(self) -> int:
+        """
+        Начало замера
+        :return: отметка времени (в наносекундах)
+        """
+        return time.perf_counter_ns()
+
+    def mark(self, phase: str, started: int) -> int:
+        """
+        Учесть время фазы, прошедшее с отметки started
+        :param phase: имя фазы
+        :param started: отметка начала фазы
+        :return: отметка окончания фазы (начало следующей)
+        """
+        now = time.perf_counter_ns()
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram()
+        histogram.add(now - started)
+        return now
+
+    def reset(self) -> None:
+        """
+        Сбросить накопленные замеры
+        """
+        self.phases.clear()
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Сводка по фазам: число вызовов, суммарное и среднее время, процентили (в наносекундах)
+        и доля в суммарном времени фаз (в процентах; время такта целиком в сумму не входит)
+        """
+        total = sum(histogram.total for phase, histogram in self.phases.items() if phase != TICK_PHASE)
+        result = {}
+        for phase, histogram in self.phases.items():
+            summary = histogram.to_dict()
+            summary["total"] = histogram.total
+            summary["share"] = histogram.total / total * 100 if total else 0
+            result[phase] = summary
+        return result
+
+    def format_report(self) -> str:
+        """
+        Сводка по фазам в виде текстовой таблицы
+        """
+        report = self.report()
+        if not report:
+            return "Замеров нет"
+        lines = [f"{'фаза':<16}{'вызовы':>10}{'всего, мс':>12}{'среднее, мкс':>15}{'p99, мкс':>11}{'доля, %':>9}"]
+        for phase, summary in report.items():
+            lines.append(f"{phase:<16}{summary['count']:>10}{summary['total'] / 1e6:>12.2f}"
+                         f"{summary['mean'] / 1e3:>15.2f}{summary['p99'] / 1e3:>11.2f}{summary['share']:>9.1f}")
+        return "\n".join(lines)
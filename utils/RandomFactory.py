@@ -4,19 +4,33 @@ import random
 class RandomFactory:
     """
     Фабрика для генерации случайных параметров (процессов/команд).
+    Каждая модель владеет своей фабрикой с собственным генератором random.Random,
+    поэтому модели в одном интерпретаторе не влияют друг на друга
     """
-    @staticmethod
-    def generate_random_int_value(min_value: int, max_value: int) -> int:
+    def __init__(self, seed: int = -1) -> None:
+        """
+        :param seed: начальное значение генератора (-1 - случайное)
+        """
+        self.rng = random.Random()
+        self.seed(seed)
+
+    def seed(self, seed: int) -> None:
+        """
+        Переустановить начальное значение генератора
+        :param seed: начальное значение (-1 - случайное)
+        """
+        self.rng.seed(None if seed == -1 else seed)
+
+    def generate_random_int_value(self, min_value: int, max_value: int) -> int:
         """
         Генерация случайного int-значения в диапазоне [min_value, max_value]
         :param min_value: нижняя граница диапазона
         :param max_value: верхняя граница диапазона
         :return: сгенерированное значение
         """
-        return random.randint(min_value, max_value)
+        return self.rng.randint(min_value, max_value)
 
-    @staticmethod
-    def generate_random_float_value(min_value:float, max_value: float, round_cnt:int = 2) -> float:
+    def generate_random_float_value(self, min_value:float, max_value: float, round_cnt:int = 2) -> float:
         """
         Генерация случайного float-значения в диапазоне [min_value, max_value] с округлением до round_cnt знаков
         :param min_value: нижняя граница диапазона
@@ -24,5 +38,4 @@ class RandomFactory:
         :param round_cnt: точность
         :return: сгенерированное значение
         """
-        return round(random.uniform(min_value, max_value), round_cnt)
-
+        return round(self.rng.uniform(min_value, max_value), round_cnt)
@@ -0,0 +1,233 @@
+import os
+import struct
+import sys
+from array import array
+from dataclasses import fields
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from abstractions.Statistics import ProcessTimeStats
+
+
+MAGIC = b"OSMSTATS"
+VERSION = 1
+HEADER = struct.Struct("<8sHH")  # сигнатура, версия, число полей
+BLOCK_HEADER = struct.Struct("<I")  # число записей в блоке
+FIELD_NAMES: List[str] = [f.name for f in fields(ProcessTimeStats)]
+
+
+def _to_disk(column: array) -> bytes:
+    """
+    Перевести столбец в little-endian представление для записи в файл
+    """
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_disk(typecode: str, data: bytes) -> array:
+    """
+    Прочитать столбец из little-endian представления
+    """
+    column = array(typecode)
+    column.frombytes(data)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+class StatsArchive:
+    """
+    Архив статистики завершённых процессов на диске.
+    Файл только дописывается: записи копятся в буфере и сбрасываются блоками, внутри блока данные
+    хранятся по столбцам (PID - int64, поля ProcessTimeStats - float64), поэтому отдельный столбец
+    читается без разбора остальных.
+    Ветвь архива (StatsArchive.fork) не копирует записанное до ветвления: оно остаётся общим префиксом
+    в файлах предков, а новые записи ветвь пишет в свой файл.
+    """
+    def __init__(self, path: str, block_size: int = 4096, append: bool = False) -> None:
+        """
+        Открыть архив на запись
+        :param path: путь к файлу архива
+        :param block_size: число записей в одном блоке
+        :param append: дописывать в существующий архив (иначе файл создаётся заново)
+        """
+        self.path = path
+        self.block_size = block_size
+        self.records_written = 0  # число записей, сброшенных на диск
+        self.pids = array("q")  # буфер столбца PID
+        self.columns: Dict[str, array] = {name: array("d") for name in FIELD_NAMES}  # буферы столбцов
+        # общий с предками префикс архива: файлы и их размер (в байтах) на момент ветвления
+        self.prefix: List[Tuple[str, int]] = []
+
+        self.file: BinaryIO = open(path, "ab" if append else "wb")
+        if self.file.tell() == 0:
+            self.file.write(HEADER.pack(MAGIC, VERSION, len(FIELD_NAMES)))
+            for name in FIELD_NAMES:
+                encoded = name.encode("utf-8")
+                self.file.write(struct.pack("<H", len(encoded)) + encoded)
+        else:
+            self.records_written = sum(len(pids) for pids in StatsArchive.read_column(path, "pid"))
+
+    def __len__(self) -> int:
+        return self.records_written + len(self.pids)
+
+    def append(self, pid: int, record: ProcessTimeStats) -> None:
+        """
+        Добавить статистику процесса в архив
+        :param pid: PID процесса
+        :param record: статистика процесса
+        """
+        self.pids.append(pid)
+        for name, column in self.columns.items():
+            column.append(getattr(record, name))
+        if len(self.pids) >= self.block_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Сбросить накопленные записи на диск одним блоком
+        """
+        if self.file.closed or not self.pids:
+            return
+        self.file.write(BLOCK_HEADER.pack(len(self.pids)))
+        self.file.write(_to_disk(self.pids))
+        for name in FIELD_NAMES:
+            self.file.write(_to_disk(self.columns[name]))
+        self.file.flush()
+        self.records_written += len(self.pids)
+        self.pids = array("q")
+        self.columns = {name: array("d") for name in FIELD_NAMES}
+
+    def fork(self, path: str) -> "StatsArchive":
+        """
+        Создать ветвь архива: записанное до ветвления остаётся общим префиксом (файлы не копируются),
+        записи из буфера копируются, новые записи ветвь пишет в свой файл
+        :param path: путь к файлу ветви
+        :return: архив ветви
+        """
+        if self.file.closed:
+            size = os.path.getsize(self.path)
+        else:
+            self.file.flush()  # префикс на диске должен совпадать с позицией записи
+            size = self.file.tell()
+        child = StatsArchive(path, self.block_size)
+        child.prefix = self.prefix + [(self.path, size)]
+        child.records_written = self.records_written
+        child.pids = array("q", self.pids)
+        child.columns = {name: array("d", column) for name, column in self.columns.items()}
+        return child
+
+    def segments(self) -> List[Tuple[str, Optional[int]]]:
+        """
+        Части архива в порядке записи: файлы префикса с их размером и собственный файл (размер None - до конца)
+        """
+        return self.prefix + [(self.path, None)]
+
+    def close(self) -> None:
+        """
+        Сбросить буфер и закрыть файл архива
+        """
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+
+    def __getstate__(self) -> dict:
+        # открытый файл не сохраняется: при восстановлении он открывается заново и обрезается
+        # до размера на момент сохранения (записи, сделанные после сохранения, отбрасываются)
+        state = self.__dict__.copy()
+        file = state.pop("file")
+        if not file.closed:
+            file.flush()  # размер на диске должен совпадать с позицией записи
+        state["file_size"] = None if file.closed else file.tell()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        size = state.pop("file_size")
+        self.__dict__.update(state)
+        self.file = open(self.path, "r+b")
+        if size is None:
+            self.file.close()
+        else:
+            self.file.truncate(size)
+            self.file.seek(size)
+
+    @staticmethod
+    def _read_header(f: BinaryIO) -> List[str]:
+        """
+        Прочитать заголовок архива
+        :return: список имён полей
+        """
+        magic, version, fields_cnt = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise RuntimeError("Файл не является архивом статистики процессов или имеет неизвестную версию")
+        names = []
+        for _ in range(fields_cnt):
+            (length,) = struct.unpack("<H", f.read(2))
+            names.append(f.read(length).decode("utf-8"))
+        return names
+
+    @staticmethod
+    def iter_blocks(path: str, columns: Optional[List[str]] = None,
+                    end: Optional[int] = None) -> Iterator[Dict[str, array]]:
+        """
+        Потоково прочитать блоки архива
+        :param path: путь к файлу архива
+        :param columns: столбцы для чтения ("pid" и имена полей ProcessTimeStats), None - все
+        :param end: размер читаемой части файла в байтах (None - до конца файла)
+        :return: итератор по блокам: словарь {имя_столбца: значения}
+        """
+        with open(path, "rb") as f:
+            names = StatsArchive._read_header(f)
+            wanted = ["pid"] + names if columns is None else columns
+            while end is None or f.tell() < end:
+                head = f.read(BLOCK_HEADER.size)
+                if len(head) < BLOCK_HEADER.size:
+                    return
+                (count,) = BLOCK_HEADER.unpack(head)
+                block = {}
+                for name in ["pid"] + names:
+                    if name in wanted:
+                        block[name] = _from_disk("q" if name == "pid" else "d", f.read(count * 8))
+                    else:
+                        f.seek(count * 8, 1)
+                yield block
+
+    @staticmethod
+    def read_column(path: str, name: str) -> Iterator[array]:
+        """
+        Прочитать один столбец архива (поблочно)
+        :param path: путь к файлу архива
+        :param name: имя столбца
+        """
+        for block in StatsArchive.iter_blocks(path, [name]):
+            yield block[name]
+
+    @staticmethod
+    def iter_records(path: str, end: Optional[int] = None) -> Iterator[Tuple[int, ProcessTimeStats]]:
+        """
+        Потоково прочитать все записи архива
+        :param path: путь к файлу архива
+        :param end: размер читаемой части файла в байтах (None - до конца файла)
+        :return: итератор пар (PID, статистика процесса)
+        """
+        for block in StatsArchive.iter_blocks(path, end=end):
+            names = [name for name in block if name != "pid"]
+            for i, pid in enumerate(block["pid"]):
+                yield pid, ProcessTimeStats(**{name: block[name][i] for name in names if name in FIELD_NAMES})
+
+    @staticmethod
+    def find(path: str, pid: int) -> Optional[ProcessTimeStats]:
+        """
+        Найти в архиве статистику процесса по PID
+        :param path: путь к файлу архива
+        :param pid: PID процесса
+        :return: статистика процесса или None
+        """
+        for block in StatsArchive.iter_blocks(path):
+            pids = block["pid"]
+            if pid in pids:
+                i = pids.index(pid)
+                return ProcessTimeStats(**{name: block[name][i] for name in FIELD_NAMES if name in block})
+        return None
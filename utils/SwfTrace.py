@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional, TextIO
+
+
+# номера полей строки SWF (Standard Workload Format, нумерация с нуля)
+SWF_JOB_NUMBER = 0
+SWF_SUBMIT_TIME = 1  # время поступления (с)
+SWF_RUN_TIME = 3  # время выполнения (с)
+SWF_ALLOCATED_PROCESSORS = 4  # число выделенных процессоров
+SWF_AVERAGE_CPU_TIME = 5  # среднее процессорное время (с)
+SWF_USED_MEMORY = 6  # использованная память на процессор (КБ)
+SWF_REQUESTED_PROCESSORS = 7  # число запрошенных процессоров
+SWF_REQUESTED_MEMORY = 9  # запрошенная память на процессор (КБ)
+SWF_FIELDS_CNT = 18
+
+
+@dataclass
+class SwfRecord:
+    """
+    Задание из журнала в формате SWF (отсутствующие значения - -1)
+    """
+    job_number: int
+    submit_time: float
+    run_time: float
+    average_cpu_time: float
+    processors: int
+    memory_kb: float  # память задания (на все процессоры)
+
+
+def parse_swf_line(line: str) -> Optional[SwfRecord]:
+    """
+    Разобрать строку журнала SWF
+    :param line: строка журнала
+    :return: задание или None для строки-комментария (';') и пустой строки
+    """
+    line = line.strip()
+    if not line or line.startswith(";"):
+        return None
+    values = line.split()
+    if len(values) < SWF_FIELDS_CNT:
+        raise RuntimeError(f"Строка журнала SWF содержит {len(values)} полей вместо {SWF_FIELDS_CNT}: {line}")
+    processors = int(values[SWF_ALLOCATED_PROCESSORS])
+    if processors <= 0:
+        processors = int(values[SWF_REQUESTED_PROCESSORS])
+    memory_kb = float(values[SWF_USED_MEMORY])
+    if memory_kb <= 0:
+        memory_kb = float(values[SWF_REQUESTED_MEMORY])
+    if memory_kb > 0:
+        memory_kb *= max(processors, 1)
+    return SwfRecord(job_number=int(values[SWF_JOB_NUMBER]),
+                     submit_time=float(values[SWF_SUBMIT_TIME]),
+                     run_time=float(values[SWF_RUN_TIME]),
+                     average_cpu_time=float(values[SWF_AVERAGE_CPU_TIME]),
+                     processors=processors,
+                     memory_kb=memory_kb)
+
+
+def read_swf_record(f: TextIO) -> Optional[SwfRecord]:
+    """
+    Прочитать очередное задание журнала SWF (строки-комментарии и пустые строки пропускаются)
+    :param f: файл журнала, открытый на чтение в текстовом режиме
+    :return: задание или None, если задания закончились
+    """
+    while True:
+        line = f.readline()
+        if not line:
+            return None
+        record = parse_swf_line(line)
+        if record is not None:
+            return record
+
+
+def iter_swf_records(f: TextIO) -> Iterator[SwfRecord]:
+    """
+    Потоково прочитать задания журнала SWF
+    :param f: файл журнала, открытый на чтение в текстовом режиме
+    :return: итератор по заданиям в порядке следования в файле
+    """
+    while True:
+        record = read_swf_record(f)
+        if record is None:
+            return
+        yield record
@@ -0,0 +1,172 @@
+from typing import Any, List, Optional
+
+
+class Timer:
+    """
+    Таймер, зарегистрированный в TimerWheel
+    """
+    __slots__ = ("due", "item", "cancelled")
+
+    def __init__(self, due: int, item: Any) -> None:
+        self.due = due  # такт срабатывания
+        self.item = item  # объект, возвращаемый при срабатывании
+        self.cancelled = False
+
+
+class TimerWheel:
+    """
+    Иерархическое колесо таймеров.
+    Уровень k состоит из SLOTS_CNT ячеек по SLOTS_CNT^k тактов. Таймер помещается на наименьший уровень,
+    в пределах которого номер такта срабатывания отличается от текущего только в младших разрядах;
+    при переходе через границу ячейки старшего уровня её таймеры переносятся на младшие уровни.
+    Регистрация и отмена - O(1), продвижение на такт - O(1) в среднем
+    """
+    SLOT_BITS = 6
+    SLOTS_CNT = 1 << SLOT_BITS
+    LEVELS_CNT = 5  # на уровнях помещаются таймеры на 2^30 тактов вперёд, дальше - в списке переполнения
+
+    def __init__(self, now: int = 0) -> None:
+        """
+        :param now: текущий такт
+        """
+        self.now = now
+        self.levels: List[List[List[Timer]]] = [[[] for _ in range(TimerWheel.SLOTS_CNT)]
+                                                for _ in range(TimerWheel.LEVELS_CNT)]
+        self.overflow: List[Timer] = []  # таймеры за пределами колеса
+        self.overdue: List[Timer] = []  # таймеры с тактом срабатывания <= now (сработают при продвижении)
+        self.count = 0  # число активных таймеров
+
+    def __len__(self) -> int:
+        return self.count
+
+    def schedule(self, due: int, item: Any) -> Timer:
+        """
+        Зарегистрировать таймер
+        :param due: такт срабатывания
+        :param item: объект, возвращаемый при срабатывании
+        :return: таймер (для отмены)
+        """
+        timer = Timer(due, item)
+        self.place(timer)
+        self.count += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> None:
+        """
+        Отменить таймер (он будет удалён из ячейки при её обработке)
+        """
+        if not timer.cancelled:
+            timer.cancelled = True
+            self.count -= 1
+
+    def place(self, timer: Timer) -> None:
+        """
+        Поместить таймер в ячейку относительно текущего такта
+        """
+        due = timer.due
+        if due <= self.now:
+            self.overdue.append(timer)
+            return
+        for level in range(TimerWheel.LEVELS_CNT):
+            shift = TimerWheel.SLOT_BITS * (level + 1)
+            if due >> shift == self.now >> shift:
+                self.levels[level][(due >> (shift - TimerWheel.SLOT_BITS)) & (TimerWheel.SLOTS_CNT - 1)].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def next_expiry(self) -> Optional[int]:
+        """
+        Такт срабатывания ближайшего активного таймера (None - таймеров нет)
+        """
+        if not self.count:
+            return None
+        due = [timer.due for timer in self.overdue if not timer.cancelled]
+        if due:
+            return min(due)
+        for level in range(TimerWheel.LEVELS_CNT):
+            shift = TimerWheel.SLOT_BITS * level
+            current = (self.now >> shift) & (TimerWheel.SLOTS_CNT - 1)
+            # на уровне лежат только таймеры текущего окна, более поздние ячейки - в более поздние такты
+            for slot in self.levels[level][current + 1:]:
+                due = [timer.due for timer in slot if not timer.cancelled]
+                if due:
+                    return min(due)
+        due = [timer.due for timer in self.overflow if not timer.cancelled]
+        return min(due) if due else None
+
+    def step(self) -> List[Any]:
+        """
+        Продвинуть колесо на один такт
+        :return: объекты сработавших таймеров
+        """
+        self.now += 1
+        now = self.now
+        # переносим таймеры из ячеек старших уровней, границу которых перешли (от старшего к младшему)
+        if now & (TimerWheel.SLOTS_CNT - 1) == 0:
+            if now & ((1 << (TimerWheel.SLOT_BITS * TimerWheel.LEVELS_CNT)) - 1) == 0 and self.overflow:
+                overflow, self.overflow = self.overflow, []
+                self.replace(overflow)
+            for level in range(TimerWheel.LEVELS_CNT - 1, 0, -1):
+                shift = TimerWheel.SLOT_BITS * level
+                if now & ((1 << shift) - 1) == 0:
+                    slot_index = (now >> shift) & (TimerWheel.SLOTS_CNT - 1)
+                    slot = self.levels[level][slot_index]
+                    if slot:
+                        self.levels[level][slot_index] = []
+                        self.replace(slot)
+
+        expired = []
+        if self.overdue:
+            overdue, self.overdue = self.overdue, []
+            expired.extend(timer for timer in overdue if not timer.cancelled)
+        slot_index = now & (TimerWheel.SLOTS_CNT - 1)
+        slot = self.levels[0][slot_index]
+        if slot:
+            self.levels[0][slot_index] = []
+            expired.extend(timer for timer in slot if not timer.cancelled)
+        for timer in expired:
+            timer.cancelled = True  # сработавший таймер больше не активен
+        self.count -= len(expired)
+        return [timer.item for timer in expired]
+
+    def replace(self, timers: List[Timer]) -> None:
+        """
+        Заново разместить таймеры относительно текущего такта (отменённые отбрасываются)
+        """
+        for timer in timers:
+            if not timer.cancelled:
+                self.place(timer)
+
+    def rebase(self, now: int) -> None:
+        """
+        Перевести колесо сразу на такт now (до него не должно быть срабатываний)
+        """
+        timers = self.overflow + self.overdue
+        for level in self.levels:
+            for i, slot in enumerate(level):
+                if slot:
+                    timers.extend(slot)
+                    level[i] = []
+        self.overflow, self.overdue = [], []
+        self.now = now
+        self.replace(timers)
+
+    def advance_to(self, tick: int) -> List[Any]:
+        """
+        Продвинуть колесо до такта tick включительно
+        :param tick: такт
+        :return: объекты сработавших таймеров (в порядке тактов срабатывания)
+        """
+        expired = []
+        while self.now < tick:
+            if not self.count:
+                self.now = tick
+                break
+            if tick - self.now > TimerWheel.SLOTS_CNT:
+                # длинный промежуток без срабатываний перескакиваем сразу
+                nearest = self.next_expiry()
+                if nearest - 1 - self.now > TimerWheel.SLOTS_CNT:
+                    self.rebase(min(nearest - 1, tick))
+                    continue
+            expired.extend(self.step())
+        return expired
@@ -0,0 +1,170 @@
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator, Optional
+
+from abstractions.CommandProgram import CommandProgram, KIND_ALU, KIND_IO
+from abstractions.Job import Job
+
+
+MAGIC = b"OSMTRACE"
+VERSION = 1
+HEADER = struct.Struct("<8sH")  # сигнатура, версия
+JOB_HEADER = struct.Struct("<qqqI")  # такт поступления, размер памяти, приоритет, число команд
+IO_CODE = 0xFF  # код команды ввода-вывода (коды арифметических команд - номера типов операций)
+
+
+def _to_disk(values: array) -> bytes:
+    """
+    Перевести массив в little-endian представление для записи в файл
+    """
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_disk(typecode: str, data: bytes) -> array:
+    """
+    Прочитать массив из little-endian представления
+    """
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class TraceWriter:
+    """
+    Запись трассы нагрузки: поступления процессов, их размеры памяти и полные программы команд.
+    Задание хранится как заголовок, коды команд (по байту на команду) и значения (int64):
+    два операнда для арифметической команды, длительность для команды ввода-вывода
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Открыть трассу на запись (файл создаётся заново)
+        :param path: путь к файлу трассы
+        """
+        self.path = path
+        self.jobs_written = 0  # число записанных заданий
+        self.file: BinaryIO = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION))
+
+    def write(self, job: Job) -> None:
+        """
+        Записать задание в трассу
+        :param job: задание (с программой команд)
+        """
+        program = job.program
+        codes = bytearray(len(program))
+        values = array("q")
+        for i, kind in enumerate(program.kinds):
+            if kind == KIND_IO:
+                codes[i] = IO_CODE
+                values.append(program.io_durations[i])
+            else:
+                codes[i] = program.op_types[i]
+                values.append(program.operands_1[i])
+                values.append(program.operands_2[i])
+        self.file.write(JOB_HEADER.pack(job.arrival_tick, job.memory_size, job.priority, len(program)))
+        self.file.write(codes)
+        self.file.write(_to_disk(values))
+        self.jobs_written += 1
+
+    def close(self) -> None:
+        """
+        Закрыть файл трассы
+        """
+        if not self.file.closed:
+            self.file.close()
+
+    def __getstate__(self) -> dict:
+        # открытый файл не сохраняется: при восстановлении он открывается заново и обрезается
+        # до размера на момент сохранения (записи, сделанные после сохранения, отбрасываются)
+        state = self.__dict__.copy()
+        file = state.pop("file")
+        if not file.closed:
+            file.flush()  # размер на диске должен совпадать с позицией записи
+        state["file_size"] = None if file.closed else file.tell()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        size = state.pop("file_size")
+        self.__dict__.update(state)
+        self.file = open(self.path, "r+b")
+        if size is None:
+            self.file.close()
+        else:
+            self.file.truncate(size)
+            self.file.seek(size)
+
+
+def read_header(f: BinaryIO) -> None:
+    """
+    Прочитать и проверить заголовок трассы
+    :param f: файл трассы, открытый на чтение в двоичном режиме
+    """
+    head = f.read(HEADER.size)
+    if len(head) < HEADER.size:
+        raise RuntimeError("Файл не является трассой нагрузки")
+    magic, version = HEADER.unpack(head)
+    if magic != MAGIC or version != VERSION:
+        raise RuntimeError("Файл не является трассой нагрузки или имеет неизвестную версию")
+
+
+def read_job(f: BinaryIO) -> Optional[Job]:
+    """
+    Прочитать очередное задание трассы. Оборванная последняя запись (запись трассы прервана до закрытия
+    файла) считается концом трассы
+    :param f: файл трассы (позиция - начало записи задания)
+    :return: задание или None, если задания закончились
+    """
+    head = f.read(JOB_HEADER.size)
+    if len(head) < JOB_HEADER.size:
+        return None
+    arrival_tick, memory_size, priority, commands_cnt = JOB_HEADER.unpack(head)
+    codes = f.read(commands_cnt)
+    if len(codes) < commands_cnt:
+        return None
+    io_cnt = codes.count(IO_CODE)
+    values_size = (2 * (commands_cnt - io_cnt) + io_cnt) * 8
+    data = f.read(values_size)
+    if len(data) < values_size:
+        return None
+    values = _from_disk("q", data)
+
+    kinds, op_types = array("b"), array("b")
+    operands_1, operands_2, io_durations = array("q"), array("q"), array("q")
+    position = 0
+    for code in codes:
+        if code == IO_CODE:
+            kinds.append(KIND_IO)
+            op_types.append(0)
+            operands_1.append(0)
+            operands_2.append(0)
+            io_durations.append(values[position])
+            position += 1
+        else:
+            kinds.append(KIND_ALU)
+            op_types.append(code)
+            operands_1.append(values[position])
+            operands_2.append(values[position + 1])
+            io_durations.append(0)
+            position += 2
+    return Job(arrival_tick, memory_size, priority,
+               CommandProgram(kinds, op_types, operands_1, operands_2, io_durations))
+
+
+def iter_jobs(f: BinaryIO) -> Iterator[Job]:
+    """
+    Потоково прочитать задания трассы (файл не загружается целиком)
+    :param f: файл трассы, открытый на чтение в двоичном режиме
+    :return: итератор по заданиям в порядке записи
+    """
+    read_header(f)
+    while True:
+        job = read_job(f)
+        if job is None:
+            return
+        yield job